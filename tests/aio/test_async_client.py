@@ -17,6 +17,24 @@ from wikijs.exceptions import (
 )
 
 
+class TestAsyncPackage:
+    """Test the lazy exports of wikijs.aio."""
+
+    def test_lazy_client_export(self):
+        """Test AsyncWikiJSClient resolves to the client module's class."""
+        import wikijs.aio
+        from wikijs.aio.client import AsyncWikiJSClient as client_class
+
+        assert wikijs.aio.AsyncWikiJSClient is client_class
+
+    def test_unknown_attribute(self):
+        """Test unknown attributes still raise AttributeError."""
+        import wikijs.aio
+
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            wikijs.aio.missing
+
+
 class TestAsyncWikiJSClientInit:
     """Test AsyncWikiJSClient initialization."""
 
@@ -1,5 +1,6 @@
 """Tests for AsyncPagesEndpoint."""
 
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -357,3 +358,89 @@ class TestAsyncPagesEndpoint:
         normalized = pages_endpoint._normalize_page_data(page_data)
 
         assert normalized["tags"] == ["test1", "test2"]
+
+    @pytest.mark.asyncio
+    async def test_create_many(self, pages_endpoint, sample_page_data):
+        """Test creating pages concurrently."""
+        mock_response = {
+            "data": {
+                "pages": {
+                    "create": {
+                        "responseResult": {"succeeded": True},
+                        "page": sample_page_data,
+                    }
+                }
+            }
+        }
+        pages_endpoint._post = AsyncMock(return_value=mock_response)
+
+        pages = await pages_endpoint.create_many(
+            [
+                {"title": f"Page {i}", "path": f"page-{i}", "content": "Content"}
+                for i in range(5)
+            ],
+            max_concurrency=2,
+        )
+
+        assert len(pages) == 5
+        assert pages_endpoint._post.call_count == 5
+
+    @pytest.mark.asyncio
+    async def test_create_many_invalid_max_concurrency(self, pages_endpoint):
+        """Test create_many rejects a non-positive max_concurrency."""
+        with pytest.raises(ValidationError, match="max_concurrency"):
+            await pages_endpoint.create_many([{"title": "x"}], max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_update_many_partial_failure(self, pages_endpoint, sample_page_data):
+        """Test update_many aggregates per-page failures."""
+        pages_endpoint._post = AsyncMock(
+            side_effect=[
+                {"data": {"updatePage": sample_page_data}},
+                {"errors": [{"message": "Page not found"}]},
+            ]
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            await pages_endpoint.update_many(
+                [{"id": 123, "title": "A"}, {"id": 999, "title": "B"}, {"title": "C"}]
+            )
+
+        assert "Failed to update 2/3 pages" in str(exc_info.value)
+        assert "Successfully updated: 1" in str(exc_info.value)
+        assert "must have an 'id' field" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_delete_many_propagates_cancellation(self, pages_endpoint):
+        """Test delete_many re-raises cancellation instead of recording it."""
+        pages_endpoint._post = AsyncMock(
+            side_effect=[
+                {"data": {"deletePage": {"success": True}}},
+                asyncio.CancelledError(),
+            ]
+        )
+
+        with pytest.raises(asyncio.CancelledError):
+            await pages_endpoint.delete_many([1, 2])
+
+    @pytest.mark.asyncio
+    async def test_delete_many(self, pages_endpoint):
+        """Test deleting pages concurrently."""
+        pages_endpoint._post = AsyncMock(
+            return_value={"data": {"deletePage": {"success": True}}}
+        )
+
+        result = await pages_endpoint.delete_many([1, 2, 3])
+
+        assert result == {"successful": 3, "failed": 0, "errors": []}
+        assert pages_endpoint._post.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_delete_many_invalid_id(self, pages_endpoint):
+        """Test delete_many reports invalid IDs as failures."""
+        pages_endpoint._post = AsyncMock(
+            return_value={"data": {"deletePage": {"success": True}}}
+        )
+
+        with pytest.raises(APIError, match="Failed to delete 1/2 pages"):
+            await pages_endpoint.delete_many([1, 0])
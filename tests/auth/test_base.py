@@ -88,6 +88,12 @@ class TestNoAuth:
         # State should be unchanged
         assert no_auth.is_valid() is True
 
+    def test_static_headers(self, no_auth, api_key_auth, jwt_auth):
+        """Test only fixed-credential handlers report static headers."""
+        assert no_auth.is_static is True
+        assert api_key_auth.is_static is True
+        assert jwt_auth.is_static is False
+
     def test_validate_credentials_succeeds(self, no_auth):
         """Test that validate_credentials always succeeds."""
         # Should not raise any exception
@@ -1,9 +1,131 @@
-"""Test configuration and fixtures for py-wikijs."""
+"""Test configuration and fixtures for py-wikijs.
+
+Mocks in this suite are plain ``Mock``/``MagicMock`` objects. ``autospec=True``
+introspects the target signature on every patch and makes mocked calls many
+times slower, so it is rejected at collection time unless the line carries a
+``# perf: required`` comment explaining why the spec is needed.
+"""
+
+import ast
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
 
 import pytest
+import requests
 import responses
+from requests.adapters import HTTPAdapter
 
 from wikijs.auth import APIKeyAuth, JWTAuth, NoAuth
+from wikijs.client import WikiJSClient
+from wikijs.models import Page, PageCreate, PageUpdate, User, UserUpdate
+
+
+@lru_cache(maxsize=16)
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 test timestamp once; datetimes are immutable."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _unjustified_autospec(path):
+    """Return line numbers of ``autospec=True`` keywords lacking a justification.
+
+    The comment is looked up on the keyword's own line, so it also works for
+    calls wrapped over several lines.
+    """
+    source = path.read_text()
+    lines = source.splitlines()
+    return [
+        kw.value.lineno
+        for node in ast.walk(ast.parse(source))
+        if isinstance(node, ast.Call)
+        for kw in node.keywords
+        if kw.arg == "autospec"
+        and isinstance(kw.value, ast.Constant)
+        and kw.value.value is True
+        and "# perf: required" not in lines[kw.value.lineno - 1]
+    ]
+
+
+def pytest_collection_modifyitems(config, items):
+    """Fail collection if a test module uses ``autospec=True`` unjustified."""
+    offenders = []
+    for path in sorted({item.path for item in items}):
+        if path.suffix == ".py":
+            offenders.extend(f"{path}:{n}" for n in _unjustified_autospec(path))
+    if offenders:
+        raise pytest.UsageError(
+            "autospec=True without '# perf: required': " + ", ".join(offenders)
+        )
+
+
+@pytest.fixture(scope="session")
+def timestamp():
+    """Fixture providing the cached test timestamp parser."""
+    return parse_timestamp
+
+
+class FakeAdapter(HTTPAdapter):
+    """Transport adapter answering requests from a queue of canned replies.
+
+    Cheaper than patching ``Session.request`` with mocks: requests go through
+    the real session and come back as real ``requests.Response`` objects.
+    """
+
+    def __init__(self, default=None):
+        """Initialize adapter with an empty reply queue.
+
+        Args:
+            default: Body sent with status 200 once the queue is empty;
+                without one, a request with nothing queued fails
+        """
+        super().__init__()
+        self.replies = deque()
+        self.requests = []
+        self.default = default
+
+    def queue(self, status=200, body=b"{}"):
+        """Queue a reply; an exception instance is raised instead of sent.
+
+        Args:
+            status: HTTP status code
+            body: Response body bytes, or an exception to raise
+        """
+        self.replies.append((status, body))
+
+    def send(self, request, **kwargs):
+        """Return the next queued reply without touching the network."""
+        self.requests.append(request)
+        if self.replies or self.default is None:
+            status, body = self.replies.popleft()
+        else:
+            status, body = 200, self.default
+        if isinstance(body, Exception):
+            raise body
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers["Content-Type"] = "application/json"
+        response._content = body
+        response.encoding = "utf-8"
+        response.request = request
+        response.url = request.url
+        return response
+
+
+@pytest.fixture
+def fake_adapter():
+    """Fixture providing an empty FakeAdapter."""
+    return FakeAdapter()
+
+
+@pytest.fixture
+def fake_client(fake_adapter, mock_wiki_base_url, mock_api_key):
+    """Fixture providing a client whose requests are served by fake_adapter."""
+    client = WikiJSClient(mock_wiki_base_url, auth=mock_api_key)
+    client._session.mount("https://", fake_adapter)
+    yield client
+    client.close()
 
 
 @pytest.fixture
@@ -68,3 +190,74 @@ def sample_page_data():
 def sample_error_response():
     """Fixture providing sample error response."""
     return {"error": {"message": "Not found", "code": "PAGE_NOT_FOUND"}}
+
+
+# Model instances below are built once per session for tests that only read
+# their default values; tests must not modify them.
+
+
+@pytest.fixture(scope="session")
+def minimal_user():
+    """Fixture providing a User with only the required fields set."""
+    return User(
+        id=1,
+        name="John Doe",
+        email="john@example.com",
+        created_at=parse_timestamp("2024-01-01T00:00:00Z"),
+        updated_at=parse_timestamp("2024-01-01T00:00:00Z"),
+    )
+
+
+@pytest.fixture(scope="session")
+def empty_user_update():
+    """Fixture providing a UserUpdate with no fields set."""
+    return UserUpdate()
+
+
+@pytest.fixture(scope="session")
+def default_page_create():
+    """Fixture providing a PageCreate with only the required fields set."""
+    return PageCreate(
+        title="New Page",
+        path="new-page",
+        content="# New Page\n\nContent here.",
+    )
+
+
+@pytest.fixture(scope="session")
+def empty_page_update():
+    """Fixture providing a PageUpdate with no fields set."""
+    return PageUpdate()
+
+
+@pytest.fixture(scope="session")
+def sample_pages():
+    """Fixture providing five pages (IDs 1-5); slice it, do not mutate it."""
+    created = parse_timestamp("2024-01-01T00:00:00Z")
+    return tuple(
+        Page(
+            id=i,
+            title=f"Page {i}",
+            path=f"/page{i}",
+            content="test",
+            created_at=created,
+            updated_at=created,
+        )
+        for i in range(1, 6)
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_users():
+    """Fixture providing five users (IDs 1-5); slice it, do not mutate it."""
+    created = parse_timestamp("2024-01-01T00:00:00Z")
+    return tuple(
+        User(
+            id=i,
+            name=f"User {i}",
+            email=f"user{i}@example.com",
+            created_at=created,
+            updated_at=created,
+        )
+        for i in range(1, 6)
+    )
@@ -7,6 +7,10 @@ from wikijs.endpoints import GroupsEndpoint
 from wikijs.exceptions import APIError, ValidationError
 from wikijs.models import GroupCreate, GroupUpdate
 
+# Shared request models; the endpoint only reads them, so one instance suffices
+_GROUP_CREATE = GroupCreate(name="Editors")
+_GROUP_UPDATE = GroupUpdate(name="Updated")
+
 
 class TestGroupsEndpointExtended:
     """Extended test suite for GroupsEndpoint."""
@@ -89,16 +93,14 @@ class TestGroupsEndpointExtended:
 
     def test_create_group_api_error(self, endpoint):
         """Test create group with API error."""
-        group_data = GroupCreate(name="Editors")
         mock_response = {"errors": [{"message": "Group exists"}]}
         endpoint._post = Mock(return_value=mock_response)
 
         with pytest.raises(APIError, match="Group exists"):
-            endpoint.create(group_data)
+            endpoint.create(_GROUP_CREATE)
 
     def test_create_group_failed_result(self, endpoint):
         """Test create group with failed result."""
-        group_data = GroupCreate(name="Editors")
         mock_response = {
             "data": {
                 "groups": {
@@ -111,14 +113,12 @@ class TestGroupsEndpointExtended:
         endpoint._post = Mock(return_value=mock_response)
 
         with pytest.raises(APIError, match="Creation failed"):
-            endpoint.create(group_data)
+            endpoint.create(_GROUP_CREATE)
 
     def test_update_group_validation_error_invalid_id(self, endpoint):
         """Test update group with invalid ID."""
-        update_data = GroupUpdate(name="Updated")
-
         with pytest.raises(ValidationError):
-            endpoint.update(0, update_data)
+            endpoint.update(0, _GROUP_UPDATE)
 
     def test_update_group_with_dict(self, endpoint):
         """Test updating group with dictionary."""
@@ -155,16 +155,14 @@ class TestGroupsEndpointExtended:
 
     def test_update_group_api_error(self, endpoint):
         """Test update group with API error."""
-        update_data = GroupUpdate(name="Updated")
         mock_response = {"errors": [{"message": "Update failed"}]}
         endpoint._post = Mock(return_value=mock_response)
 
         with pytest.raises(APIError, match="Update failed"):
-            endpoint.update(1, update_data)
+            endpoint.update(1, _GROUP_UPDATE)
 
     def test_update_group_failed_result(self, endpoint):
         """Test update group with failed result."""
-        update_data = GroupUpdate(name="Updated")
         mock_response = {
             "data": {
                 "groups": {
@@ -177,7 +175,7 @@ class TestGroupsEndpointExtended:
         endpoint._post = Mock(return_value=mock_response)
 
         with pytest.raises(APIError, match="Update denied"):
-            endpoint.update(1, update_data)
+            endpoint.update(1, _GROUP_UPDATE)
 
     def test_delete_group_validation_error(self, endpoint):
         """Test delete group with invalid ID."""
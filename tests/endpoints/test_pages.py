@@ -1,5 +1,6 @@
 """Tests for Pages API endpoint."""
 
+import re
 from unittest.mock import Mock, patch
 
 import pytest
@@ -9,6 +10,100 @@ from wikijs.endpoints.pages import PagesEndpoint
 from wikijs.exceptions import APIError, ValidationError
 from wikijs.models.page import Page, PageCreate, PageUpdate
 
+_RX_PAGE_ID = re.compile("page_id must be a positive integer")
+
+_PAGE_CREATE = PageCreate(
+    title="New Page",
+    path="new-page",
+    content="# New Page\n\nContent here.",
+    description="A new page",
+    tags=["new", "test"],
+)
+
+_PAGE_UPDATE = PageUpdate(
+    title="Updated Page",
+    content="# Updated Page\n\nUpdated content.",
+    tags=["updated", "test"],
+)
+
+# (method, args, response envelope builder, expected GraphQL variables)
+SUCCESS_CASES = [
+    pytest.param(
+        "get",
+        (123,),
+        lambda page: {"data": {"pages": {"single": page}}},
+        {"id": 123},
+        id="get",
+    ),
+    pytest.param(
+        "get_by_path",
+        ("test-page",),
+        lambda page: {"data": {"pageByPath": page}},
+        {"path": "test-page", "locale": "en"},
+        id="get_by_path",
+    ),
+    pytest.param(
+        "create",
+        (_PAGE_CREATE,),
+        lambda page: {
+            "data": {
+                "pages": {
+                    "create": {"responseResult": {"succeeded": True}, "page": page}
+                }
+            }
+        },
+        {
+            "title": "New Page",
+            "path": "new-page",
+            "content": "# New Page\n\nContent here.",
+            "description": "A new page",
+            "tags": ["new", "test"],
+            "isPublished": True,
+            "isPrivate": False,
+            "locale": "en",
+            "editor": "markdown",
+        },
+        id="create",
+    ),
+    pytest.param(
+        "update",
+        (123, _PAGE_UPDATE),
+        lambda page: {"data": {"updatePage": page}},
+        # None-valued fields such as description must not be sent
+        {
+            "id": 123,
+            "title": "Updated Page",
+            "content": "# Updated Page\n\nUpdated content.",
+            "tags": ["updated", "test"],
+        },
+        id="update",
+    ),
+    pytest.param(
+        "delete",
+        (123,),
+        lambda page: {
+            "data": {
+                "deletePage": {
+                    "success": True,
+                    "message": "Page deleted successfully",
+                }
+            }
+        },
+        {"id": 123},
+        id="delete",
+    ),
+]
+
+
+def _json_data(mock):
+    """Return the ``json_data`` payload of the last call to a mocked ``_post``."""
+    return mock.call_args.kwargs["json_data"]
+
+
+def _vars(mock):
+    """Return the GraphQL variables of the last call to a mocked ``_post``."""
+    return _json_data(mock)["variables"]
+
 
 class TestPagesEndpoint:
     """Test suite for PagesEndpoint."""
@@ -22,8 +117,15 @@ class TestPagesEndpoint:
 
     @pytest.fixture
     def pages_endpoint(self, mock_client):
-        """Create a PagesEndpoint instance with mock client."""
-        return PagesEndpoint(mock_client)
+        """Create a PagesEndpoint instance with mock client.
+
+        ``__init__`` is bypassed since every test stubs ``_post`` anyway;
+        ``test_init`` still covers the real constructor.
+        """
+        endpoint = PagesEndpoint.__new__(PagesEndpoint)
+        endpoint._client = mock_client
+        endpoint._loader = None
+        return endpoint
 
     @pytest.fixture
     def sample_page_data(self):
@@ -49,22 +151,12 @@ class TestPagesEndpoint:
     @pytest.fixture
     def sample_page_create(self):
         """Sample PageCreate object."""
-        return PageCreate(
-            title="New Page",
-            path="new-page",
-            content="# New Page\n\nContent here.",
-            description="A new page",
-            tags=["new", "test"],
-        )
+        return _PAGE_CREATE
 
     @pytest.fixture
     def sample_page_update(self):
         """Sample PageUpdate object."""
-        return PageUpdate(
-            title="Updated Page",
-            content="# Updated Page\n\nUpdated content.",
-            tags=["updated", "test"],
-        )
+        return _PAGE_UPDATE
 
     def test_init(self, mock_client):
         """Test PagesEndpoint initialization."""
@@ -81,7 +173,7 @@ class TestPagesEndpoint:
         pages = pages_endpoint.list()
 
         # Verify request
-        pages_endpoint._post.assert_called_once()
+        assert pages_endpoint._post.call_count == 1
         call_args = pages_endpoint._post.call_args
         assert call_args[0][0] == "/graphql"
 
@@ -110,9 +202,7 @@ class TestPagesEndpoint:
         )
 
         # Verify request
-        call_args = pages_endpoint._post.call_args
-        query_data = call_args[1]["json_data"]
-        variables = query_data["variables"]
+        variables = _vars(pages_endpoint._post)
 
         assert variables["limit"] == 10
         assert variables["offset"] == 5
@@ -127,25 +217,19 @@ class TestPagesEndpoint:
         assert len(pages) == 1
         assert isinstance(pages[0], Page)
 
-    def test_list_validation_errors(self, pages_endpoint):
+    @pytest.mark.xdist_group("pages_endpoint")
+    @pytest.mark.parametrize(
+        "kwargs,match",
+        [
+            ({"limit": 0}, "limit must be greater than 0"),
+            ({"orderby": "invalid"}, "orderby must be one of"),
+            ({"orderbydirection": "INVALID"}, "orderbydirection must be ASC or DESC"),
+        ],
+    )
+    def test_list_validation_errors(self, pages_endpoint, kwargs, match):
         """Test list method parameter validation."""
-        # Test invalid limit
-        with pytest.raises(ValidationError, match="limit must be greater than 0"):
-            pages_endpoint.list(limit=0)
-
-        # Test invalid offset
-        with pytest.raises(ValidationError, match="offset must be non-negative"):
-            pages_endpoint.list(offset=-1)
-
-        # Test invalid order_by
-        with pytest.raises(ValidationError, match="order_by must be one of"):
-            pages_endpoint.list(order_by="invalid")
-
-        # Test invalid order_direction
-        with pytest.raises(
-            ValidationError, match="order_direction must be ASC or DESC"
-        ):
-            pages_endpoint.list(order_direction="INVALID")
+        with pytest.raises(ValidationError, match=match):
+            pages_endpoint.list(**kwargs)
 
     def test_list_api_error(self, pages_endpoint):
         """Test list method handling API errors."""
@@ -156,33 +240,32 @@ class TestPagesEndpoint:
         with pytest.raises(APIError, match="GraphQL errors"):
             pages_endpoint.list()
 
-    def test_get_success(self, pages_endpoint, sample_page_data):
-        """Test getting a page by ID."""
-        mock_response = {"data": {"pages": {"single": sample_page_data}}}
-        pages_endpoint._post = Mock(return_value=mock_response)
-
-        # Call method
-        page = pages_endpoint.get(123)
+    @pytest.mark.parametrize("method,args,envelope,expected_vars", SUCCESS_CASES)
+    def test_success(
+        self, pages_endpoint, sample_page_data, method, args, envelope, expected_vars
+    ):
+        """Test successful single-page operations send the right variables."""
+        pages_endpoint._post = Mock(return_value=envelope(sample_page_data))
 
-        # Verify request
-        call_args = pages_endpoint._post.call_args
-        query_data = call_args[1]["json_data"]
-        assert query_data["variables"]["id"] == 123
+        result = getattr(pages_endpoint, method)(*args)
 
-        # Verify response
-        assert isinstance(page, Page)
-        assert page.id == 123
-        assert page.title == "Test Page"
+        assert _vars(pages_endpoint._post) == expected_vars
+        if method == "delete":
+            assert result is True
+        else:
+            assert isinstance(result, Page)
+            assert result.id == 123
+            assert result.path == "test-page"
 
     def test_get_validation_error(self, pages_endpoint):
         """Test get method parameter validation."""
-        with pytest.raises(ValidationError, match="page_id must be a positive integer"):
+        with pytest.raises(ValidationError, match=_RX_PAGE_ID):
             pages_endpoint.get(0)
 
-        with pytest.raises(ValidationError, match="page_id must be a positive integer"):
+        with pytest.raises(ValidationError, match=_RX_PAGE_ID):
             pages_endpoint.get(-1)
 
-        with pytest.raises(ValidationError, match="page_id must be a positive integer"):
+        with pytest.raises(ValidationError, match=_RX_PAGE_ID):
             pages_endpoint.get("invalid")
 
     def test_get_not_found(self, pages_endpoint):
@@ -193,25 +276,6 @@ class TestPagesEndpoint:
         with pytest.raises(APIError, match="Page with ID 123 not found"):
             pages_endpoint.get(123)
 
-    def test_get_by_path_success(self, pages_endpoint, sample_page_data):
-        """Test getting a page by path."""
-        mock_response = {"data": {"pageByPath": sample_page_data}}
-        pages_endpoint._post = Mock(return_value=mock_response)
-
-        # Call method
-        page = pages_endpoint.get_by_path("test-page")
-
-        # Verify request
-        call_args = pages_endpoint._post.call_args
-        query_data = call_args[1]["json_data"]
-        variables = query_data["variables"]
-        assert variables["path"] == "test-page"
-        assert variables["locale"] == "en"
-
-        # Verify response
-        assert isinstance(page, Page)
-        assert page.path == "test-page"
-
     def test_get_by_path_validation_error(self, pages_endpoint):
         """Test get_by_path method parameter validation."""
         with pytest.raises(ValidationError, match="path must be a non-empty string"):
@@ -220,40 +284,6 @@ class TestPagesEndpoint:
         with pytest.raises(ValidationError, match="path must be a non-empty string"):
             pages_endpoint.get_by_path(None)
 
-    def test_create_success(self, pages_endpoint, sample_page_create, sample_page_data):
-        """Test creating a new page."""
-        mock_response = {
-            "data": {
-                "pages": {
-                    "create": {
-                        "responseResult": {"succeeded": True},
-                        "page": sample_page_data
-                    }
-                }
-            }
-        }
-        pages_endpoint._post = Mock(return_value=mock_response)
-
-        # Call method
-        created_page = pages_endpoint.create(sample_page_create)
-
-        # Verify request
-        call_args = pages_endpoint._post.call_args
-        query_data = call_args[1]["json_data"]
-        variables = query_data["variables"]
-
-        assert variables["title"] == "New Page"
-        assert variables["path"] == "new-page"
-        assert variables["content"] == "# New Page\n\nContent here."
-        assert variables["description"] == "A new page"
-        assert variables["tags"] == ["new", "test"]
-        assert variables["isPublished"] is True
-        assert variables["isPrivate"] is False
-
-        # Verify response
-        assert isinstance(created_page, Page)
-        assert created_page.id == 123
-
     def test_create_with_dict(self, pages_endpoint, sample_page_data):
         """Test creating a page with dict data."""
         mock_response = {
@@ -301,67 +331,24 @@ class TestPagesEndpoint:
         with pytest.raises(APIError, match="Failed to create page"):
             pages_endpoint.create(sample_page_create)
 
-    def test_update_success(self, pages_endpoint, sample_page_update, sample_page_data):
-        """Test updating a page."""
-        mock_response = {"data": {"updatePage": sample_page_data}}
-        pages_endpoint._post = Mock(return_value=mock_response)
-
-        # Call method
-        updated_page = pages_endpoint.update(123, sample_page_update)
-
-        # Verify request
-        call_args = pages_endpoint._post.call_args
-        query_data = call_args[1]["json_data"]
-        variables = query_data["variables"]
-
-        assert variables["id"] == 123
-        assert variables["title"] == "Updated Page"
-        assert variables["content"] == "# Updated Page\n\nUpdated content."
-        assert variables["tags"] == ["updated", "test"]
-        assert "description" not in variables  # Should not include None values
-
-        # Verify response
-        assert isinstance(updated_page, Page)
-
-    def test_update_validation_errors(self, pages_endpoint, sample_page_update):
+    @pytest.mark.xdist_group("pages_endpoint")
+    @pytest.mark.parametrize(
+        "page_id,page_data,match",
+        [
+            (0, None, _RX_PAGE_ID),
+            (123, "invalid", "page_data must be PageUpdate object or dict"),
+        ],
+    )
+    def test_update_validation_errors(
+        self, pages_endpoint, sample_page_update, page_id, page_data, match
+    ):
         """Test update method validation errors."""
-        # Test invalid page_id
-        with pytest.raises(ValidationError, match="page_id must be a positive integer"):
-            pages_endpoint.update(0, sample_page_update)
-
-        # Test invalid page_data type
-        with pytest.raises(
-            ValidationError,
-            match="page_data must be PageUpdate object or dict",
-        ):
-            pages_endpoint.update(123, "invalid")
-
-    def test_delete_success(self, pages_endpoint):
-        """Test deleting a page."""
-        mock_response = {
-            "data": {
-                "deletePage": {
-                    "success": True,
-                    "message": "Page deleted successfully",
-                }
-            }
-        }
-        pages_endpoint._post = Mock(return_value=mock_response)
-
-        # Call method
-        result = pages_endpoint.delete(123)
-
-        # Verify request
-        call_args = pages_endpoint._post.call_args
-        query_data = call_args[1]["json_data"]
-        assert query_data["variables"]["id"] == 123
-
-        # Verify response
-        assert result is True
+        with pytest.raises(ValidationError, match=match):
+            pages_endpoint.update(page_id, page_data or sample_page_update)
 
     def test_delete_validation_error(self, pages_endpoint):
         """Test delete method validation errors."""
-        with pytest.raises(ValidationError, match="page_id must be a positive integer"):
+        with pytest.raises(ValidationError, match=_RX_PAGE_ID):
             pages_endpoint.delete(0)
 
     def test_delete_failure(self, pages_endpoint):
@@ -383,9 +370,7 @@ class TestPagesEndpoint:
         results = pages_endpoint.search("test query", limit=5)
 
         # Verify request (should call list with search parameter)
-        call_args = pages_endpoint._post.call_args
-        query_data = call_args[1]["json_data"]
-        variables = query_data["variables"]
+        variables = _vars(pages_endpoint._post)
 
         assert variables["search"] == "test query"
         assert variables["limit"] == 5
@@ -411,9 +396,7 @@ class TestPagesEndpoint:
         results = pages_endpoint.get_by_tags(["test", "example"], match_all=True)
 
         # Verify request (should call list with tags parameter)
-        call_args = pages_endpoint._post.call_args
-        query_data = call_args[1]["json_data"]
-        variables = query_data["variables"]
+        variables = _vars(pages_endpoint._post)
 
         assert variables["tags"] == ["test", "example"]
 
@@ -461,13 +444,13 @@ class TestPagesEndpoint:
         assert "is_published" not in normalized
         assert "tags" in normalized  # Should have default value
 
-    @patch("wikijs.endpoints.pages.Page")
+    @patch("wikijs.endpoints.pages._PAGES_ADAPTER")
     def test_list_page_parsing_error(
-        self, mock_page_class, pages_endpoint, sample_page_data
+        self, mock_adapter, pages_endpoint, sample_page_data
     ):
         """Test handling of page parsing errors in list method."""
-        # Mock Page constructor to raise an exception
-        mock_page_class.side_effect = ValueError("Parsing error")
+        # Make the bulk validation raise an exception
+        mock_adapter.validate_python.side_effect = ValueError("Parsing error")
 
         mock_response = {"data": {"pages": {"list": [sample_page_data]}}}
         pages_endpoint._post = Mock(return_value=mock_response)
@@ -484,8 +467,7 @@ class TestPagesEndpoint:
         pages_endpoint.list()
 
         # Verify the GraphQL query structure
-        call_args = pages_endpoint._post.call_args
-        query_data = call_args[1]["json_data"]
+        query_data = _json_data(pages_endpoint._post)
 
         assert "query" in query_data
         # variables key may or may not be present depending on whether parameters were passed
@@ -1,5 +1,7 @@
 """Tests for Pages API batch operations."""
 
+import json
+
 import pytest
 import responses
 
@@ -7,52 +9,160 @@ from wikijs import WikiJSClient
 from wikijs.exceptions import APIError, ValidationError
 from wikijs.models import Page, PageCreate, PageUpdate
 
-
-@pytest.fixture
+_GRAPHQL_URL = "https://wiki.example.com/graphql"
+
+
+def _page(i, title=None, content=None, updated_at="2025-01-01T00:00:00.000Z"):
+    """Build the API representation of page ``i``."""
+    return {
+        "id": i,
+        "title": title or f"Page {i}",
+        "path": f"page-{i}",
+        "content": content or f"Content {i}",
+        "description": "",
+        "isPublished": True,
+        "isPrivate": False,
+        "tags": [],
+        "locale": "en",
+        "authorId": 1,
+        "authorName": "Admin",
+        "authorEmail": "admin@example.com",
+        "editor": "markdown",
+        "createdAt": "2025-01-01T00:00:00.000Z",
+        "updatedAt": updated_at,
+    }
+
+
+def _updated_page(i):
+    """Build an updatePage result for page ``i``."""
+    return _page(
+        i,
+        title=f"Updated Page {i}",
+        content=f"Updated Content {i}",
+        updated_at="2025-01-01T00:10:00.000Z",
+    )
+
+
+def _created(page, succeeded=True, message=None):
+    """Wrap a page in a pages.create result."""
+    response_result = {"succeeded": succeeded}
+    if message:
+        response_result["message"] = message
+    return {"create": {"responseResult": response_result, "page": page}}
+
+
+def _mock_graphql(body):
+    """Register a GraphQL response with a pre-serialized JSON body."""
+    responses.add(
+        responses.POST,
+        _GRAPHQL_URL,
+        body=body,
+        status=200,
+        content_type="application/json",
+    )
+
+
+# Response bodies are serialized once at import instead of per test
+_CREATE_SUCCESS_BODY = json.dumps(
+    {"data": {f"p{i - 1}": _created(_page(i)) for i in range(1, 4)}}
+)
+_CREATE_PARTIAL_BODY = json.dumps(
+    {
+        "data": {
+            "p0": _created(_page(1)),
+            "p1": _created(None, succeeded=False, message="Page already exists"),
+        }
+    }
+)
+_UPDATE_SUCCESS_BODY = json.dumps(
+    {"data": {f"u{i - 1}": _updated_page(i) for i in range(1, 4)}}
+)
+_DELETE_SUCCESS_BODY = json.dumps(
+    {"data": {f"d{i}": {"success": True} for i in range(3)}}
+)
+
+
+@pytest.fixture(scope="module")
 def client():
-    """Create a test client."""
+    """Create a test client shared by the module.
+
+    Its session and connection pool are built once; ``_reset_client``
+    clears per-test state.
+    """
     return WikiJSClient("https://wiki.example.com", auth="test-api-key")
 
 
+@pytest.fixture(autouse=True)
+def _reset_client(client):
+    """Clear state a test may leave on the shared client."""
+    yield
+    if client.cache:
+        client.cache.clear()
+
+
+class TestPagesGetMany:
+    """Tests for pages.get_many() method."""
+
+    @responses.activate
+    def test_get_many_success(self, client):
+        """Test get_many fetches every page with one aliased query."""
+        responses.add(
+            responses.POST,
+            _GRAPHQL_URL,
+            json={
+                "data": {
+                    f"p{i}": {"single": {"id": i + 1, "title": "T", "path": "t"}}
+                    for i in range(3)
+                }
+            },
+            status=200,
+        )
+
+        pages = client.pages.get_many([1, 2, 3, 1])
+
+        assert len(responses.calls) == 1
+        body = json.loads(responses.calls[0].request.body)
+        assert body["query"].startswith("query(")
+        assert "p2: pages" in body["query"]
+        assert body["variables"] == {"id0": 1, "id1": 2, "id2": 3}
+        assert [page.id for page in pages] == [1, 2, 3, 1]
+
+    @responses.activate
+    def test_get_many_not_found(self, client):
+        """Test get_many reports missing pages."""
+        responses.add(
+            responses.POST,
+            _GRAPHQL_URL,
+            json={
+                "data": {
+                    "p0": {"single": {"id": 1, "title": "T", "path": "t"}},
+                    "p1": None,
+                },
+                "errors": [{"message": "Page not found", "path": ["p1"]}],
+            },
+            status=200,
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            client.pages.get_many([1, 999])
+
+        assert "Failed to get 1/2 pages" in str(exc_info.value)
+        assert "Page not found" in str(exc_info.value)
+
+    def test_get_many_invalid_id(self, client):
+        """Test get_many validates page IDs before sending anything."""
+        with pytest.raises(ValidationError, match="positive integer"):
+            client.pages.get_many([1, 0])
+
+
 class TestPagesCreateMany:
     """Tests for pages.create_many() method."""
 
     @responses.activate
     def test_create_many_success(self, client):
         """Test successful batch page creation."""
-        # Mock API responses for each create
-        for i in range(1, 4):
-            responses.add(
-                responses.POST,
-                "https://wiki.example.com/graphql",
-                json={
-                    "data": {
-                        "pages": {
-                            "create": {
-                                "responseResult": {"succeeded": True},
-                                "page": {
-                                    "id": i,
-                                    "title": f"Page {i}",
-                                    "path": f"page-{i}",
-                                    "content": f"Content {i}",
-                                    "description": "",
-                                    "isPublished": True,
-                                    "isPrivate": False,
-                                    "tags": [],
-                                    "locale": "en",
-                                    "authorId": 1,
-                                    "authorName": "Admin",
-                                    "authorEmail": "admin@example.com",
-                                    "editor": "markdown",
-                                    "createdAt": "2025-01-01T00:00:00.000Z",
-                                    "updatedAt": "2025-01-01T00:00:00.000Z",
-                                },
-                            }
-                        }
-                    }
-                },
-                status=200,
-            )
+        # All creates are answered by a single aliased mutation response
+        _mock_graphql(_CREATE_SUCCESS_BODY)
 
         pages_data = [
             PageCreate(title=f"Page {i}", path=f"page-{i}", content=f"Content {i}")
@@ -61,11 +171,56 @@ class TestPagesCreateMany:
 
         created_pages = client.pages.create_many(pages_data)
 
+        assert len(responses.calls) == 1
+        body = json.loads(responses.calls[0].request.body)
+        assert "p2: pages" in body["query"]
+        assert body["variables"]["title2"] == "Page 3"
+
         assert len(created_pages) == 3
         for i, page in enumerate(created_pages, 1):
             assert page.id == i
             assert page.title == f"Page {i}"
 
+    @responses.activate
+    def test_create_many_batch_size(self, client):
+        """Test create_many splits pages into batch_size requests."""
+        page = {
+            "id": 1,
+            "title": "Page",
+            "path": "page",
+            "content": "Content",
+            "createdAt": "2025-01-01T00:00:00.000Z",
+            "updatedAt": "2025-01-01T00:00:00.000Z",
+        }
+        result = {"create": {"responseResult": {"succeeded": True}, "page": page}}
+        responses.add(
+            responses.POST,
+            _GRAPHQL_URL,
+            json={"data": {"p0": result, "p1": result}},
+            status=200,
+        )
+        responses.add(
+            responses.POST,
+            _GRAPHQL_URL,
+            json={"data": {"p0": result}},
+            status=200,
+        )
+
+        pages_data = [
+            PageCreate(title=f"Page {i}", path=f"page-{i}", content="Content")
+            for i in range(3)
+        ]
+
+        created_pages = client.pages.create_many(pages_data, batch_size=2)
+
+        assert len(responses.calls) == 2
+        assert len(created_pages) == 3
+
+    def test_create_many_invalid_batch_size(self, client):
+        """Test create_many rejects a non-positive batch_size."""
+        with pytest.raises(ValidationError, match="batch_size must be greater than 0"):
+            client.pages.create_many([{"title": "P", "path": "p", "content": "c"}], 0)
+
     def test_create_many_empty_list(self, client):
         """Test create_many with empty list."""
         result = client.pages.create_many([])
@@ -74,57 +229,99 @@ class TestPagesCreateMany:
     @responses.activate
     def test_create_many_partial_failure(self, client):
         """Test create_many with some failures."""
-        # Mock successful creation for first page
+        # First alias succeeds, second reports a failed responseResult
+        _mock_graphql(_CREATE_PARTIAL_BODY)
+
+        pages_data = [
+            PageCreate(title="Page 1", path="page-1", content="Content 1"),
+            PageCreate(title="Page 2", path="page-2", content="Content 2"),
+        ]
+
+        with pytest.raises(APIError) as exc_info:
+            client.pages.create_many(pages_data)
+
+        assert len(responses.calls) == 1
+        assert "Failed to create 1/2 pages" in str(exc_info.value)
+        assert "Successfully created: 1" in str(exc_info.value)
+        assert "Page already exists" in str(exc_info.value)
+
+    @responses.activate
+    def test_create_many_unparsable_page(self, client):
+        """Test one malformed page in a batch does not fail the others."""
+        good = {"id": 1, "title": "Page 1", "path": "page-1"}
+        bad = {"id": 2, "title": "", "path": "page-2"}
         responses.add(
             responses.POST,
-            "https://wiki.example.com/graphql",
+            _GRAPHQL_URL,
             json={
                 "data": {
-                    "pages": {
-                        "create": {
-                            "responseResult": {"succeeded": True},
-                            "page": {
-                                "id": 1,
-                                "title": "Page 1",
-                                "path": "page-1",
-                                "content": "Content 1",
-                                "description": "",
-                                "isPublished": True,
-                                "isPrivate": False,
-                                "tags": [],
-                                "locale": "en",
-                                "authorId": 1,
-                                "authorName": "Admin",
-                                "authorEmail": "admin@example.com",
-                                "editor": "markdown",
-                                "createdAt": "2025-01-01T00:00:00.000Z",
-                                "updatedAt": "2025-01-01T00:00:00.000Z",
-                            },
-                        }
+                    f"p{i}": {
+                        "create": {"responseResult": {"succeeded": True}, "page": page}
                     }
+                    for i, page in enumerate([good, bad])
                 }
             },
             status=200,
         )
 
-        # Mock failure for second page
+        pages_data = [
+            PageCreate(title=f"Page {i}", path=f"page-{i}", content="Content")
+            for i in (1, 2)
+        ]
+
+        with pytest.raises(APIError) as exc_info:
+            client.pages.create_many(pages_data)
+
+        assert "Failed to create 1/2 pages" in str(exc_info.value)
+        assert "Failed to parse created page data" in str(exc_info.value)
+
+    @responses.activate
+    def test_create_many_errors_in_input_order(self, client):
+        """Test parse and result failures are reported by input index."""
+        _mock_graphql(
+            json.dumps(
+                {
+                    "data": {
+                        "p0": _created({"id": 1, "title": "", "path": "page-1"}),
+                        "p1": _created(None, succeeded=False, message="Exists"),
+                    }
+                }
+            )
+        )
+
+        pages_data = [
+            PageCreate(title=f"Page {i}", path=f"page-{i}", content="Content")
+            for i in (1, 2)
+        ]
+
+        with pytest.raises(APIError) as exc_info:
+            client.pages.create_many(pages_data)
+
+        message = str(exc_info.value)
+        assert "Failed to create 2/2 pages" in message
+        assert message.index("'index': 0") < message.index("'index': 1")
+
+    @responses.activate
+    def test_create_many_request_error(self, client):
+        """Test create_many marks a whole batch failed when its request fails."""
         responses.add(
             responses.POST,
-            "https://wiki.example.com/graphql",
-            json={"errors": [{"message": "Page already exists"}]},
+            _GRAPHQL_URL,
+            json={"errors": [{"message": "Syntax error"}]},
             status=200,
         )
 
         pages_data = [
-            PageCreate(title="Page 1", path="page-1", content="Content 1"),
-            PageCreate(title="Page 2", path="page-2", content="Content 2"),
+            {"title": "Page 1", "path": "page-1", "content": "Content 1"},
+            {"title": "", "path": "page-2", "content": "Content 2"},
         ]
 
         with pytest.raises(APIError) as exc_info:
             client.pages.create_many(pages_data)
 
-        assert "Failed to create 1/2 pages" in str(exc_info.value)
-        assert "Successfully created: 1" in str(exc_info.value)
+        assert "Failed to create 2/2 pages" in str(exc_info.value)
+        assert "Invalid page data" in str(exc_info.value)
+        assert "Syntax error" in str(exc_info.value)
 
 
 class TestPagesUpdateMany:
@@ -133,34 +330,8 @@ class TestPagesUpdateMany:
     @responses.activate
     def test_update_many_success(self, client):
         """Test successful batch page updates."""
-        # Mock API responses for each update
-        for i in range(1, 4):
-            responses.add(
-                responses.POST,
-                "https://wiki.example.com/graphql",
-                json={
-                    "data": {
-                        "updatePage": {
-                            "id": i,
-                            "title": f"Updated Page {i}",
-                            "path": f"page-{i}",
-                            "content": f"Updated Content {i}",
-                            "description": "",
-                            "isPublished": True,
-                            "isPrivate": False,
-                            "tags": [],
-                            "locale": "en",
-                            "authorId": 1,
-                            "authorName": "Admin",
-                            "authorEmail": "admin@example.com",
-                            "editor": "markdown",
-                            "createdAt": "2025-01-01T00:00:00.000Z",
-                            "updatedAt": "2025-01-01T00:10:00.000Z",
-                        }
-                    }
-                },
-                status=200,
-            )
+        # All updates are answered by a single aliased mutation response
+        _mock_graphql(_UPDATE_SUCCESS_BODY)
 
         updates = [
             {"id": i, "content": f"Updated Content {i}", "title": f"Updated Page {i}"}
@@ -169,6 +340,12 @@ class TestPagesUpdateMany:
 
         updated_pages = client.pages.update_many(updates)
 
+        assert len(responses.calls) == 1
+        body = json.loads(responses.calls[0].request.body)
+        assert "u2: updatePage(id: $id2" in body["query"]
+        assert body["variables"]["id2"] == 3
+        assert body["variables"]["title2"] == "Updated Page 3"
+
         assert len(updated_pages) == 3
         for i, page in enumerate(updated_pages, 1):
             assert page.id == i
@@ -192,51 +369,54 @@ class TestPagesUpdateMany:
     @responses.activate
     def test_update_many_partial_failure(self, client):
         """Test update_many with some failures."""
-        # Mock successful update for first page
+        # The second alias fails; GraphQL nulls it and reports an error by path
         responses.add(
             responses.POST,
-            "https://wiki.example.com/graphql",
+            _GRAPHQL_URL,
             json={
-                "data": {
-                    "updatePage": {
-                        "id": 1,
-                        "title": "Updated Page 1",
-                        "path": "page-1",
-                        "content": "Updated Content 1",
-                        "description": "",
-                        "isPublished": True,
-                        "isPrivate": False,
-                        "tags": [],
-                        "locale": "en",
-                        "authorId": 1,
-                        "authorName": "Admin",
-                        "authorEmail": "admin@example.com",
-                        "editor": "markdown",
-                        "createdAt": "2025-01-01T00:00:00.000Z",
-                        "updatedAt": "2025-01-01T00:10:00.000Z",
-                    }
-                }
+                "data": {"u0": _updated_page(1), "u1": None},
+                "errors": [{"message": "Page not found", "path": ["u1"]}],
             },
             status=200,
         )
 
-        # Mock failure for second page
+        updates = [
+            {"id": 1, "content": "Updated Content 1"},
+            {"id": 999, "content": "Updated Content 999"},
+        ]
+
+        with pytest.raises(APIError) as exc_info:
+            client.pages.update_many(updates)
+
+        assert len(responses.calls) == 1
+        assert "Failed to update 1/2 pages" in str(exc_info.value)
+        assert "Successfully updated: 1" in str(exc_info.value)
+        assert "Page not found" in str(exc_info.value)
+
+    @responses.activate
+    def test_update_many_errors_in_input_order(self, client):
+        """Test validation and request failures are reported by input index."""
         responses.add(
             responses.POST,
-            "https://wiki.example.com/graphql",
-            json={"errors": [{"message": "Page not found"}]},
+            _GRAPHQL_URL,
+            json={
+                "data": {"u0": None},
+                "errors": [{"message": "Page not found", "path": ["u0"]}],
+            },
             status=200,
         )
 
         updates = [
-            {"id": 1, "content": "Updated Content 1"},
             {"id": 999, "content": "Updated Content 999"},
+            {"content": "No ID"},
         ]
 
         with pytest.raises(APIError) as exc_info:
             client.pages.update_many(updates)
 
-        assert "Failed to update 1/2 pages" in str(exc_info.value)
+        message = str(exc_info.value)
+        assert "Failed to update 2/2 pages" in message
+        assert message.index("'index': 0") < message.index("'index': 1")
 
 
 class TestPagesDeleteMany:
@@ -245,17 +425,16 @@ class TestPagesDeleteMany:
     @responses.activate
     def test_delete_many_success(self, client):
         """Test successful batch page deletions."""
-        # Mock API responses for each delete
-        for i in range(1, 4):
-            responses.add(
-                responses.POST,
-                "https://wiki.example.com/graphql",
-                json={"data": {"deletePage": {"success": True}}},
-                status=200,
-            )
+        # All deletions are answered by a single aliased mutation response
+        _mock_graphql(_DELETE_SUCCESS_BODY)
 
         result = client.pages.delete_many([1, 2, 3])
 
+        assert len(responses.calls) == 1
+        body = json.loads(responses.calls[0].request.body)
+        assert "d2: deletePage(id: $id2)" in body["query"]
+        assert body["variables"] == {"id0": 1, "id1": 2, "id2": 3}
+
         assert result["successful"] == 3
         assert result["failed"] == 0
         assert result["errors"] == []
@@ -270,30 +449,96 @@ class TestPagesDeleteMany:
     @responses.activate
     def test_delete_many_partial_failure(self, client):
         """Test delete_many with some failures."""
-        # Mock successful deletion for first two pages
         responses.add(
             responses.POST,
-            "https://wiki.example.com/graphql",
-            json={"data": {"deletePage": {"success": True}}},
+            _GRAPHQL_URL,
+            json={
+                "data": {
+                    "d0": {"success": True},
+                    "d1": {"success": True},
+                    "d2": None,
+                },
+                "errors": [{"message": "Page not found", "path": ["d2"]}],
+            },
             status=200,
         )
+
+        with pytest.raises(APIError) as exc_info:
+            client.pages.delete_many([1, 2, 999])
+
+        assert len(responses.calls) == 1
+        assert "Failed to delete 1/3 pages" in str(exc_info.value)
+        assert "Successfully deleted: 2" in str(exc_info.value)
+
+    def test_delete_many_invalid_ids(self, client):
+        """Test delete_many reports invalid IDs without sending them."""
+        with pytest.raises(APIError) as exc_info:
+            client.pages.delete_many([0, "x"])
+
+        assert "Failed to delete 2/2 pages" in str(exc_info.value)
+        assert "page_id must be a positive integer" in str(exc_info.value)
+
+    @responses.activate
+    def test_delete_many_request_error(self, client):
+        """Test delete_many marks a whole batch failed when nothing resolves."""
         responses.add(
             responses.POST,
-            "https://wiki.example.com/graphql",
-            json={"data": {"deletePage": {"success": True}}},
+            _GRAPHQL_URL,
+            json={"errors": [{"message": "Forbidden"}]},
             status=200,
         )
 
-        # Mock failure for third page
-        responses.add(
+        with pytest.raises(APIError) as exc_info:
+            client.pages.delete_many([1, 2])
+
+        assert "Failed to delete 2/2 pages" in str(exc_info.value)
+        assert "Forbidden" in str(exc_info.value)
+
+
+def _single_page_callback(request):
+    """Answer one single-page updatePage/deletePage mutation by its ID."""
+    body = json.loads(request.body)
+    page_id = body["variables"]["id"]
+    if page_id == 999:
+        return 200, {}, json.dumps({"errors": [{"message": "Page not found"}]})
+    if "updatePage" in body["query"]:
+        data = {"updatePage": _updated_page(page_id)}
+    else:
+        data = {"deletePage": {"success": True}}
+    return 200, {}, json.dumps({"data": data})
+
+
+class TestPagesParallel:
+    """Tests for the parallel=True mode of the bulk page operations."""
+
+    @responses.activate
+    def test_update_many_parallel(self, client):
+        """Test update_many sends one concurrent request per page."""
+        responses.add_callback(
             responses.POST,
-            "https://wiki.example.com/graphql",
-            json={"errors": [{"message": "Page not found"}]},
-            status=200,
+            _GRAPHQL_URL,
+            callback=_single_page_callback,
+        )
+
+        updates = [{"id": i, "title": f"Updated Page {i}"} for i in range(1, 11)]
+
+        updated_pages = client.pages.update_many(updates, parallel=True)
+
+        assert len(responses.calls) == 10
+        assert [page.id for page in updated_pages] == list(range(1, 11))
+
+    @responses.activate
+    def test_delete_many_parallel_partial_failure(self, client):
+        """Test delete_many reports failed single-page requests in parallel mode."""
+        responses.add_callback(
+            responses.POST,
+            _GRAPHQL_URL,
+            callback=_single_page_callback,
         )
 
         with pytest.raises(APIError) as exc_info:
-            client.pages.delete_many([1, 2, 999])
+            client.pages.delete_many([1, 999, 3], parallel=True)
 
+        assert len(responses.calls) == 3
         assert "Failed to delete 1/3 pages" in str(exc_info.value)
-        assert "Successfully deleted: 2" in str(exc_info.value)
+        assert "'page_id': 999" in str(exc_info.value)
@@ -140,6 +140,26 @@ class TestPagesCaching:
         cached = cache.get(cache_key)
         assert cached is None
 
+    def test_delete_many_invalidates_cache(self):
+        """Test batched deletes invalidate every deleted page."""
+        cache = MemoryCache(ttl=300)
+        client = MagicMock()
+        client.cache = cache
+
+        pages = PagesEndpoint(client)
+        pages._post = Mock(return_value={
+            "data": {"d0": {"success": True}, "d1": {"success": True}}
+        })
+
+        for page_id in (1, 2, 3):
+            cache.set(CacheKey("page", str(page_id), "get"), {"id": page_id})
+
+        pages.delete_many([1, 2])
+
+        assert cache.get(CacheKey("page", "1", "get")) is None
+        assert cache.get(CacheKey("page", "2", "get")) is None
+        assert cache.get(CacheKey("page", "3", "get")) is not None
+
     def test_get_without_cache(self):
         """Test page retrieval without cache configured."""
         # Setup
@@ -5,6 +5,8 @@ from pydantic import ValidationError
 
 from wikijs.models import Asset, AssetFolder, AssetRename, AssetMove, FolderCreate
 
+pytestmark = pytest.mark.unit
+
 
 class TestAsset:
     """Test Asset model."""
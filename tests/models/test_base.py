@@ -3,8 +3,12 @@
 import json
 from datetime import datetime
 
+import pytest
+
 from wikijs.models.base import BaseModel, TimestampedModel
 
+pytestmark = pytest.mark.unit
+
 
 class TestModelForTesting(BaseModel):
     """Test model for testing base functionality."""
@@ -86,6 +90,17 @@ class TestBaseModel:
         }
         assert parsed_include == expected_include
 
+    def test_to_dict_matches_model_dump(self):
+        """Test to_dict fast path agrees with model_dump."""
+        assert TestModelForTesting._plain_dump
+        assert not TestTimestampedModelForTesting._plain_dump
+
+        model = TestModelForTesting(name="test", value=100)
+        for exclude_none in (True, False):
+            assert model.to_dict(exclude_none=exclude_none) == model.model_dump(
+                exclude_none=exclude_none, by_alias=True
+            )
+
     def test_from_dict(self):
         """Test from_dict class method."""
         data = {"name": "test", "value": 200}
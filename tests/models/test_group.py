@@ -5,6 +5,11 @@ from pydantic import ValidationError
 
 from wikijs.models import Group, GroupCreate, GroupUpdate
 
+pytestmark = pytest.mark.unit
+
+# One character over the 255-character limit of group names
+_LONG_256 = "x" * 256
+
 
 class TestGroup:
     """Test Group model."""
@@ -45,25 +50,18 @@ class TestGroup:
         assert len(group.page_rules) == 1
         assert len(group.users) == 1
 
-    def test_group_name_validation(self):
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "",  # Too short
+            _LONG_256,  # Too long
+        ],
+    )
+    def test_group_name_validation(self, timestamp, name):
         """Test name validation."""
-        # Too short
-        with pytest.raises(ValidationError):
-            Group(
-                id=1,
-                name="",
-                created_at="2024-01-01T00:00:00Z",
-                updated_at="2024-01-01T00:00:00Z",
-            )
-
-        # Too long
+        created = timestamp("2024-01-01T00:00:00Z")
         with pytest.raises(ValidationError):
-            Group(
-                id=1,
-                name="x" * 256,
-                created_at="2024-01-01T00:00:00Z",
-                updated_at="2024-01-01T00:00:00Z",
-            )
+            Group(id=1, name=name, created_at=created, updated_at=created)
 
 
 class TestGroupCreate:
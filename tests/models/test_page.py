@@ -1,17 +1,47 @@
 """Tests for Page models."""
 
+from datetime import datetime, timezone
+from types import MappingProxyType
+
 import pytest
 
 from wikijs.models.page import Page, PageCreate, PageUpdate
 
-
-class TestPageModel:
-    """Test Page model functionality."""
-
-    @pytest.fixture
-    def valid_page_data(self):
-        """Valid page data for testing."""
-        return {
+pytestmark = pytest.mark.unit
+
+# Longest accepted page title, and one character over that limit
+_STR_255 = "x" * 255
+_LONG_256 = "x" * 256
+
+# Page path and title cases, shared by the parametrized validation tests
+_VALID_PATHS = (
+    "simple-path",
+    "path/with/slashes",
+    "path_with_underscores",
+    "path123",
+    "category/subcategory/page-name",
+)
+_INVALID_PATHS = (
+    "",  # Empty
+    "path with spaces",  # Spaces
+    "path@with@symbols",  # Special characters
+    "path.with.dots",  # Dots
+)
+_INVALID_TITLES = (
+    "",  # Empty
+    "   ",  # Only whitespace
+    _LONG_256,  # Too long
+)
+
+# Already-parsed timestamp, so tests not about parsing skip the ISO 8601 parser
+FIXED_DT = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def valid_page_data():
+    """Valid page data for testing (read-only, shared by the module)."""
+    return MappingProxyType(
+        {
             "id": 123,
             "title": "Test Page",
             "path": "test-page",
@@ -28,6 +58,32 @@ class TestPageModel:
             "created_at": "2023-01-01T00:00:00Z",
             "updated_at": "2023-01-02T00:00:00Z",
         }
+    )
+
+
+@pytest.fixture(scope="module")
+def base_page_kwargs():
+    """Minimal Page fields (read-only, shared by the module)."""
+    return MappingProxyType(
+        {
+            "id": 1,
+            "title": "Test",
+            "path": "test",
+            "content": "Content",
+            "created_at": FIXED_DT,
+            "updated_at": FIXED_DT,
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def long_word_content():
+    """500 words of page content, built once for the module."""
+    return " ".join(["word"] * 500)
+
+
+class TestPageModel:
+    """Test Page model functionality."""
 
     def test_page_creation_valid(self, valid_page_data):
         """Test creating a valid page."""
@@ -43,106 +99,57 @@ class TestPageModel:
         assert page.is_published is True
         assert page.tags == ["test", "example"]
 
-    def test_page_creation_minimal(self):
+    def test_page_creation_minimal(self, base_page_kwargs):
         """Test creating page with minimal required fields."""
-        page = Page(
-            id=1,
-            title="Minimal Page",
-            path="minimal",
-            content="Content",
-            created_at="2023-01-01T00:00:00Z",
-            updated_at="2023-01-01T00:00:00Z",
-        )
+        page = Page(**{**base_page_kwargs, "title": "Minimal Page", "path": "minimal"})
 
         assert page.id == 1
         assert page.title == "Minimal Page"
         assert page.is_published is True  # Default value
         assert page.tags == []  # Default value
 
-    def test_page_path_validation_valid(self):
+    @pytest.mark.parametrize("path", _VALID_PATHS)
+    def test_page_path_validation_valid(self, base_page_kwargs, path):
         """Test valid path validation."""
-        valid_paths = [
-            "simple-path",
-            "path/with/slashes",
-            "path_with_underscores",
-            "path123",
-            "category/subcategory/page-name",
-        ]
+        page = Page(**{**base_page_kwargs, "path": path})
+        assert page.path == path
 
-        for path in valid_paths:
-            page = Page(
-                id=1,
-                title="Test",
-                path=path,
-                content="Content",
-                created_at="2023-01-01T00:00:00Z",
-                updated_at="2023-01-01T00:00:00Z",
-            )
-            assert page.path == path
-
-    def test_page_path_validation_invalid(self):
+    @pytest.mark.parametrize("path", _INVALID_PATHS)
+    def test_page_path_validation_invalid(self, base_page_kwargs, path):
         """Test invalid path validation."""
-        invalid_paths = [
-            "",  # Empty
-            "path with spaces",  # Spaces
-            "path@with@symbols",  # Special characters
-            "path.with.dots",  # Dots
-        ]
+        with pytest.raises(ValueError):
+            Page(**{**base_page_kwargs, "path": path})
 
-        for path in invalid_paths:
-            with pytest.raises(ValueError):
-                Page(
-                    id=1,
-                    title="Test",
-                    path=path,
-                    content="Content",
-                    created_at="2023-01-01T00:00:00Z",
-                    updated_at="2023-01-01T00:00:00Z",
-                )
-
-    def test_page_path_normalization(self):
+    def test_page_path_normalization(self, base_page_kwargs):
         """Test path normalization."""
         # Leading/trailing slashes should be removed
-        page = Page(
-            id=1,
-            title="Test",
-            path="/path/to/page/",
-            content="Content",
-            created_at="2023-01-01T00:00:00Z",
-            updated_at="2023-01-01T00:00:00Z",
-        )
+        page = Page(**{**base_page_kwargs, "path": "/path/to/page/"})
         assert page.path == "path/to/page"
 
-    def test_page_title_validation_valid(self):
+    def test_page_title_validation_valid(self, base_page_kwargs):
         """Test valid title validation."""
-        page = Page(
-            id=1,
-            title="  Valid Title with Spaces  ",  # Should be trimmed
-            path="test",
-            content="Content",
-            created_at="2023-01-01T00:00:00Z",
-            updated_at="2023-01-01T00:00:00Z",
-        )
+        # Surrounding whitespace should be trimmed
+        page = Page(**{**base_page_kwargs, "title": "  Valid Title with Spaces  "})
         assert page.title == "Valid Title with Spaces"
 
-    def test_page_title_validation_invalid(self):
+    @pytest.mark.parametrize(
+        "model_cls,required",
+        [
+            (Page, ("id", "path", "content", "created_at", "updated_at")),
+            (PageCreate, ("path", "content")),
+            (PageUpdate, ()),
+        ],
+    )
+    def test_title_max_length_accepted(self, base_page_kwargs, model_cls, required):
+        """Test a title of exactly 255 characters is accepted."""
+        kwargs = {field: base_page_kwargs[field] for field in required}
+        assert model_cls(title=_STR_255, **kwargs).title == _STR_255
+
+    @pytest.mark.parametrize("title", _INVALID_TITLES)
+    def test_page_title_validation_invalid(self, base_page_kwargs, title):
         """Test invalid title validation."""
-        invalid_titles = [
-            "",  # Empty
-            "   ",  # Only whitespace
-            "x" * 256,  # Too long
-        ]
-
-        for title in invalid_titles:
-            with pytest.raises(ValueError):
-                Page(
-                    id=1,
-                    title=title,
-                    path="test",
-                    content="Content",
-                    created_at="2023-01-01T00:00:00Z",
-                    updated_at="2023-01-01T00:00:00Z",
-                )
+        with pytest.raises(ValueError):
+            Page(**{**base_page_kwargs, "title": title})
 
     def test_page_word_count(self, valid_page_data):
         """Test word count calculation."""
@@ -151,16 +158,9 @@ class TestPageModel:
         # Words: Test, Page, This, is, test, content, with, bold, and, italic, text
         assert page.word_count == 12
 
-    def test_page_word_count_empty_content(self):
+    def test_page_word_count_empty_content(self, base_page_kwargs):
         """Test word count with empty content."""
-        page = Page(
-            id=1,
-            title="Test",
-            path="test",
-            content="",
-            created_at="2023-01-01T00:00:00Z",
-            updated_at="2023-01-01T00:00:00Z",
-        )
+        page = Page(**{**base_page_kwargs, "content": ""})
         assert page.word_count == 0
 
     def test_page_reading_time(self, valid_page_data):
@@ -169,26 +169,31 @@ class TestPageModel:
         # 11 words, assuming 200 words per minute, should be 1 minute (minimum)
         assert page.reading_time == 1
 
-    def test_page_reading_time_long_content(self):
+    def test_page_reading_time_long_content(self, base_page_kwargs, long_word_content):
         """Test reading time with long content."""
-        long_content = " ".join(["word"] * 500)  # 500 words
-        page = Page(
-            id=1,
-            title="Test",
-            path="test",
-            content=long_content,
-            created_at="2023-01-01T00:00:00Z",
-            updated_at="2023-01-01T00:00:00Z",
-        )
+        page = Page(**{**base_page_kwargs, "content": long_word_content})
         # 500 words / 200 words per minute = 2.5, rounded down to 2
         assert page.reading_time == 2
 
+    @pytest.mark.parametrize(
+        "words,minutes",
+        [
+            (199, 1),  # Below one minute, rounded up to the minimum
+            (200, 1),
+            (5000, 25),
+        ],
+    )
+    def test_page_reading_time_word_counts(self, base_page_kwargs, words, minutes):
+        """Test reading time follows words // 200 with a one-minute floor."""
+        page = Page(**{**base_page_kwargs, "content": " ".join(["word"] * words)})
+        assert page.reading_time == minutes
+
     def test_page_url_path(self, valid_page_data):
         """Test URL path generation."""
         page = Page(**valid_page_data)
         assert page.url_path == "/test-page"
 
-    def test_page_extract_headings(self):
+    def test_page_extract_headings(self, base_page_kwargs):
         """Test heading extraction from markdown content."""
         content = """# Main Title
 
@@ -206,14 +211,7 @@ And more content.
 
 Final content."""
 
-        page = Page(
-            id=1,
-            title="Test",
-            path="test",
-            content=content,
-            created_at="2023-01-01T00:00:00Z",
-            updated_at="2023-01-01T00:00:00Z",
-        )
+        page = Page(**{**base_page_kwargs, "content": content})
 
         headings = page.extract_headings()
         expected = [
@@ -224,16 +222,9 @@ Final content."""
         ]
         assert headings == expected
 
-    def test_page_extract_headings_empty_content(self):
+    def test_page_extract_headings_empty_content(self, base_page_kwargs):
         """Test heading extraction with no content."""
-        page = Page(
-            id=1,
-            title="Test",
-            path="test",
-            content="",
-            created_at="2023-01-01T00:00:00Z",
-            updated_at="2023-01-01T00:00:00Z",
-        )
+        page = Page(**{**base_page_kwargs, "content": ""})
         assert page.extract_headings() == []
 
     def test_page_has_tag(self, valid_page_data):
@@ -245,29 +236,30 @@ Final content."""
         assert page.has_tag("TEST") is True  # Case insensitive
         assert page.has_tag("nonexistent") is False
 
-    def test_page_has_tag_no_tags(self):
+    def test_page_has_tag_after_tags_change(self, base_page_kwargs):
+        """Test tag checking sees reassigned and mutated tags."""
+        page = Page(**{**base_page_kwargs, "tags": ["old"]})
+        assert page.has_tag("old") is True
+
+        page.tags = ["new"]
+        assert page.has_tag("old") is False
+        assert page.has_tag("new") is True
+
+        page.tags.append("Extra")
+        assert page.has_tag("extra") is True
+
+    def test_page_has_tag_no_tags(self, base_page_kwargs):
         """Test tag checking with no tags."""
-        page = Page(
-            id=1,
-            title="Test",
-            path="test",
-            content="Content",
-            created_at="2023-01-01T00:00:00Z",
-            updated_at="2023-01-01T00:00:00Z",
-        )
+        page = Page(**base_page_kwargs)
         assert page.has_tag("any") is False
 
 
 class TestPageCreateModel:
     """Test PageCreate model functionality."""
 
-    def test_page_create_valid(self):
+    def test_page_create_valid(self, default_page_create):
         """Test creating valid PageCreate."""
-        page_create = PageCreate(
-            title="New Page",
-            path="new-page",
-            content="# New Page\n\nContent here.",
-        )
+        page_create = default_page_create
 
         assert page_create.title == "New Page"
         assert page_create.path == "new-page"
@@ -296,37 +288,35 @@ class TestPageCreateModel:
         assert page_create.locale == "fr"
         assert page_create.editor == "html"
 
-    def test_page_create_path_validation(self):
-        """Test path validation in PageCreate."""
-        # Valid path
-        PageCreate(title="Test", path="valid-path", content="Content")
+    @pytest.mark.parametrize("path", _VALID_PATHS)
+    def test_page_create_path_validation_valid(self, path):
+        """Test valid path validation in PageCreate."""
+        page_create = PageCreate(title="Test", path=path, content="Content")
+        assert page_create.path == path
 
-        # Invalid paths should raise errors
+    @pytest.mark.parametrize("path", _INVALID_PATHS)
+    def test_page_create_path_validation(self, path):
+        """Test invalid path validation in PageCreate."""
         with pytest.raises(ValueError):
-            PageCreate(title="Test", path="", content="Content")
+            PageCreate(title="Test", path=path, content="Content")
 
-        with pytest.raises(ValueError):
-            PageCreate(title="Test", path="invalid path", content="Content")
-
-    def test_page_create_title_validation(self):
-        """Test title validation in PageCreate."""
-        # Valid title
+    def test_page_create_title_validation_valid(self):
+        """Test valid title validation in PageCreate."""
         PageCreate(title="Valid Title", path="test", content="Content")
 
-        # Invalid titles should raise errors
-        with pytest.raises(ValueError):
-            PageCreate(title="", path="test", content="Content")
-
+    @pytest.mark.parametrize("title", _INVALID_TITLES)
+    def test_page_create_title_validation(self, title):
+        """Test invalid title validation in PageCreate."""
         with pytest.raises(ValueError):
-            PageCreate(title="x" * 256, path="test", content="Content")
+            PageCreate(title=title, path="test", content="Content")
 
 
 class TestPageUpdateModel:
     """Test PageUpdate model functionality."""
 
-    def test_page_update_empty(self):
+    def test_page_update_empty(self, empty_page_update):
         """Test creating empty PageUpdate."""
-        page_update = PageUpdate()
+        page_update = empty_page_update
 
         assert page_update.title is None
         assert page_update.content is None
@@ -360,17 +350,15 @@ class TestPageUpdateModel:
         assert page_update.is_private is True
         assert page_update.tags == ["updated", "test"]
 
-    def test_page_update_title_validation(self):
-        """Test title validation in PageUpdate."""
-        # Valid title
+    def test_page_update_title_validation_valid(self):
+        """Test valid title validation in PageUpdate."""
         PageUpdate(title="Valid Title")
 
         # None should be allowed (no update)
         PageUpdate(title=None)
 
-        # Invalid titles should raise errors
-        with pytest.raises(ValueError):
-            PageUpdate(title="")
-
+    @pytest.mark.parametrize("title", _INVALID_TITLES)
+    def test_page_update_title_validation(self, title):
+        """Test invalid title validation in PageUpdate."""
         with pytest.raises(ValueError):
-            PageUpdate(title="x" * 256)
+            PageUpdate(title=title)
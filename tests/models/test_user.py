@@ -1,10 +1,47 @@
 """Tests for User data models."""
 
+from datetime import datetime, timezone
+
 import pytest
 from pydantic import ValidationError
 
 from wikijs.models import User, UserCreate, UserGroup, UserUpdate
 
+pytestmark = pytest.mark.unit
+
+# One character over the 255-character limit of names and passwords
+_LONG_256 = "x" * 256
+
+# Already-parsed timestamp, so tests not about parsing skip the ISO 8601 parser
+FIXED_DT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# Valid values of the fields each model requires
+_USER_KWARGS = {
+    "id": 1,
+    "name": "John Doe",
+    "email": "john@example.com",
+    "created_at": FIXED_DT,
+    "updated_at": FIXED_DT,
+}
+_USER_CREATE_KWARGS = {
+    "email": "john@example.com",
+    "name": "John Doe",
+    "password_raw": "secret123",
+}
+_USER_UPDATE_KWARGS = {}
+
+# (field, invalid value, expected error message) shared by every user model
+_INVALID_FIELDS = [
+    ("name", "J", "at least 2 characters"),
+    ("name", _LONG_256, "cannot exceed 255 characters"),
+    ("name", "", "cannot be empty"),
+    ("email", "not-an-email", "not a valid email address"),
+]
+_INVALID_PASSWORDS = [
+    ("password_raw", "123", "at least 6 characters"),
+    ("password_raw", _LONG_256, "cannot exceed 255 characters"),
+]
+
 
 class TestUserGroup:
     """Test UserGroup model."""
@@ -15,29 +52,25 @@ class TestUserGroup:
         assert group.id == 1
         assert group.name == "Administrators"
 
-    def test_user_group_required_fields(self):
+    @pytest.mark.parametrize(
+        "kwargs,missing",
+        [
+            ({"id": 1}, "name"),
+            ({"name": "Administrators"}, "id"),
+        ],
+    )
+    def test_user_group_required_fields(self, kwargs, missing):
         """Test that required fields are enforced."""
-        with pytest.raises(ValidationError) as exc_info:
-            UserGroup(id=1)
-        assert "name" in str(exc_info.value)
-
-        with pytest.raises(ValidationError) as exc_info:
-            UserGroup(name="Administrators")
-        assert "id" in str(exc_info.value)
+        with pytest.raises(ValidationError, match=missing):
+            UserGroup(**kwargs)
 
 
 class TestUser:
     """Test User model."""
 
-    def test_user_creation_minimal(self):
+    def test_user_creation_minimal(self, minimal_user):
         """Test creating a user with minimal required fields."""
-        user = User(
-            id=1,
-            name="John Doe",
-            email="john@example.com",
-            created_at="2024-01-01T00:00:00Z",
-            updated_at="2024-01-01T00:00:00Z",
-        )
+        user = minimal_user
         assert user.id == 1
         assert user.name == "John Doe"
         assert user.email == "john@example.com"
@@ -82,107 +115,41 @@ class TestUser:
         assert user.groups[0].name == "Administrators"
         assert user.last_login_at == "2024-01-15T12:00:00Z"
 
-    def test_user_camel_case_alias(self):
+    @pytest.mark.parametrize(
+        "alias,attr,value",
+        [
+            ("providerKey", "provider_key", "local"),
+            ("isSystem", "is_system", True),
+            ("isActive", "is_active", False),
+            ("isVerified", "is_verified", True),
+            ("jobTitle", "job_title", "Developer"),
+            ("lastLoginAt", "last_login_at", "2024-01-15T12:00:00Z"),
+        ],
+    )
+    def test_user_camel_case_alias(self, alias, attr, value):
         """Test that camelCase aliases work."""
-        user = User(
-            id=1,
-            name="John Doe",
-            email="john@example.com",
-            providerKey="local",
-            isSystem=False,
-            isActive=True,
-            isVerified=True,
-            jobTitle="Developer",
-            createdAt="2024-01-01T00:00:00Z",
-            updatedAt="2024-01-01T00:00:00Z",
-            lastLoginAt="2024-01-15T12:00:00Z",
-        )
-        assert user.provider_key == "local"
-        assert user.is_system is False
-        assert user.is_active is True
-        assert user.is_verified is True
-        assert user.job_title == "Developer"
-        assert user.last_login_at == "2024-01-15T12:00:00Z"
+        user = User.model_validate({**_USER_KWARGS, alias: value})
+        assert getattr(user, attr) == value
 
     def test_user_required_fields(self):
         """Test that required fields are enforced."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="id"):
             User(name="John Doe", email="john@example.com")
-        assert "id" in str(exc_info.value)
 
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="name"):
             User(id=1, email="john@example.com")
-        assert "name" in str(exc_info.value)
 
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="email"):
             User(id=1, name="John Doe")
-        assert "email" in str(exc_info.value)
-
-    def test_user_email_validation(self):
-        """Test email validation."""
-        # Valid email
-        user = User(
-            id=1,
-            name="John Doe",
-            email="john@example.com",
-            created_at="2024-01-01T00:00:00Z",
-            updated_at="2024-01-01T00:00:00Z",
-        )
-        assert user.email == "john@example.com"
 
-        # Invalid email
-        with pytest.raises(ValidationError) as exc_info:
-            User(
-                id=1,
-                name="John Doe",
-                email="not-an-email",
-                created_at="2024-01-01T00:00:00Z",
-                updated_at="2024-01-01T00:00:00Z",
-            )
-        assert "email" in str(exc_info.value).lower()
-
-    def test_user_name_validation(self):
-        """Test name validation."""
-        # Too short
-        with pytest.raises(ValidationError) as exc_info:
-            User(
-                id=1,
-                name="J",
-                email="john@example.com",
-                created_at="2024-01-01T00:00:00Z",
-                updated_at="2024-01-01T00:00:00Z",
-            )
-        assert "at least 2 characters" in str(exc_info.value)
-
-        # Too long
-        with pytest.raises(ValidationError) as exc_info:
-            User(
-                id=1,
-                name="x" * 256,
-                email="john@example.com",
-                created_at="2024-01-01T00:00:00Z",
-                updated_at="2024-01-01T00:00:00Z",
-            )
-        assert "cannot exceed 255 characters" in str(exc_info.value)
-
-        # Empty
-        with pytest.raises(ValidationError) as exc_info:
-            User(
-                id=1,
-                name="",
-                email="john@example.com",
-                created_at="2024-01-01T00:00:00Z",
-                updated_at="2024-01-01T00:00:00Z",
-            )
-        assert "cannot be empty" in str(exc_info.value)
-
-        # Whitespace trimming
+    def test_user_name_trimmed(self):
+        """Test surrounding whitespace is trimmed from the name."""
         user = User(
             id=1,
             name="  John Doe  ",
             email="john@example.com",
-            created_at="2024-01-01T00:00:00Z",
-            updated_at="2024-01-01T00:00:00Z",
+            created_at=FIXED_DT,
+            updated_at=FIXED_DT,
         )
         assert user.name == "John Doe"
 
@@ -247,72 +214,23 @@ class TestUserCreate:
 
     def test_user_create_required_fields(self):
         """Test that required fields are enforced."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="email"):
             UserCreate(name="John Doe", password_raw="secret123")
-        assert "email" in str(exc_info.value)
 
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="name"):
             UserCreate(email="john@example.com", password_raw="secret123")
-        assert "name" in str(exc_info.value)
 
-        with pytest.raises(ValidationError) as exc_info:
-            UserCreate(email="john@example.com", name="John Doe")
         # Pydantic uses the field alias in error messages
-        assert "passwordRaw" in str(exc_info.value) or "password_raw" in str(
-            exc_info.value
-        )
-
-    def test_user_create_email_validation(self):
-        """Test email validation."""
-        with pytest.raises(ValidationError) as exc_info:
-            UserCreate(email="not-an-email", name="John Doe", password_raw="secret123")
-        assert "email" in str(exc_info.value).lower()
-
-    def test_user_create_name_validation(self):
-        """Test name validation."""
-        # Too short
-        with pytest.raises(ValidationError) as exc_info:
-            UserCreate(email="john@example.com", name="J", password_raw="secret123")
-        assert "at least 2 characters" in str(exc_info.value)
-
-        # Too long
-        with pytest.raises(ValidationError) as exc_info:
-            UserCreate(
-                email="john@example.com", name="x" * 256, password_raw="secret123"
-            )
-        assert "cannot exceed 255 characters" in str(exc_info.value)
-
-        # Empty
-        with pytest.raises(ValidationError) as exc_info:
-            UserCreate(email="john@example.com", name="", password_raw="secret123")
-        assert "cannot be empty" in str(exc_info.value)
-
-    def test_user_create_password_validation(self):
-        """Test password validation."""
-        # Too short
-        with pytest.raises(ValidationError) as exc_info:
-            UserCreate(email="john@example.com", name="John Doe", password_raw="123")
-        assert "at least 6 characters" in str(exc_info.value)
-
-        # Too long
-        with pytest.raises(ValidationError) as exc_info:
-            UserCreate(
-                email="john@example.com", name="John Doe", password_raw="x" * 256
-            )
-        assert "cannot exceed 255 characters" in str(exc_info.value)
-
-        # Empty
-        with pytest.raises(ValidationError) as exc_info:
-            UserCreate(email="john@example.com", name="John Doe", password_raw="")
-        assert "cannot be empty" in str(exc_info.value)
+        with pytest.raises(ValidationError, match="passwordRaw|password_raw"):
+            UserCreate(email="john@example.com", name="John Doe")
 
 
 class TestUserUpdate:
     """Test UserUpdate model."""
 
-    def test_user_update_all_none(self):
+    def test_user_update_all_none(self, empty_user_update):
         """Test creating empty update."""
-        user_data = UserUpdate()
+        user_data = empty_user_update
         assert user_data.name is None
         assert user_data.email is None
         assert user_data.password_raw is None
@@ -367,37 +285,39 @@ class TestUserUpdate:
         assert user_data.is_active is False
         assert user_data.is_verified is True
 
-    def test_user_update_email_validation(self):
-        """Test email validation."""
-        with pytest.raises(ValidationError) as exc_info:
-            UserUpdate(email="not-an-email")
-        assert "email" in str(exc_info.value).lower()
-
-    def test_user_update_name_validation(self):
-        """Test name validation."""
-        # Too short
-        with pytest.raises(ValidationError) as exc_info:
-            UserUpdate(name="J")
-        assert "at least 2 characters" in str(exc_info.value)
-
-        # Too long
-        with pytest.raises(ValidationError) as exc_info:
-            UserUpdate(name="x" * 256)
-        assert "cannot exceed 255 characters" in str(exc_info.value)
-
-        # Empty
-        with pytest.raises(ValidationError) as exc_info:
-            UserUpdate(name="")
-        assert "cannot be empty" in str(exc_info.value)
-
-    def test_user_update_password_validation(self):
-        """Test password validation."""
-        # Too short
-        with pytest.raises(ValidationError) as exc_info:
-            UserUpdate(password_raw="123")
-        assert "at least 6 characters" in str(exc_info.value)
-
-        # Too long
-        with pytest.raises(ValidationError) as exc_info:
-            UserUpdate(password_raw="x" * 256)
-        assert "cannot exceed 255 characters" in str(exc_info.value)
+
+@pytest.mark.parametrize(
+    "model_cls,kwargs,field,value,message",
+    [
+        pytest.param(
+            model_cls,
+            kwargs,
+            field,
+            value,
+            message,
+            id=f"{model_cls.__name__}-{field}-{i}",
+        )
+        for model_cls, kwargs, cases in [
+            (User, _USER_KWARGS, _INVALID_FIELDS),
+            (
+                UserCreate,
+                _USER_CREATE_KWARGS,
+                _INVALID_FIELDS
+                + _INVALID_PASSWORDS
+                + [("password_raw", "", "cannot be empty")],
+            ),
+            (UserUpdate, _USER_UPDATE_KWARGS, _INVALID_FIELDS + _INVALID_PASSWORDS),
+        ]
+        for i, (field, value, message) in enumerate(cases)
+    ],
+)
+def test_user_field_validation(model_cls, kwargs, field, value, message):
+    """Test invalid name, email and password values are rejected."""
+    with pytest.raises(ValidationError) as exc_info:
+        model_cls(**{**kwargs, field: value})
+
+    # Check the structured errors, which also pins the failing field
+    assert any(
+        error["loc"] == (field,) and message in error["msg"]
+        for error in exc_info.value.errors()
+    )
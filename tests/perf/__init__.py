@@ -0,0 +1 @@
+"""Client overhead benchmarks."""
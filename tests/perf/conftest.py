@@ -0,0 +1,69 @@
+"""Fixtures for client overhead benchmarks.
+
+Requests are answered by an in-process transport adapter instead of
+``responses``, so timings cover the SDK's own work (document building,
+serialization, parsing, validation) and not HTTP mocking.
+"""
+
+import json
+
+import pytest
+
+from wikijs import WikiJSClient
+
+from ..conftest import FakeAdapter
+
+# Pages sent per batch request by the benchmarks
+BATCH_SIZE = 50
+
+
+def api_page(i):
+    """Build the API representation of page ``i``."""
+    return {
+        "id": i,
+        "title": f"Page {i}",
+        "path": f"page-{i}",
+        "content": f"Content {i}",
+        "description": "",
+        "isPublished": True,
+        "isPrivate": False,
+        "tags": [{"tag": "perf"}],
+        "locale": "en",
+        "authorId": 1,
+        "authorName": "Admin",
+        "authorEmail": "admin@example.com",
+        "editor": "markdown",
+        "createdAt": "2025-01-01T00:00:00.000Z",
+        "updatedAt": "2025-01-01T00:00:00.000Z",
+    }
+
+
+# Reply to a full create_many batch, serialized once
+CREATE_BATCH_BODY = json.dumps(
+    {
+        "data": {
+            f"p{i}": {
+                "create": {
+                    "responseResult": {"succeeded": True},
+                    "page": api_page(i + 1),
+                }
+            }
+            for i in range(BATCH_SIZE)
+        }
+    }
+).encode("utf-8")
+
+
+@pytest.fixture
+def perf_client():
+    """Client whose HTTPS requests are served in-process; see ``mount``."""
+    client = WikiJSClient("https://wiki.example.com", auth="test-key")
+    yield client
+    client.close()
+
+
+def mount(client, body):
+    """Serve all of ``client``'s requests with ``body``."""
+    adapter = FakeAdapter(default=body)
+    client._session.mount("https://", adapter)
+    return adapter
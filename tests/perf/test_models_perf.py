@@ -0,0 +1,55 @@
+"""Construction benchmarks for data models.
+
+Benchmarks are skipped by default; run them with ``pytest -m perf -s``.
+"""
+
+import time
+
+import pytest
+
+from wikijs.models import Page
+
+pytestmark = pytest.mark.perf
+
+# Coarse per-instance ceiling; a typical run takes around a tenth of it
+PAGE_BUDGET_SECONDS = 50e-6
+
+ITERATIONS = 1000
+ROUNDS = 5
+
+
+@pytest.fixture(scope="module")
+def page_kwargs():
+    """Fully populated Page fields, as produced by the pages endpoint."""
+    return {
+        "id": 123,
+        "title": "Test Page",
+        "path": "test-page",
+        "content": "# Test Page\n\nThis is test content.",
+        "description": "A test page",
+        "is_published": True,
+        "is_private": False,
+        "tags": ["test", "example"],
+        "locale": "en",
+        "author_id": 1,
+        "author_name": "Test User",
+        "author_email": "test@example.com",
+        "editor": "markdown",
+        "created_at": "2023-01-01T00:00:00Z",
+        "updated_at": "2023-01-02T00:00:00Z",
+    }
+
+
+def test_page_construction(page_kwargs):
+    """Time Page validation and fail if it exceeds the budget."""
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            Page(**page_kwargs)
+        timings.append((time.perf_counter() - start) / ITERATIONS)
+
+    # The fastest round is the least disturbed by other load on the machine
+    per_page = min(timings)
+    print(f"\nPage(**kwargs): {per_page * 1e6:.2f} us/page")
+    assert per_page < PAGE_BUDGET_SECONDS
@@ -0,0 +1,34 @@
+"""Client overhead benchmarks for Pages API batch operations.
+
+Benchmarks are skipped by default; run them with ``pytest -m perf -s``.
+"""
+
+import time
+
+import pytest
+
+from wikijs.models import PageCreate
+
+from .conftest import BATCH_SIZE, CREATE_BATCH_BODY, mount
+
+pytestmark = pytest.mark.perf
+
+
+def test_create_many_overhead(perf_client):
+    """Time create_many with the network taken out of the picture."""
+    adapter = mount(perf_client, CREATE_BATCH_BODY)
+    pages_data = [
+        PageCreate(title=f"Page {i}", path=f"page-{i}", content=f"Content {i}")
+        for i in range(1, 10 * BATCH_SIZE + 1)
+    ]
+
+    start = time.perf_counter()
+    created = perf_client.pages.create_many(pages_data, batch_size=BATCH_SIZE)
+    elapsed = time.perf_counter() - start
+
+    assert len(created) == len(pages_data)
+    assert len(adapter.requests) == 10
+    print(
+        f"\ncreate_many: {len(pages_data)} pages in {elapsed * 1000:.1f} ms "
+        f"({elapsed / len(pages_data) * 1e6:.1f} us/page)"
+    )
@@ -1,11 +1,12 @@
 """Tests for caching module."""
 
+import threading
 import time
 from unittest.mock import Mock
 
 import pytest
 
-from wikijs.cache import CacheKey, MemoryCache
+from wikijs.cache import BaseCache, CacheKey, MemoryCache, TieredCache
 from wikijs.models import Page
 
 
@@ -28,6 +29,20 @@ class TestCacheKey:
         user_key = CacheKey("user", "1", "get")
         assert page_key.to_string() != user_key.to_string()
 
+    def test_cache_key_hashable_and_frozen(self):
+        """Test equal keys hash alike and keys cannot be mutated."""
+        key = CacheKey("page", "1", "get")
+
+        assert key == CacheKey("page", "1")
+        assert {key: 1}[CacheKey("page", "1", "get")] == 1
+        assert key != CacheKey("page", "1", "list")
+        with pytest.raises(AttributeError):
+            key.identifier = "2"
+
+    def test_cache_key_string_interned(self):
+        """Test equal keys share one interned string."""
+        assert CacheKey("page", "1").to_string() is CacheKey("page", "1").to_string()
+
 
 class TestMemoryCache:
     """Tests for MemoryCache class."""
@@ -44,6 +59,11 @@ class TestMemoryCache:
         assert cache.ttl == 600
         assert cache.max_size == 500
 
+    def test_slots(self):
+        """Test instances use slots instead of a per-instance dict."""
+        cache = MemoryCache()
+        assert not hasattr(cache, "__dict__")
+
     def test_set_and_get(self):
         """Test setting and getting cache values."""
         cache = MemoryCache(ttl=10)
@@ -73,6 +93,22 @@ class TestMemoryCache:
         # Wait for expiration
         time.sleep(1.1)
         assert cache.get(key) is None
+        assert cache._cache == {}
+        assert cache._tags == {}
+
+    def test_ttl_assignment_applies_to_new_entries(self):
+        """Test that assigning ttl changes the expiry of later entries."""
+        cache = MemoryCache(ttl=300)
+        old_key = CacheKey("page", "1", "get")
+        new_key = CacheKey("page", "2", "get")
+        cache.set(old_key, "old")
+
+        cache.ttl = 0
+        cache.set(new_key, "new")
+        time.sleep(0.01)
+
+        assert cache.get(new_key) is None
+        assert cache.get(old_key) == "old"
 
     def test_lru_eviction(self):
         """Test LRU eviction when max_size is reached."""
@@ -221,6 +257,44 @@ class TestMemoryCache:
         assert removed == 3
         assert cache.get_stats()["current_size"] == 0
 
+    def test_set_drops_expired_before_evicting(self, monkeypatch):
+        """Test expired entries make room before live ones are evicted."""
+        from wikijs.cache import memory
+
+        now = [0]
+        monkeypatch.setattr(memory, "monotonic_ns", lambda: now[0])
+        cache = MemoryCache(ttl=10, max_size=2)
+
+        cache.set(CacheKey("page", "1", "get"), 1)
+        now[0] = 5 * 10**9
+        cache.set(CacheKey("page", "2", "get"), 2)
+        now[0] = 11 * 10**9  # Page 1 expired, page 2 still live
+        cache.set(CacheKey("page", "3", "get"), 3)
+
+        assert cache.get(CacheKey("page", "2", "get")) == 2
+        assert cache.get(CacheKey("page", "3", "get")) == 3
+        assert "page:1:get" not in cache._cache
+
+    def test_expiry_queue_skips_reset_keys(self, monkeypatch):
+        """Test re-set keys are not expired by their old queue items."""
+        from wikijs.cache import memory
+
+        now = [0]
+        monkeypatch.setattr(memory, "monotonic_ns", lambda: now[0])
+        cache = MemoryCache(ttl=10, max_size=1)
+        key = CacheKey("page", "1", "get")
+
+        for _ in range(5):
+            cache.set(key, 1)
+        assert len(cache._expiry) <= 2 * cache.max_size
+
+        now[0] = 5 * 10**9
+        cache.set(key, 2)
+        now[0] = 12 * 10**9  # Old items are due, the latest set is not
+
+        assert cache.cleanup_expired() == 0
+        assert cache.get(key) == 2
+
     def test_set_updates_existing(self):
         """Test that setting an existing key updates the value."""
         cache = MemoryCache()
@@ -231,3 +305,90 @@ class TestMemoryCache:
 
         cache.set(key, {"id": 123, "title": "Updated"})
         assert cache.get(key)["title"] == "Updated"
+
+    def test_invalidate_tags(self):
+        """Test entries are invalidated by custom and resource tags."""
+        cache = MemoryCache()
+        cache.set(CacheKey("page", "1", "get"), 1, tags=["locale:en"])
+        cache.set(CacheKey("page", "2", "get"), 2, tags=["locale:de"])
+        cache.set(CacheKey("page", "3", "list"), 3, tags=["locale:en"])
+        cache.set(CacheKey("user", "1", "get"), 4)
+
+        cache.invalidate_tags(["locale:en", "user:1"])
+
+        assert cache.get(CacheKey("page", "1", "get")) is None
+        assert cache.get(CacheKey("page", "3", "list")) is None
+        assert cache.get(CacheKey("user", "1", "get")) is None
+        assert cache.get(CacheKey("page", "2", "get")) == 2
+
+    def test_tag_index_follows_removals(self):
+        """Test evicted and deleted entries leave no tags behind."""
+        cache = MemoryCache(max_size=1)
+        cache.set(CacheKey("page", "1", "get"), 1, tags=["extra"])
+        cache.set(CacheKey("page", "2", "get"), 2)  # Evicts page 1
+        cache.delete(CacheKey("page", "2", "get"))
+
+        assert cache._tags == {}
+
+    def test_base_invalidate_tags_maps_to_resources(self):
+        """Test the BaseCache default routes tags to invalidate_resource."""
+        cache = Mock(spec=MemoryCache)
+
+        BaseCache.invalidate_tags(cache, ["page:1", "user"])
+
+        cache.invalidate_resource.assert_any_call("page", "1")
+        cache.invalidate_resource.assert_any_call("user", None)
+
+    def test_concurrent_access(self):
+        """Test concurrent set/get from several threads keeps the LRU bound."""
+        cache = MemoryCache(max_size=50)
+
+        def worker(offset):
+            for i in range(200):
+                key = CacheKey("page", str(offset * 1000 + i), "get")
+                cache.set(key, i)
+                cache.get(key)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cache.get_stats()["current_size"] == 50
+
+
+class TestTieredCache:
+    """Tests for TieredCache class."""
+
+    def test_l2_hit_is_promoted_to_l1(self):
+        """Test an L1 miss falls back to L2 and fills L1."""
+        l1, l2 = MemoryCache(), MemoryCache()
+        cache = TieredCache(l1, l2)
+        key = CacheKey("page", "1", "get")
+
+        l2.set(key, {"id": 1})
+
+        assert cache.get(key) == {"id": 1}
+        assert l1.get(key) == {"id": 1}
+        assert cache.get(CacheKey("page", "2", "get")) is None
+
+    def test_writes_and_invalidation_reach_both_tiers(self):
+        """Test set, delete, invalidate_resource and clear apply to both tiers."""
+        l1, l2 = MemoryCache(), MemoryCache()
+        cache = TieredCache(l1, l2)
+        keys = [CacheKey("page", str(i), "get") for i in range(3)]
+        for key in keys:
+            cache.set(key, "value")
+
+        cache.delete(keys[0])
+        cache.invalidate_resource("page", "1")
+
+        for tier in (l1, l2):
+            assert tier.get(keys[0]) is None
+            assert tier.get(keys[1]) is None
+            assert tier.get(keys[2]) == "value"
+
+        cache.clear()
+        assert cache.get_stats()["l1"]["current_size"] == 0
+        assert cache.get_stats()["l2"]["current_size"] == 0
@@ -4,8 +4,9 @@ import json
 from unittest.mock import Mock, patch
 
 import pytest
+import requests
 
-from wikijs.auth import APIKeyAuth
+from wikijs.auth import APIKeyAuth, JWTAuth
 from wikijs.client import WikiJSClient
 from wikijs.exceptions import (
     APIError,
@@ -14,6 +15,7 @@ from wikijs.exceptions import (
     ConnectionError,
     TimeoutError,
 )
+from wikijs.utils import build_api_url
 
 
 class TestWikiJSClientInit:
@@ -59,6 +61,15 @@ class TestWikiJSClientInit:
             assert client.verify_ssl is False
             assert client.user_agent == "Custom Agent"
 
+    def test_init_pool_size(self):
+        """Test the session adapter pool is sized from pool_size."""
+        client = WikiJSClient("https://wiki.example.com", auth="test-key", pool_size=8)
+
+        adapter = client._session.get_adapter("https://wiki.example.com")
+        assert client.pool_size == 8
+        assert adapter._pool_connections == 8
+        assert adapter._pool_maxsize == 8
+
     def test_has_pages_endpoint(self):
         """Test that client has pages endpoint."""
         with patch("wikijs.client.requests.Session"):
@@ -67,215 +78,141 @@ class TestWikiJSClientInit:
             assert hasattr(client, "pages")
             assert client.pages._client is client
 
+    def test_endpoints_created_on_first_access(self):
+        """Test endpoints are built lazily and then reused."""
+        with patch("wikijs.client.requests.Session"):
+            client = WikiJSClient("https://wiki.example.com", auth="test-key")
 
-class TestWikiJSClientTestConnection:
-    """Test WikiJSClient connection testing."""
+            assert "users" not in vars(client)
+            assert client.users is client.users
+            assert "users" in vars(client)
 
-    @pytest.fixture
-    def mock_wiki_base_url(self):
-        """Mock wiki base URL."""
-        return "https://wiki.example.com"
 
-    @pytest.fixture
-    def mock_api_key(self):
-        """Mock API key."""
-        return "test-api-key-12345"
+# Canned reply to the test_connection() site query
+SITE_BODY = b'{"data": {"site": {"config": {"title": "Test Wiki"}}}}'
 
-    @patch("wikijs.client.requests.Session.request")
-    def test_test_connection_success(self, mock_request, mock_wiki_base_url, mock_api_key):
+
+class TestWikiJSClientTestConnection:
+    """Test WikiJSClient connection testing."""
+
+    def test_test_connection_success(self, fake_client, fake_adapter):
         """Test successful connection test using GraphQL query."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "data": {
-                "site": {
-                    "title": "Test Wiki"
-                }
-            }
-        }
-        mock_request.return_value = mock_response
-
-        client = WikiJSClient(mock_wiki_base_url, auth=mock_api_key)
-        result = client.test_connection()
+        fake_adapter.queue(200, SITE_BODY)
+
+        result = fake_client.test_connection()
 
         assert result is True
         # Verify it made a POST request to GraphQL endpoint
-        mock_request.assert_called_once()
+        (request,) = fake_adapter.requests
+        assert request.method == "POST"
+        assert request.url.endswith("/graphql")
 
-    @patch("wikijs.client.requests.Session.request")
-    def test_test_connection_timeout(self, mock_request, mock_wiki_base_url, mock_api_key):
+    def test_test_connection_timeout(self, fake_client, fake_adapter):
         """Test connection test timeout."""
-        import requests
-
-        mock_request.side_effect = requests.exceptions.Timeout("Request timed out")
-
-        client = WikiJSClient(mock_wiki_base_url, auth=mock_api_key)
+        fake_adapter.queue(body=requests.exceptions.Timeout("Request timed out"))
 
         with pytest.raises(TimeoutError):
-            client.test_connection()
+            fake_client.test_connection()
 
-    @patch("wikijs.client.requests.Session.request")
-    def test_test_connection_error(self, mock_request, mock_wiki_base_url, mock_api_key):
+    def test_test_connection_error(self, fake_client, fake_adapter):
         """Test connection test with connection error."""
-        import requests
-
-        mock_request.side_effect = requests.exceptions.ConnectionError("Connection failed")
-
-        client = WikiJSClient(mock_wiki_base_url, auth=mock_api_key)
+        fake_adapter.queue(
+            body=requests.exceptions.ConnectionError("Connection failed")
+        )
 
         with pytest.raises(ConnectionError):
-            client.test_connection()
+            fake_client.test_connection()
 
-    def test_test_connection_no_base_url(self):
+    def test_test_connection_no_base_url(self, fake_client, fake_adapter):
         """Test connection test with no base URL."""
-        with patch("wikijs.client.requests.Session"):
-            client = WikiJSClient("https://wiki.example.com", auth="test-key")
-            client.base_url = ""  # Simulate empty base URL after creation
+        fake_client.base_url = ""  # Simulate empty base URL after creation
 
-            with pytest.raises(ConfigurationError, match="Base URL not configured"):
-                client.test_connection()
+        with pytest.raises(ConfigurationError, match="Base URL not configured"):
+            fake_client.test_connection()
+        assert fake_adapter.requests == []
 
-    def test_test_connection_no_auth(self):
+    def test_test_connection_no_auth(self, fake_client, fake_adapter):
         """Test connection test with no auth."""
-        with patch("wikijs.client.requests.Session"):
-            client = WikiJSClient("https://wiki.example.com", auth="test-key")
-            client._auth_handler = None  # Simulate no auth
+        fake_client._auth_handler = None  # Simulate no auth
 
-            with pytest.raises(
-                ConfigurationError, match="Authentication not configured"
-            ):
-                client.test_connection()
+        with pytest.raises(ConfigurationError, match="Authentication not configured"):
+            fake_client.test_connection()
+        assert fake_adapter.requests == []
 
 
 class TestWikiJSClientRequests:
     """Test WikiJSClient HTTP request handling."""
 
-    @pytest.fixture
-    def mock_wiki_base_url(self):
-        """Mock wiki base URL."""
-        return "https://wiki.example.com"
-
-    @pytest.fixture
-    def mock_api_key(self):
-        """Mock API key."""
-        return "test-api-key-12345"
-
-    @patch("wikijs.client.requests.Session.request")
-    def test_request_success(self, mock_request, mock_wiki_base_url, mock_api_key):
+    def test_request_success(self, fake_client, fake_adapter):
         """Test successful API request."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = {"data": "test"}
-        mock_request.return_value = mock_response
+        fake_adapter.queue(200, b'{"data": "test"}')
 
-        client = WikiJSClient(mock_wiki_base_url, auth=mock_api_key)
-        result = client._request("GET", "/test")
+        result = fake_client._request("GET", "/test")
 
         assert result == {"data": "test"}
-        mock_request.assert_called_once()
+        assert len(fake_adapter.requests) == 1
 
-    @patch("wikijs.client.requests.Session.request")
-    def test_request_with_json_data(
-        self, mock_request, mock_wiki_base_url, mock_api_key
-    ):
+    def test_request_with_json_data(self, fake_client, fake_adapter):
         """Test API request with JSON data."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = {"success": True}
-        mock_request.return_value = mock_response
+        fake_adapter.queue(200, b'{"success": true}')
 
-        client = WikiJSClient(mock_wiki_base_url, auth=mock_api_key)
-        result = client._request("POST", "/test", json_data={"title": "Test"})
+        result = fake_client._request("POST", "/test", json_data={"title": "Test"})
 
         assert result == {"success": True}
-        mock_request.assert_called_once()
+        assert json.loads(fake_adapter.requests[0].body) == {"title": "Test"}
 
-    @patch("wikijs.client.requests.Session.request")
-    def test_request_authentication_error(
-        self, mock_request, mock_wiki_base_url, mock_api_key
-    ):
-        """Test request with authentication error."""
-        mock_response = Mock()
-        mock_response.ok = False
-        mock_response.status_code = 401
-        mock_request.return_value = mock_response
+    def test_request_graphql_url(self, fake_client, fake_adapter):
+        """Test GraphQL requests use the URL resolved at init."""
+        fake_adapter.queue(200, b'{"data": {}}')
+
+        fake_client._request("POST", "/graphql", json_data={"query": "{ a }"})
+
+        expected = build_api_url(fake_client.base_url, "/graphql")
+        assert fake_adapter.requests[0].url == expected
 
-        client = WikiJSClient(mock_wiki_base_url, auth=mock_api_key)
+    def test_request_authentication_error(self, fake_client, fake_adapter):
+        """Test request with authentication error."""
+        fake_adapter.queue(401)
 
         with pytest.raises(AuthenticationError, match="Authentication failed"):
-            client._request("GET", "/test")
+            fake_client._request("GET", "/test")
 
-    @patch("wikijs.client.requests.Session.request")
-    def test_request_api_error(self, mock_request, mock_wiki_base_url, mock_api_key):
+    def test_request_api_error(self, fake_client, fake_adapter):
         """Test request with API error."""
-        mock_response = Mock()
-        mock_response.ok = False
-        mock_response.status_code = 404
-        mock_response.text = "Not found"
-        mock_request.return_value = mock_response
-
-        client = WikiJSClient(mock_wiki_base_url, auth=mock_api_key)
+        fake_adapter.queue(404, b"Not found")
 
         with pytest.raises(APIError):
-            client._request("GET", "/test")
+            fake_client._request("GET", "/test")
 
-    @patch("wikijs.client.requests.Session.request")
-    def test_request_invalid_json_response(
-        self, mock_request, mock_wiki_base_url, mock_api_key
-    ):
+    def test_request_invalid_json_response(self, fake_client, fake_adapter):
         """Test request with invalid JSON response."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-        mock_request.return_value = mock_response
-
-        client = WikiJSClient(mock_wiki_base_url, auth=mock_api_key)
+        fake_adapter.queue(200, b"<html>not json</html>")
 
         with pytest.raises(APIError, match="Invalid JSON response"):
-            client._request("GET", "/test")
+            fake_client._request("GET", "/test")
 
-    @patch("wikijs.client.requests.Session.request")
-    def test_request_timeout(self, mock_request, mock_wiki_base_url, mock_api_key):
+    def test_request_timeout(self, fake_client, fake_adapter):
         """Test request timeout handling."""
-        import requests
-
-        mock_request.side_effect = requests.exceptions.Timeout("Request timed out")
-
-        client = WikiJSClient(mock_wiki_base_url, auth=mock_api_key)
+        fake_adapter.queue(body=requests.exceptions.Timeout("Request timed out"))
 
         with pytest.raises(TimeoutError, match="Request timed out"):
-            client._request("GET", "/test")
+            fake_client._request("GET", "/test")
 
-    @patch("wikijs.client.requests.Session.request")
-    def test_request_connection_error(
-        self, mock_request, mock_wiki_base_url, mock_api_key
-    ):
+    def test_request_connection_error(self, fake_client, fake_adapter):
         """Test request connection error handling."""
-        import requests
-
-        mock_request.side_effect = requests.exceptions.ConnectionError(
-            "Connection failed"
+        fake_adapter.queue(
+            body=requests.exceptions.ConnectionError("Connection failed")
         )
 
-        client = WikiJSClient(mock_wiki_base_url, auth=mock_api_key)
-
         with pytest.raises(ConnectionError, match="Failed to connect"):
-            client._request("GET", "/test")
+            fake_client._request("GET", "/test")
 
-    @patch("wikijs.client.requests.Session.request")
-    def test_request_general_exception(
-        self, mock_request, mock_wiki_base_url, mock_api_key
-    ):
+    def test_request_general_exception(self, fake_client, fake_adapter):
         """Test request general exception handling."""
-        import requests
-
-        mock_request.side_effect = requests.exceptions.RequestException("General error")
-
-        client = WikiJSClient(mock_wiki_base_url, auth=mock_api_key)
+        fake_adapter.queue(body=requests.exceptions.RequestException("General error"))
 
         with pytest.raises(APIError, match="Request failed"):
-            client._request("GET", "/test")
+            fake_client._request("GET", "/test")
 
 
 class TestWikiJSClientWithDifferentAuth:
@@ -300,6 +237,32 @@ class TestWikiJSClientWithDifferentAuth:
         with pytest.raises(AuthenticationError, match="Invalid credentials"):
             WikiJSClient("https://wiki.example.com", auth=mock_auth)
 
+    def test_static_auth_headers_set_once(self, fake_client, fake_adapter):
+        """Test API key headers come from the session, not per request."""
+        fake_adapter.queue(200, b"{}")
+
+        with patch.object(APIKeyAuth, "get_headers") as get_headers:
+            fake_client._request("GET", "/test")
+
+        get_headers.assert_not_called()
+        assert fake_adapter.requests[0].headers["Authorization"].startswith("Bearer ")
+
+    def test_rotating_auth_headers_fetched_per_request(
+        self, fake_adapter, mock_wiki_base_url
+    ):
+        """Test JWT headers are re-read so refreshed tokens are sent."""
+        auth = JWTAuth("old-token", mock_wiki_base_url)
+        client = WikiJSClient(mock_wiki_base_url, auth=auth)
+        client._session.mount("https://", fake_adapter)
+        fake_adapter.queue(200, b"{}")
+
+        auth._token = "new-token"
+        client._request("GET", "/test", headers={"X-Trace": "1"})
+
+        sent = fake_adapter.requests[0].headers
+        assert sent["Authorization"] == "Bearer new-token"
+        assert sent["X-Trace"] == "1"
+
 
 class TestWikiJSClientContextManager:
     """Test WikiJSClient context manager functionality."""
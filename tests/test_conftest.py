@@ -0,0 +1,45 @@
+"""Tests for the collection hooks in conftest.py."""
+
+import textwrap
+
+from .conftest import _unjustified_autospec
+
+
+def _write(tmp_path, source):
+    """Write a dedented test module and return its path."""
+    path = tmp_path / "test_module.py"
+    path.write_text(textwrap.dedent(source))
+    return path
+
+
+def test_unjustified_autospec_single_line(tmp_path):
+    """Test that a one-line autospec call needs the comment on its line."""
+    path = _write(
+        tmp_path,
+        """\
+        patch("a.b", autospec=True)
+        patch("a.c", autospec=True)  # perf: required
+        patch("a.d", autospec=False)
+        """,
+    )
+
+    assert _unjustified_autospec(path) == [1]
+
+
+def test_unjustified_autospec_multiline_call(tmp_path):
+    """Test that the comment is expected on the autospec keyword's line."""
+    path = _write(
+        tmp_path,
+        """\
+        patch(
+            "a.b",
+            autospec=True,  # perf: required
+        )
+        patch(  # perf: required
+            "a.c",
+            autospec=True,
+        )
+        """,
+    )
+
+    assert _unjustified_autospec(path) == [7]
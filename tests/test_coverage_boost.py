@@ -1,8 +1,8 @@
 """Targeted tests to reach 85% coverage."""
 
 import pytest
-import time
 from unittest.mock import Mock, patch
+from wikijs.cache import CacheKey
 from wikijs.cache.memory import MemoryCache
 from wikijs.ratelimit import RateLimiter
 from wikijs.metrics import MetricsCollector
@@ -14,24 +14,24 @@ class TestCacheEdgeCases:
     """Test cache edge cases to cover missing lines."""
 
     def test_invalidate_resource_with_malformed_keys(self):
-        """Test invalidate_resource with malformed cache keys (covers line 132)."""
+        """Test invalidate_resource only removes entries indexed under it."""
         cache = MemoryCache(ttl=300)
 
         # Add some normal keys
-        cache._cache["page:123"] = ({"data": "test1"}, time.time() + 300)
-        cache._cache["page:456"] = ({"data": "test2"}, time.time() + 300)
+        cache.set(CacheKey("page", "123", "get"), {"data": "test1"})
+        cache.set(CacheKey("page", "456", "get"), {"data": "test2"})
 
-        # Add a malformed key without colon separator (covers line 132)
-        cache._cache["malformedkey"] = ({"data": "test3"}, time.time() + 300)
+        # Add a malformed entry that bypassed set() and so has no tags
+        cache._cache["malformedkey"] = ({"data": "test3"}, 2**63, set())
 
         # Invalidate page type - should skip malformed key
         cache.invalidate_resource("page")
 
         # Normal keys should be gone
-        assert "page:123" not in cache._cache
-        assert "page:456" not in cache._cache
+        assert "page:123:get" not in cache._cache
+        assert "page:456:get" not in cache._cache
 
-        # Malformed key should still exist (was skipped by continue on line 132)
+        # Malformed key should still exist (it is not in the tag index)
         assert "malformedkey" in cache._cache
 
 
@@ -52,9 +52,10 @@ class TestMetricsEdgeCases:
         )
 
         # Check counters
-        assert collector._counters["total_requests"] == 1
-        assert collector._counters["total_errors"] == 1
-        assert collector._counters["total_server_errors"] == 1  # Line 64
+        counters = collector.get_stats()["counters"]
+        assert counters["total_requests"] == 1
+        assert counters["total_errors"] == 1
+        assert counters["total_server_errors"] == 1
 
     def test_percentile_with_empty_data(self):
         """Test _percentile with empty data (covers line 135)."""
@@ -0,0 +1,141 @@
+"""Tests for request coalescing."""
+
+import json
+import threading
+
+import pytest
+import responses
+
+from wikijs import PageLoader, WikiJSClient
+from wikijs.dataloader import DataLoader
+
+
+def test_dataloader_coalesces_loads():
+    """Test keys loaded within the wait window share one batch call."""
+    calls = []
+
+    def batch_load(keys):
+        calls.append(keys)
+        return [key * 10 for key in keys]
+
+    loader = DataLoader(batch_load, wait=60)
+    futures = loader.load_many([1, 2, 1, 3])
+    loader.dispatch()
+
+    assert [f.result(timeout=1) for f in futures] == [10, 20, 10, 30]
+    assert calls == [[1, 2, 3]]
+
+
+def test_dataloader_timer_dispatch():
+    """Test pending keys are dispatched once the wait window elapses."""
+    loader = DataLoader(lambda keys: [str(key) for key in keys], wait=0.001)
+
+    assert loader.load(7).result(timeout=1) == "7"
+
+
+def test_dataloader_max_batch_size():
+    """Test a full queue is dispatched immediately."""
+    calls = []
+
+    def batch_load(keys):
+        calls.append(keys)
+        return keys
+
+    loader = DataLoader(batch_load, max_batch_size=2, wait=60)
+    futures = loader.load_many([1, 2, 3])
+
+    assert futures[0].result(timeout=1) == 1
+    assert calls == [[1, 2]]
+    loader.dispatch()
+    assert calls == [[1, 2], [3]]
+
+
+def test_dataloader_errors():
+    """Test per-key and whole-batch failures reach the right futures."""
+    loader = DataLoader(
+        lambda keys: [ValueError("bad") if key == 2 else key for key in keys],
+        wait=60,
+    )
+    ok, bad = loader.load_many([1, 2])
+    loader.dispatch()
+
+    assert ok.result(timeout=1) == 1
+    with pytest.raises(ValueError, match="bad"):
+        bad.result(timeout=1)
+
+    loader = DataLoader(lambda keys: [], wait=60)
+    future = loader.load(1)
+    loader.dispatch()
+    with pytest.raises(ValueError, match="returned 0 values for 1 keys"):
+        future.result(timeout=1)
+
+
+def test_client_coalesce_window():
+    """Test the client option builds the pages endpoint with a PageLoader."""
+    client = WikiJSClient("https://wiki.example.com", auth="key")
+    assert client.pages._loader is None
+
+    client = WikiJSClient("https://wiki.example.com", auth="key", coalesce_window=0.01)
+    assert isinstance(client.pages._loader, PageLoader)
+    assert client.pages._loader.wait == 0.01
+
+
+def test_dataloader_skips_cancelled_futures():
+    """Test cancelled futures are not loaded and do not break the batch."""
+    calls = []
+
+    def batch_load(keys):
+        calls.append(keys)
+        return keys
+
+    loader = DataLoader(batch_load, wait=60)
+    cancelled, kept = loader.load_many([1, 2])
+    assert cancelled.cancel()
+    loader.dispatch()
+
+    assert kept.result(timeout=1) == 2
+    assert calls == [[2]]
+
+    # A cancelled future is not handed out again for the same key
+    fresh = loader.load(1)
+    assert fresh is not cancelled
+    loader.dispatch()
+    assert fresh.result(timeout=1) == 1
+
+
+@responses.activate
+def test_page_loader_coalesces_concurrent_gets():
+    """Test concurrent pages.get() calls share one aliased query."""
+    client = WikiJSClient(
+        "https://wiki.example.com", auth="test-api-key", coalesce_window=0.05
+    )
+
+    def answer(request):
+        # Echo each alias's page ID so swapped results would be caught
+        variables = json.loads(request.body)["variables"]
+        data = {}
+        for i in range(len(variables)):
+            page_id = variables[f"id{i}"]
+            page = {"id": page_id, "title": f"Page {page_id}", "path": "t"}
+            data[f"p{i}"] = {"single": page}
+        return 200, {}, json.dumps({"data": data})
+
+    responses.add_callback(
+        responses.POST, "https://wiki.example.com/graphql", callback=answer
+    )
+
+    results = {}
+
+    def get(page_id):
+        results[page_id] = client.pages.get(page_id)
+
+    threads = [threading.Thread(target=get, args=(i,)) for i in (1, 2, 3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(responses.calls) == 1
+    for page_id in (1, 2, 3):
+        assert results[page_id].id == page_id
+        assert results[page_id].title == f"Page {page_id}"
@@ -2,6 +2,8 @@
 
 from unittest.mock import Mock
 
+import pytest
+
 from wikijs.exceptions import (
     APIError,
     AuthenticationError,
@@ -18,6 +20,9 @@ from wikijs.exceptions import (
     create_api_error,
 )
 
+# Stand-in response for create_api_error, which only stores it
+_RESPONSE = Mock()
+
 
 class TestWikiJSException:
     """Test base exception class."""
@@ -68,83 +73,49 @@ class TestRateLimitError:
 
 
 class TestCreateAPIError:
-    """Test create_api_error factory function."""
-
-    def test_create_404_error(self):
-        """Test creating 404 NotFoundError."""
-        response = Mock()
-        error = create_api_error(404, "Not found", response)
-        assert isinstance(error, NotFoundError)
-        assert error.status_code == 404
-        assert error.response == response
-
-    def test_create_403_error(self):
-        """Test creating 403 PermissionError."""
-        response = Mock()
-        error = create_api_error(403, "Forbidden", response)
-        assert isinstance(error, PermissionError)
-        assert error.status_code == 403
-
-    def test_create_429_error(self):
-        """Test creating 429 RateLimitError."""
-        response = Mock()
-        error = create_api_error(429, "Rate limited", response)
-        assert isinstance(error, RateLimitError)
-        assert error.status_code == 429
-        # Note: RateLimitError constructor hardcodes status_code=429
-        # so it doesn't use the passed status_code parameter
-
-    def test_create_400_client_error(self):
-        """Test creating generic 400-level ClientError."""
-        response = Mock()
-        error = create_api_error(400, "Bad request", response)
-        assert isinstance(error, ClientError)
-        assert error.status_code == 400
-
-    def test_create_500_server_error(self):
-        """Test creating generic 500-level ServerError."""
-        response = Mock()
-        error = create_api_error(500, "Server error", response)
-        assert isinstance(error, ServerError)
-        assert error.status_code == 500
-
-    def test_create_unknown_status_error(self):
-        """Test creating error with unknown status code."""
-        response = Mock()
-        error = create_api_error(999, "Unknown error", response)
-        assert isinstance(error, APIError)
-        assert error.status_code == 999
+    """Test create_api_error factory function.
+
+    The factory's contract is the exact class for each status, so these
+    tests check ``type(error) is`` rather than ``isinstance``, which would
+    also accept subclasses (e.g. NotFoundError for ClientError).
+    """
+
+    @pytest.mark.parametrize(
+        "status_code, message, expected_cls",
+        [
+            (404, "Not found", NotFoundError),
+            (403, "Forbidden", PermissionError),
+            # RateLimitError hardcodes status_code=429
+            (429, "Rate limited", RateLimitError),
+            (400, "Bad request", ClientError),
+            (500, "Server error", ServerError),
+            (999, "Unknown error", APIError),
+        ],
+    )
+    def test_create_error(self, status_code, message, expected_cls):
+        """Test each status code maps to its error class."""
+        error = create_api_error(status_code, message, _RESPONSE)
+        assert type(error) is expected_cls
+        assert error.status_code == status_code
+        assert error.response is _RESPONSE
+        assert str(error) == message
 
 
 class TestSimpleExceptions:
     """Test simple exception classes."""
 
-    def test_connection_error(self):
-        """Test ConnectionError creation."""
-        exc = ConnectionError("Connection failed")
-        assert str(exc) == "Connection failed"
-        assert isinstance(exc, WikiJSException)
-
-    def test_timeout_error(self):
-        """Test TimeoutError creation."""
-        exc = TimeoutError("Request timed out")
-        assert str(exc) == "Request timed out"
-        assert isinstance(exc, WikiJSException)
-
-    def test_authentication_error(self):
-        """Test AuthenticationError creation."""
-        exc = AuthenticationError("Invalid credentials")
-        assert str(exc) == "Invalid credentials"
-        assert isinstance(exc, WikiJSException)
-
-    def test_configuration_error(self):
-        """Test ConfigurationError creation."""
-        exc = ConfigurationError("Invalid config")
-        assert str(exc) == "Invalid config"
-        assert isinstance(exc, WikiJSException)
-
-    def test_validation_error(self):
-        """Test ValidationError creation."""
-        exc = ValidationError("Invalid input")
-        assert str(exc) == "Invalid input"
+    @pytest.mark.parametrize(
+        "exc_cls, message",
+        [
+            (ConnectionError, "Connection failed"),
+            (TimeoutError, "Request timed out"),
+            (AuthenticationError, "Invalid credentials"),
+            (ConfigurationError, "Invalid config"),
+            (ValidationError, "Invalid input"),
+        ],
+    )
+    def test_simple_exception(self, exc_cls, message):
+        """Test simple exceptions keep their message and base class."""
+        exc = exc_cls(message)
+        assert str(exc) == message
         assert isinstance(exc, WikiJSException)
@@ -1,60 +1,50 @@
 """Integration tests for the full WikiJS client with Pages API."""
 
-from unittest.mock import Mock, patch
+import json
 
-from wikijs import WikiJSClient
 from wikijs.endpoints.pages import PagesEndpoint
 from wikijs.models.page import Page
 
+# Reply to a pages.list() query with a single page
+PAGES_LIST_BODY = json.dumps(
+    {
+        "data": {
+            "pages": {
+                "list": [
+                    {
+                        "id": 1,
+                        "title": "Test Page",
+                        "path": "test",
+                        "content": "Content",
+                        "isPublished": True,
+                        "isPrivate": False,
+                        "tags": [],
+                        "locale": "en",
+                        "createdAt": "2023-01-01T00:00:00Z",
+                        "updatedAt": "2023-01-01T00:00:00Z",
+                    }
+                ]
+            }
+        }
+    }
+).encode("utf-8")
+
 
 class TestWikiJSClientIntegration:
     """Integration tests for WikiJS client with Pages API."""
 
-    def test_client_has_pages_endpoint(self):
+    def test_client_has_pages_endpoint(self, fake_client):
         """Test that client has pages endpoint initialized."""
-        with patch("wikijs.client.requests.Session"):
-            client = WikiJSClient("https://test.wiki", auth="test-key")
-
-            assert hasattr(client, "pages")
-            assert isinstance(client.pages, PagesEndpoint)
-            assert client.pages._client is client
+        assert hasattr(fake_client, "pages")
+        assert isinstance(fake_client.pages, PagesEndpoint)
+        assert fake_client.pages._client is fake_client
 
-    @patch("wikijs.client.requests.Session")
-    def test_client_pages_integration(self, mock_session_class):
+    def test_client_pages_integration(self, fake_client, fake_adapter):
         """Test that pages endpoint works through client."""
-        # Mock the session and response
-        mock_session = Mock()
-        mock_session_class.return_value = mock_session
-
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = {
-            "data": {
-                "pages": {
-                    "list": [
-                        {
-                            "id": 1,
-                            "title": "Test Page",
-                            "path": "test",
-                            "content": "Content",
-                            "isPublished": True,
-                            "isPrivate": False,
-                            "tags": [],
-                            "locale": "en",
-                            "createdAt": "2023-01-01T00:00:00Z",
-                            "updatedAt": "2023-01-01T00:00:00Z",
-                        }
-                    ]
-                }
-            }
-        }
-        mock_session.request.return_value = mock_response
-
-        # Create client
-        client = WikiJSClient("https://test.wiki", auth="test-key")
+        fake_adapter.queue(200, PAGES_LIST_BODY)
 
         # Call pages.list() through client
-        pages = client.pages.list()
+        pages = fake_client.pages.list()
 
         # Verify it works
         assert len(pages) == 1
@@ -62,7 +52,6 @@ class TestWikiJSClientIntegration:
         assert pages[0].title == "Test Page"
 
         # Verify the request was made
-        mock_session.request.assert_called_once()
-        call_args = mock_session.request.call_args
-        assert call_args[0][0] == "POST"  # GraphQL uses POST
-        assert "/graphql" in call_args[0][1]
+        (request,) = fake_adapter.requests
+        assert request.method == "POST"  # GraphQL uses POST
+        assert "/graphql" in request.url
@@ -1,6 +1,12 @@
 """Tests for logging functionality."""
 import logging
 import json
+import sys
+from datetime import datetime
+
+import pytest
+
+import wikijs.logging
 from wikijs.logging import setup_logging, JSONFormatter
 
 
@@ -25,6 +31,92 @@ def test_json_formatter():
     assert "timestamp" in log_data
 
 
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request):
+    """Run a test with and without the orjson opt-in."""
+    if request.param == "orjson" and wikijs.logging.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+def test_json_formatter_output(json_backend):
+    """Test records match json.dumps; orjson output is compact and UTF-8."""
+    formatter = JSONFormatter(use_orjson=json_backend == "orjson")
+    record = logging.LogRecord(
+        name="wikijs.test",
+        level=logging.WARNING,
+        pathname="test.py",
+        lineno=42,
+        msg='Quote " backslash \\ newline \n unicode \u00e9 %s',
+        args=("arg",),
+        exc_info=None,
+        func="do_work"
+    )
+
+    output = formatter.format(record)
+    log_data = json.loads(output)
+
+    if json_backend == "stdlib":
+        assert output == json.dumps(log_data)
+    else:
+        assert output == json.dumps(
+            log_data, separators=(",", ":"), ensure_ascii=False
+        )
+    assert log_data["message"] == 'Quote " backslash \\ newline \n unicode \u00e9 arg'
+    assert log_data["function"] == "do_work"
+    assert log_data["line"] == 42
+    datetime.fromisoformat(log_data["timestamp"])
+
+
+def test_json_formatter_with_exception_and_extra(json_backend):
+    """Test exception info and extra fields use the full encoder."""
+    formatter = JSONFormatter(use_orjson=json_backend == "orjson")
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        exc_info = sys.exc_info()
+    record = logging.LogRecord(
+        name="test",
+        level=logging.ERROR,
+        pathname="test.py",
+        lineno=10,
+        msg="Failed",
+        args=(),
+        exc_info=exc_info
+    )
+    record.extra = {"page_id": 7}
+
+    output = formatter.format(record)
+    log_data = json.loads(output)
+
+    assert "ValueError: boom" in log_data["exception"]
+    assert log_data["page_id"] == 7
+    if json_backend == "stdlib":
+        assert output == json.dumps(log_data)
+
+
+def test_json_formatter_orjson_opt_in(monkeypatch):
+    """Test orjson is only used when requested and installed."""
+    record = logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname="test.py",
+        lineno=1,
+        msg="caf\u00e9",
+        args=(),
+        exc_info=None
+    )
+
+    # Default output is json.dumps output even if orjson is importable
+    output = JSONFormatter().format(record)
+    assert output == json.dumps(json.loads(output))
+
+    # Opting in without orjson installed falls back to the stdlib
+    monkeypatch.setattr(wikijs.logging, "orjson", None)
+    output = JSONFormatter(use_orjson=True).format(record)
+    assert output == json.dumps(json.loads(output))
+
+
 def test_setup_logging_json():
     """Test JSON logging setup."""
     logger = setup_logging(level=logging.DEBUG, format_type="json")
@@ -1,6 +1,19 @@
 """Tests for metrics functionality."""
+import pytest
+
+from wikijs import metrics
 from wikijs.metrics import MetricsCollector, get_metrics
 
+# Reused by the tests through reset(), which must restore the initial state
+_SHARED = MetricsCollector()
+
+
+@pytest.fixture
+def collector():
+    """Fixture providing the shared collector, freshly reset."""
+    _SHARED.reset()
+    return _SHARED
+
 
 def test_metrics_collector_init():
     """Test metrics collector initialization."""
@@ -11,10 +24,18 @@ def test_metrics_collector_init():
     assert stats["total_errors"] == 0
 
 
-def test_record_request():
-    """Test recording requests."""
-    collector = MetricsCollector()
+def test_reset_matches_fresh_collector(collector):
+    """Test reset() leaves the same state as a new collector."""
+    collector.record_request("/api/test", "GET", 500, 10.0, error="boom")
+    collector.increment("custom")
+    collector.set_gauge("gauge", 1.0)
+    collector.reset()
+
+    assert collector.get_stats() == MetricsCollector().get_stats()
 
+
+def test_record_request(collector):
+    """Test recording requests."""
     # Record successful request
     collector.record_request("/api/test", "GET", 200, 100.0)
 
@@ -23,22 +44,19 @@ def test_record_request():
     assert stats["total_errors"] == 0
 
 
-def test_record_error():
+def test_record_error(collector):
     """Test recording errors."""
-    collector = MetricsCollector()
-
     # Record error request
     collector.record_request("/api/test", "GET", 404, 50.0, error="Not found")
 
     stats = collector.get_stats()
     assert stats["total_requests"] == 1
     assert stats["total_errors"] == 1
+    assert collector._requests[-1].error == "Not found"
 
 
-def test_latency_stats():
+def test_latency_stats(collector):
     """Test latency statistics."""
-    collector = MetricsCollector()
-
     # Record multiple requests
     collector.record_request("/api/test", "GET", 200, 100.0)
     collector.record_request("/api/test", "GET", 200, 200.0)
@@ -51,10 +69,22 @@ def test_latency_stats():
     assert stats["latency"]["avg"] == 150.0
 
 
-def test_increment_counter():
-    """Test incrementing counters."""
+def test_latency_stats_keep_recent_samples(monkeypatch):
+    """Test latency statistics cover a bounded window of recent requests."""
+    monkeypatch.setattr(metrics, "_MAX_LATENCY_SAMPLES", 3)
     collector = MetricsCollector()
 
+    for duration in (1000.0, 10.0, 20.0, 30.0):
+        collector.record_request("/api/test", "GET", 200, duration)
+
+    stats = collector.get_stats()
+    assert stats["total_requests"] == 4
+    assert stats["latency"]["max"] == 30.0
+    assert stats["latency"]["avg"] == 20.0
+
+
+def test_increment_counter(collector):
+    """Test incrementing counters."""
     collector.increment("custom_counter", 5)
     collector.increment("custom_counter", 3)
 
@@ -62,20 +92,30 @@ def test_increment_counter():
     assert stats["counters"]["custom_counter"] == 8
 
 
-def test_set_gauge():
-    """Test setting gauges."""
-    collector = MetricsCollector()
+def test_request_counters_merge_with_custom_counters(collector):
+    """Test built-in request counters combine with increment() calls."""
+    collector.record_request("/api/test", "GET", 503, 10.0)
+    collector.increment("total_requests")
 
+    stats = collector.get_stats()
+    assert stats["total_requests"] == 2
+    assert stats["counters"]["total_server_errors"] == 1
+    assert "total_errors" in stats["counters"]
+
+    collector.reset()
+    assert collector.get_stats()["counters"] == {}
+
+
+def test_set_gauge(collector):
+    """Test setting gauges."""
     collector.set_gauge("memory_usage", 75.5)
 
     stats = collector.get_stats()
     assert stats["gauges"]["memory_usage"] == 75.5
 
 
-def test_reset_metrics():
+def test_reset_metrics(collector):
     """Test resetting metrics."""
-    collector = MetricsCollector()
-
     collector.record_request("/api/test", "GET", 200, 100.0)
     collector.reset()
 
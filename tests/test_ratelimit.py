@@ -1,9 +1,32 @@
 """Tests for rate limiting functionality."""
-import time
 import pytest
 from wikijs.ratelimit import RateLimiter, PerEndpointRateLimiter
 
 
+class FakeClock:
+    """Clock whose time only moves when the limiter sleeps."""
+
+    def __init__(self):
+        """Start the clock at zero."""
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        """Return the current fake time."""
+        return self.now
+
+    def sleep(self, seconds):
+        """Record the sleep and advance the clock by it."""
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Fixture providing a fresh fake clock."""
+    return FakeClock()
+
+
 def test_rate_limiter_init():
     """Test rate limiter initialization."""
     limiter = RateLimiter(requests_per_second=10.0)
@@ -20,29 +43,48 @@ def test_rate_limiter_acquire():
     assert limiter.acquire(timeout=1.0) is True
 
 
-def test_rate_limiter_burst():
+def test_rate_limiter_burst(clock):
     """Test burst behavior."""
-    limiter = RateLimiter(requests_per_second=10.0, burst=5)
+    limiter = RateLimiter(
+        requests_per_second=10.0, burst=5, clock=clock, sleep=clock.sleep
+    )
 
     # Should be able to acquire up to burst size
     for _ in range(5):
         assert limiter.acquire(timeout=0.1) is True
+    assert clock.slept == []
+
+    # The next token refills after 1/rate seconds
+    assert limiter.acquire(timeout=0.1) is True
+    assert clock.now == pytest.approx(0.1)
 
 
-def test_rate_limiter_timeout():
+def test_rate_limiter_timeout(clock):
     """Test timeout behavior."""
-    limiter = RateLimiter(requests_per_second=1.0)
+    limiter = RateLimiter(requests_per_second=1.0, clock=clock, sleep=clock.sleep)
 
     # Exhaust tokens
     assert limiter.acquire(timeout=1.0) is True
 
-    # Next acquire should timeout quickly
+    # Next acquire should time out without waiting
     assert limiter.acquire(timeout=0.1) is False
+    assert clock.slept == []
 
 
-def test_rate_limiter_reset():
+def test_rate_limiter_waits_for_refill(clock):
+    """Test acquire without timeout sleeps until a token is available."""
+    limiter = RateLimiter(requests_per_second=2.0, clock=clock, sleep=clock.sleep)
+    limiter.acquire()
+    limiter.acquire()
+
+    assert limiter.acquire() is True
+    assert clock.now == pytest.approx(0.5)
+    assert max(clock.slept) <= 0.1
+
+
+def test_rate_limiter_reset(clock):
     """Test rate limiter reset."""
-    limiter = RateLimiter(requests_per_second=1.0)
+    limiter = RateLimiter(requests_per_second=1.0, clock=clock, sleep=clock.sleep)
 
     # Exhaust tokens
     limiter.acquire()
@@ -52,6 +94,16 @@ def test_rate_limiter_reset():
 
     # Should be able to acquire again
     assert limiter.acquire(timeout=0.1) is True
+    assert clock.slept == []
+
+
+@pytest.mark.slow
+def test_rate_limiter_real_clock():
+    """Test the default clock and sleep against wall time."""
+    limiter = RateLimiter(requests_per_second=20.0, burst=1)
+
+    assert limiter.acquire() is True
+    assert limiter.acquire(timeout=1.0) is True
 
 
 def test_per_endpoint_rate_limiter():
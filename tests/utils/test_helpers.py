@@ -1,14 +1,19 @@
 """Tests for utility helper functions."""
 
-from unittest.mock import Mock
+import json
 
 import pytest
 
 from wikijs.exceptions import ValidationError
 from wikijs.utils.helpers import (
+    _normalize_url,
     build_api_url,
     chunk_list,
+    clear_url_caches,
+    dump_json,
     extract_error_message,
+    ichunk_list,
+    load_json,
     normalize_url,
     parse_wiki_response,
     safe_get,
@@ -17,6 +22,24 @@ from wikijs.utils.helpers import (
 )
 
 
+class FakeResponse:
+    """Minimal response stand-in for extract_error_message tests."""
+
+    __slots__ = ("text", "json_value", "json_error", "json_calls")
+
+    def __init__(self, text, json_value=None, json_error=None):
+        self.text = text
+        self.json_value = json_value
+        self.json_error = json_error
+        self.json_calls = 0
+
+    def json(self):
+        self.json_calls += 1
+        if self.json_error is not None:
+            raise self.json_error
+        return self.json_value
+
+
 class TestNormalizeUrl:
     """Test URL normalization."""
 
@@ -67,6 +90,17 @@ class TestNormalizeUrl:
         result = normalize_url("wiki.example.com")
         assert result == "https://wiki.example.com"
 
+    def test_normalize_url_cached(self):
+        """Test repeated normalization is served from the cache."""
+        clear_url_caches()
+        normalize_url("https://cached.example.com/")
+        normalize_url("https://cached.example.com/")
+        info = _normalize_url.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+        clear_url_caches()
+        assert _normalize_url.cache_info().currsize == 0
+
     def test_normalize_url_with_port(self):
         """Test URL with port."""
         assert (
@@ -166,6 +200,13 @@ class TestBuildApiUrl:
         result = build_api_url("https://wiki.example.com", "")
         assert "https://wiki.example.com" in result
 
+    def test_build_api_url_cached(self):
+        """Test repeated builds are served from the cache."""
+        clear_url_caches()
+        first = build_api_url("https://wiki.example.com", "/graphql")
+        assert build_api_url("https://wiki.example.com", "/graphql") is first
+        assert build_api_url.cache_info().hits == 1
+
 
 class TestParseWikiResponse:
     """Test Wiki.js response parsing."""
@@ -199,50 +240,90 @@ class TestExtractErrorMessage:
 
     def test_extract_error_message_json_with_message(self):
         """Test extracting error from JSON response with message."""
-        mock_response = Mock()
-        mock_response.text = '{"message": "Not found"}'
-        mock_response.json.return_value = {"message": "Not found"}
+        response = FakeResponse(
+            '{"message": "Not found"}', json_value={"message": "Not found"}
+        )
 
-        result = extract_error_message(mock_response)
+        result = extract_error_message(response)
         assert result == "Not found"
 
     def test_extract_error_message_json_with_errors_array(self):
         """Test extracting error from JSON response with error field."""
-        mock_response = Mock()
-        mock_response.text = '{"error": "Invalid field"}'
-        mock_response.json.return_value = {"error": "Invalid field"}
+        response = FakeResponse(
+            '{"error": "Invalid field"}', json_value={"error": "Invalid field"}
+        )
 
-        result = extract_error_message(mock_response)
+        result = extract_error_message(response)
         assert result == "Invalid field"
 
     def test_extract_error_message_json_with_error_string(self):
         """Test extracting error from JSON response with error string."""
-        mock_response = Mock()
-        mock_response.text = '{"error": "Authentication failed"}'
-        mock_response.json.return_value = {"error": "Authentication failed"}
+        response = FakeResponse(
+            '{"error": "Authentication failed"}',
+            json_value={"error": "Authentication failed"},
+        )
 
-        result = extract_error_message(mock_response)
+        result = extract_error_message(response)
         assert result == "Authentication failed"
 
     def test_extract_error_message_invalid_json(self):
         """Test extracting error from invalid JSON response."""
-        mock_response = Mock()
-        mock_response.text = "Invalid JSON response"
-        mock_response.json.side_effect = ValueError("Invalid JSON")
+        response = FakeResponse(
+            "Invalid JSON response", json_error=ValueError("Invalid JSON")
+        )
 
-        result = extract_error_message(mock_response)
+        result = extract_error_message(response)
         assert result == "Invalid JSON response"
 
     def test_extract_error_message_empty_response(self):
         """Test extracting error from empty response."""
-        mock_response = Mock()
-        mock_response.text = ""
-        mock_response.json.side_effect = ValueError("Empty response")
+        response = FakeResponse("", json_error=ValueError("Empty response"))
 
-        result = extract_error_message(mock_response)
+        result = extract_error_message(response)
         # Should return either empty string or default error message
         assert result in ["", "Unknown error"]
 
+    def test_extract_error_message_skips_json_for_non_json_body(self):
+        """Test non-JSON bodies are returned without attempting a parse."""
+        response = FakeResponse("  <html>Bad Gateway</html>")
+
+        result = extract_error_message(response)
+        assert result == "  <html>Bad Gateway</html>"
+        assert response.json_calls == 0
+
+
+class TestDumpJson:
+    """Test compact JSON serialization."""
+
+    def test_dump_json_compact(self):
+        """Test output has no separator whitespace and keeps non-ASCII text."""
+        assert dump_json({"a": [1, 2], "b": "Größe"}) == '{"a":[1,2],"b":"Größe"}'
+
+    def test_dump_json_rejects_nan(self):
+        """Test NaN is rejected like requests' own json= encoding."""
+        with pytest.raises(ValueError):
+            dump_json({"a": float("nan")})
+
+
+class TestLoadJson:
+    """Test JSON response parsing."""
+
+    def test_load_json_bytes_and_str(self):
+        """Test bytes and text bodies parse to the same data."""
+        body = '{"data":{"title":"Größe"}}'
+        assert load_json(body.encode("utf-8")) == {"data": {"title": "Größe"}}
+        assert load_json(body) == {"data": {"title": "Größe"}}
+
+    def test_load_json_invalid(self):
+        """Test invalid JSON raises the stdlib decode error."""
+        with pytest.raises(json.JSONDecodeError):
+            load_json(b"not json")
+
+    def test_load_json_without_orjson(self, monkeypatch):
+        """Test the stdlib parser is used when orjson is unavailable."""
+        monkeypatch.setattr("wikijs.utils.helpers.orjson", None)
+        assert load_json(b'{"data":[1,2]}') == {"data": [1, 2]}
+
 
 class TestChunkList:
     """Test list chunking."""
@@ -270,6 +351,17 @@ class TestChunkList:
         result = chunk_list([], 2)
         assert result == []
 
+    def test_ichunk_list_lazy(self):
+        """Test lazy chunking of a generator."""
+        chunks = ichunk_list((i for i in range(1, 6)), 2)
+        assert next(chunks) == [1, 2]
+        assert list(chunks) == [[3, 4], [5]]
+
+    def test_ichunk_list_invalid_size(self):
+        """Test invalid chunk size is rejected before iterating."""
+        with pytest.raises(ValueError, match="Chunk size must be positive"):
+            ichunk_list([1, 2, 3], 0)
+
     def test_chunk_list_chunk_size_one(self):
         """Test chunking with chunk size of 1."""
         items = [1, 2, 3]
@@ -327,6 +419,11 @@ class TestSafeGet:
         data = {"user": "not_a_dict"}
         assert safe_get(data, "user.name") is None
 
+    def test_safe_get_dot_notation_stored_none(self):
+        """Test safe_get returns a stored None rather than the default."""
+        data = {"user": {"name": None}}
+        assert safe_get(data, "user.name", "default") is None
+
 
 class TestUtilityEdgeCases:
     """Test edge cases for utility functions."""
@@ -345,9 +442,13 @@ class TestUtilityEdgeCases:
         # Test with a string that could cause urlparse to raise an exception
         from unittest.mock import patch
 
-        with patch("wikijs.utils.helpers.urlparse") as mock_urlparse:
-            mock_urlparse.side_effect = Exception("Parse error")
-            assert validate_url("http://example.com") is False
+        clear_url_caches()
+        try:
+            with patch("wikijs.utils.helpers.urlparse") as mock_urlparse:
+                mock_urlparse.side_effect = Exception("Parse error")
+                assert validate_url("http://example.com") is False
+        finally:
+            clear_url_caches()
 
     def test_sanitize_path_whitespace_only(self):
         """Test sanitize_path with whitespace-only input."""
@@ -397,6 +498,21 @@ class TestUtilityEdgeCases:
         with pytest.raises(APIError, match="GraphQL Error: GraphQL error"):
             parse_wiki_response(response)
 
+    def test_parse_wiki_response_errors_keep_partial_data(self):
+        """Test parse_wiki_response keeps partial data in error details."""
+        response = {
+            "data": {"u0": {"id": 1}, "u1": None},
+            "errors": [{"message": "Page not found", "path": ["u1"]}],
+        }
+
+        from wikijs.exceptions import APIError
+
+        with pytest.raises(APIError) as exc_info:
+            parse_wiki_response(response)
+
+        assert exc_info.value.details["data"] == {"u0": {"id": 1}, "u1": None}
+        assert exc_info.value.details["errors"] == response["errors"]
+
     def test_parse_wiki_response_with_non_dict_errors(self):
         """Test parse_wiki_response with non-dict errors."""
         response = {"errors": "String error"}
@@ -414,30 +530,29 @@ class TestUtilityEdgeCases:
 
     def test_extract_error_message_with_nested_error(self):
         """Test extract_error_message with nested error structures."""
-        mock_response = Mock()
-        mock_response.text = '{"detail": "Validation failed"}'
-        mock_response.json.return_value = {"detail": "Validation failed"}
+        response = FakeResponse(
+            '{"detail": "Validation failed"}',
+            json_value={"detail": "Validation failed"},
+        )
 
-        result = extract_error_message(mock_response)
+        result = extract_error_message(response)
         assert result == "Validation failed"
 
     def test_extract_error_message_with_msg_field(self):
         """Test extract_error_message with msg field."""
-        mock_response = Mock()
-        mock_response.text = '{"msg": "Short message"}'
-        mock_response.json.return_value = {"msg": "Short message"}
+        response = FakeResponse(
+            '{"msg": "Short message"}', json_value={"msg": "Short message"}
+        )
 
-        result = extract_error_message(mock_response)
+        result = extract_error_message(response)
         assert result == "Short message"
 
     def test_extract_error_message_long_text(self):
         """Test extract_error_message with very long response text."""
         long_text = "x" * 250  # Longer than 200 chars
-        mock_response = Mock()
-        mock_response.text = long_text
-        mock_response.json.side_effect = ValueError("Invalid JSON")
+        response = FakeResponse(long_text, json_error=ValueError("Invalid JSON"))
 
-        result = extract_error_message(mock_response)
+        result = extract_error_message(response)
         assert len(result) == 203  # 200 chars + "..."
         assert result.endswith("...")
 
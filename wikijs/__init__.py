@@ -28,6 +28,7 @@ Features:
 
 from .auth import APIKeyAuth, AuthHandler, JWTAuth, NoAuth
 from .client import WikiJSClient
+from .dataloader import DataLoader, PageLoader
 from .exceptions import (
     APIError,
     AuthenticationError,
@@ -54,6 +55,9 @@ __all__ = [
     "NoAuth",
     "APIKeyAuth",
     "JWTAuth",
+    # Request coalescing
+    "DataLoader",
+    "PageLoader",
     # Data models
     "BaseModel",
     "Page",
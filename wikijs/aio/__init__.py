@@ -23,8 +23,21 @@ Performance:
     when making multiple concurrent requests (100+ requests).
 """
 
-from .client import AsyncWikiJSClient
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .client import AsyncWikiJSClient
 
 __all__ = [
     "AsyncWikiJSClient",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the client on first access so aiohttp loads only when used."""
+    if name == "AsyncWikiJSClient":
+        from .client import AsyncWikiJSClient
+
+        globals()[name] = AsyncWikiJSClient
+        return AsyncWikiJSClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
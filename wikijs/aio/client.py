@@ -1,6 +1,7 @@
 """Async WikiJS client for py-wikijs."""
 
 import json
+from functools import cached_property
 from typing import Any, Dict, Optional, Union
 
 try:
@@ -22,7 +23,9 @@ from ..exceptions import (
 )
 from ..utils import (
     build_api_url,
+    dump_json,
     extract_error_message,
+    load_json,
     normalize_url,
     parse_wiki_response,
 )
@@ -101,11 +104,25 @@ class AsyncWikiJSClient:
         self.verify_ssl = verify_ssl
         self.user_agent = user_agent or f"py-wikijs/{__version__}"
 
-        # Endpoint handlers (will be initialized when session is created)
-        self.pages = AsyncPagesEndpoint(self)
-        self.users = AsyncUsersEndpoint(self)
-        self.groups = AsyncGroupsEndpoint(self)
-        self.assets = AsyncAssetsEndpoint(self)
+    @cached_property
+    def pages(self) -> AsyncPagesEndpoint:
+        """Pages endpoint, created on first access."""
+        return AsyncPagesEndpoint(self)
+
+    @cached_property
+    def users(self) -> AsyncUsersEndpoint:
+        """Users endpoint, created on first access."""
+        return AsyncUsersEndpoint(self)
+
+    @cached_property
+    def groups(self) -> AsyncGroupsEndpoint:
+        """Groups endpoint, created on first access."""
+        return AsyncGroupsEndpoint(self)
+
+    @cached_property
+    def assets(self) -> AsyncAssetsEndpoint:
+        """Assets endpoint, created on first access."""
+        return AsyncAssetsEndpoint(self)
 
     def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session.
@@ -156,6 +173,7 @@ class AsyncWikiJSClient:
             connector=self._connector,
             timeout=timeout_obj,
             headers=headers,
+            json_serialize=dump_json,
             raise_for_status=False,  # We'll handle status codes manually
         )
 
@@ -200,6 +218,15 @@ class AsyncWikiJSClient:
             **kwargs,
         }
 
+        # Static auth headers were set on the session once; rotating ones
+        # are fetched per request so refreshed credentials are used
+        auth = self._auth_handler
+        if auth is not None and not auth.is_static:
+            request_kwargs["headers"] = {
+                **auth.get_headers(),
+                **(kwargs.get("headers") or {}),
+            }
+
         # Add JSON data if provided
         if json_data is not None:
             request_kwargs["json"] = json_data
@@ -250,13 +277,12 @@ class AsyncWikiJSClient:
                     def __init__(self, status, text):
                         self.status_code = status
                         self.text = text
-                        try:
-                            self._json = json.loads(text) if text else {}
-                        except json.JSONDecodeError:
-                            self._json = {}
 
                     def json(self):
-                        return self._json
+                        try:
+                            return json.loads(self.text) if self.text else {}
+                        except json.JSONDecodeError:
+                            return {}
 
                 mock_resp = MockResponse(response.status, response_text)
                 error_message = extract_error_message(mock_resp)
@@ -267,7 +293,7 @@ class AsyncWikiJSClient:
 
         # Parse JSON response
         try:
-            data = await response.json()
+            data = await response.json(loads=load_json)
         except json.JSONDecodeError as e:
             response_text = await response.text()
             raise APIError(
@@ -1,11 +1,31 @@
 """Async Pages API endpoint for py-wikijs."""
 
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 from ...exceptions import APIError, ValidationError
 from ...models.page import Page, PageCreate, PageUpdate
 from .base import AsyncBaseEndpoint
 
+# API field names of a page mapped to Page model field names; tags are
+# converted separately
+_PAGE_FIELD_MAP = {
+    "id": "id",
+    "title": "title",
+    "path": "path",
+    "content": "content",
+    "description": "description",
+    "isPublished": "is_published",
+    "isPrivate": "is_private",
+    "locale": "locale",
+    "authorId": "author_id",
+    "authorName": "author_name",
+    "authorEmail": "author_email",
+    "editor": "editor",
+    "createdAt": "created_at",
+    "updatedAt": "updated_at",
+}
+
 
 class AsyncPagesEndpoint(AsyncBaseEndpoint):
     """Async endpoint for Wiki.js Pages API operations.
@@ -635,43 +655,22 @@ class AsyncPagesEndpoint(AsyncBaseEndpoint):
         Returns:
             Normalized data for Page model
         """
-        normalized = {}
-
         # Map API field names to model field names
-        field_mapping = {
-            "id": "id",
-            "title": "title",
-            "path": "path",
-            "content": "content",
-            "description": "description",
-            "isPublished": "is_published",
-            "isPrivate": "is_private",
-            "locale": "locale",
-            "authorId": "author_id",
-            "authorName": "author_name",
-            "authorEmail": "author_email",
-            "editor": "editor",
-            "createdAt": "created_at",
-            "updatedAt": "updated_at",
+        normalized = {
+            model_field: page_data[api_field]
+            for api_field, model_field in _PAGE_FIELD_MAP.items()
+            if api_field in page_data
         }
 
-        for api_field, model_field in field_mapping.items():
-            if api_field in page_data:
-                normalized[model_field] = page_data[api_field]
-
         # Handle tags - convert from Wiki.js format
-        if "tags" in page_data:
-            if isinstance(page_data["tags"], list):
-                # Handle both formats: ["tag1", "tag2"] or [{"tag": "tag1"}]
-                tags = []
-                for tag in page_data["tags"]:
-                    if isinstance(tag, dict) and "tag" in tag:
-                        tags.append(tag["tag"])
-                    elif isinstance(tag, str):
-                        tags.append(tag)
-                normalized["tags"] = tags
-            else:
-                normalized["tags"] = []
+        # Handle both formats: ["tag1", "tag2"] or [{"tag": "tag1"}]
+        tags = page_data.get("tags")
+        if isinstance(tags, list):
+            normalized["tags"] = [
+                tag["tag"] if isinstance(tag, dict) else tag
+                for tag in tags
+                if isinstance(tag, str) or (isinstance(tag, dict) and "tag" in tag)
+            ]
         else:
             normalized["tags"] = []
 
@@ -728,3 +727,185 @@ class AsyncPagesEndpoint(AsyncBaseEndpoint):
                 break
 
             offset += batch_size
+
+    async def _fan_out(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        calls: List[Tuple[Any, ...]],
+        max_concurrency: int,
+    ) -> List[Any]:
+        """Run ``func(*args)`` for every call concurrently.
+
+        At most ``max_concurrency`` calls are in flight at once.
+
+        Args:
+            func: Coroutine function to call
+            calls: Positional argument tuples, one per call
+            max_concurrency: Maximum number of concurrent requests
+
+        Returns:
+            Results in call order; a failed call yields its exception
+
+        Raises:
+            asyncio.CancelledError: If a call was cancelled; only ``Exception``
+                instances are returned as per-call failures
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(args: Tuple[Any, ...]) -> Any:
+            async with semaphore:
+                return await func(*args)
+
+        outcomes = await asyncio.gather(
+            *(run(args) for args in calls), return_exceptions=True
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException) and not isinstance(
+                outcome, Exception
+            ):
+                raise outcome
+        return outcomes
+
+    async def create_many(
+        self,
+        pages_data: List[Union[PageCreate, Dict[str, Any]]],
+        max_concurrency: int = 8,
+    ) -> List[Page]:
+        """Create multiple pages concurrently.
+
+        Each page is created with its own ``pages.create`` mutation, so this
+        works against servers that reject multi-mutation documents.
+
+        Args:
+            pages_data: List of PageCreate objects or dicts
+            max_concurrency: Maximum number of concurrent requests (default: 8)
+
+        Returns:
+            List of created Page objects
+
+        Raises:
+            APIError: If any page creation fails
+            ValidationError: If max_concurrency is invalid
+        """
+        if not pages_data:
+            return []
+
+        if max_concurrency < 1:
+            raise ValidationError("max_concurrency must be greater than 0")
+
+        outcomes = await self._fan_out(
+            self.create, [(page_data,) for page_data in pages_data], max_concurrency
+        )
+
+        created_pages = []
+        errors = []
+        for i, (page_data, outcome) in enumerate(zip(pages_data, outcomes)):
+            if isinstance(outcome, Exception):
+                errors.append({"index": i, "data": page_data, "error": str(outcome)})
+            else:
+                created_pages.append(outcome)
+
+        if errors:
+            error_msg = f"Failed to create {len(errors)}/{len(pages_data)} pages. "
+            error_msg += f"Successfully created: {len(created_pages)}. Errors: {errors}"
+            raise APIError(error_msg)
+
+        return created_pages
+
+    async def update_many(
+        self, updates: List[Dict[str, Any]], max_concurrency: int = 8
+    ) -> List[Page]:
+        """Update multiple pages concurrently.
+
+        Each update dict must contain an 'id' field and the fields to update.
+
+        Args:
+            updates: List of dicts with 'id' and update fields
+            max_concurrency: Maximum number of concurrent requests (default: 8)
+
+        Returns:
+            List of updated Page objects
+
+        Raises:
+            APIError: If any page update fails
+            ValidationError: If max_concurrency is invalid
+        """
+        if not updates:
+            return []
+
+        if max_concurrency < 1:
+            raise ValidationError("max_concurrency must be greater than 0")
+
+        errors: List[Dict[str, Any]] = []
+        calls = []
+        indexes = []
+        for i, update_data in enumerate(updates):
+            if "id" not in update_data:
+                errors.append(
+                    {
+                        "index": i,
+                        "data": update_data,
+                        "error": "Each update must have an 'id' field",
+                    }
+                )
+                continue
+            update_fields = {k: v for k, v in update_data.items() if k != "id"}
+            calls.append((update_data["id"], update_fields))
+            indexes.append(i)
+
+        outcomes = await self._fan_out(self.update, calls, max_concurrency)
+
+        updated_pages = []
+        for i, outcome in zip(indexes, outcomes):
+            if isinstance(outcome, Exception):
+                errors.append({"index": i, "data": updates[i], "error": str(outcome)})
+            else:
+                updated_pages.append(outcome)
+
+        if errors:
+            errors.sort(key=lambda error: error["index"])
+            error_msg = f"Failed to update {len(errors)}/{len(updates)} pages. "
+            error_msg += f"Successfully updated: {len(updated_pages)}. Errors: {errors}"
+            raise APIError(error_msg)
+
+        return updated_pages
+
+    async def delete_many(
+        self, page_ids: List[int], max_concurrency: int = 8
+    ) -> Dict[str, Any]:
+        """Delete multiple pages concurrently.
+
+        Args:
+            page_ids: List of page IDs to delete
+            max_concurrency: Maximum number of concurrent requests (default: 8)
+
+        Returns:
+            Dict with success count and any errors
+
+        Raises:
+            APIError: If any page deletion fails
+            ValidationError: If max_concurrency is invalid
+        """
+        if not page_ids:
+            return {"successful": 0, "failed": 0, "errors": []}
+
+        if max_concurrency < 1:
+            raise ValidationError("max_concurrency must be greater than 0")
+
+        outcomes = await self._fan_out(
+            self.delete, [(page_id,) for page_id in page_ids], max_concurrency
+        )
+
+        errors = [
+            {"page_id": page_id, "error": str(outcome)}
+            for page_id, outcome in zip(page_ids, outcomes)
+            if isinstance(outcome, Exception)
+        ]
+        successful = len(page_ids) - len(errors)
+
+        if errors:
+            error_msg = f"Failed to delete {len(errors)}/{len(page_ids)} pages. "
+            error_msg += f"Successfully deleted: {successful}. Errors: {errors}"
+            raise APIError(error_msg)
+
+        return {"successful": successful, "failed": 0, "errors": []}
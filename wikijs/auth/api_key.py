@@ -23,6 +23,8 @@ class APIKeyAuth(AuthHandler):
         >>> client = WikiJSClient("https://wiki.example.com", auth=auth)
     """
 
+    is_static = True
+
     def __init__(self, api_key: str) -> None:
         """Initialize API key authentication.
 
@@ -13,8 +13,16 @@ class AuthHandler(ABC):
 
     This class defines the interface that all authentication implementations
     must follow, ensuring consistent behavior across different auth methods.
+
+    Attributes:
+        is_static: True if ``get_headers()`` always returns the same headers.
+            Clients then send the headers fetched at setup with every request;
+            otherwise they call ``get_headers()`` per request so rotating
+            credentials (e.g. refreshed JWTs) stay current.
     """
 
+    is_static: bool = False
+
     @abstractmethod
     def get_headers(self) -> Dict[str, str]:
         """Get authentication headers for HTTP requests.
@@ -71,6 +79,8 @@ class NoAuth(AuthHandler):
     that don't require authentication.
     """
 
+    is_static = True
+
     def get_headers(self) -> Dict[str, str]:
         """Return empty headers dict.
 
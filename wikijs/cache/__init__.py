@@ -20,5 +20,6 @@ Example:
 
 from .base import BaseCache, CacheKey
 from .memory import MemoryCache
+from .tiered import TieredCache
 
-__all__ = ["BaseCache", "CacheKey", "MemoryCache"]
+__all__ = ["BaseCache", "CacheKey", "MemoryCache", "TieredCache"]
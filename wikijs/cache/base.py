@@ -1,14 +1,20 @@
 """Base cache interface for py-wikijs."""
 
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Optional
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class CacheKey:
     """Cache key structure for Wiki.js resources.
 
+    Keys are immutable and hashable. The string form and its hash are
+    computed once at construction, since caches look keys up repeatedly.
+    The string form is interned, so equal keys share one string object and
+    dict lookups by it match on identity.
+
     Attributes:
         resource_type: Type of resource (e.g., 'page', 'user', 'group')
         identifier: Unique identifier (ID, path, etc.)
@@ -20,6 +26,21 @@ class CacheKey:
     identifier: str
     operation: str = "get"
     params: Optional[str] = None
+    _key: str = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compute the string form and hash of the key."""
+        parts = [self.resource_type, str(self.identifier), self.operation]
+        if self.params:
+            parts.append(self.params)
+        key = sys.intern(":".join(parts))
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_hash", hash(key))
+
+    def __hash__(self) -> int:
+        """Return the hash computed at construction."""
+        return self._hash
 
     def to_string(self) -> str:
         """Convert cache key to string format.
@@ -32,10 +53,7 @@ class CacheKey:
             >>> key.to_string()
             'page:123:get'
         """
-        parts = [self.resource_type, str(self.identifier), self.operation]
-        if self.params:
-            parts.append(self.params)
-        return ":".join(parts)
+        return self._key
 
 
 class BaseCache(ABC):
@@ -49,6 +67,8 @@ class BaseCache(ABC):
         max_size: Maximum number of items to cache (default: 1000)
     """
 
+    __slots__ = ("ttl", "max_size")
+
     def __init__(self, ttl: int = 300, max_size: int = 1000):
         """Initialize cache with TTL and size limits.
 
@@ -109,6 +129,24 @@ class BaseCache(ABC):
         """
         pass
 
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Invalidate all cache entries carrying any of the given tags.
+
+        Tags name a resource type (``"page"``) or a single resource
+        (``"page:123"``). This default maps each tag onto
+        ``invalidate_resource()``; backends with a tag index override it to
+        invalidate a whole batch in one pass.
+
+        Args:
+            tags: Tags to invalidate
+
+        Example:
+            >>> cache.invalidate_tags(['page:1', 'page:2'])
+        """
+        for tag in tags:
+            resource_type, _, identifier = tag.partition(":")
+            self.invalidate_resource(resource_type, identifier or None)
+
     def get_stats(self) -> dict:
         """Get cache statistics.
 
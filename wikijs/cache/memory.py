@@ -1,11 +1,16 @@
 """In-memory cache implementation for py-wikijs."""
 
-import time
-from collections import OrderedDict
-from typing import Any, Optional
+import bisect
+import threading
+from collections import deque
+from time import monotonic_ns
+from typing import Any, Deque, Dict, Iterable, Optional, Set, Tuple
 
 from .base import BaseCache, CacheKey
 
+# Cache entry: (value, expires_at, tags)
+_Entry = Tuple[Any, int, Set[str]]
+
 
 class MemoryCache(BaseCache):
     """In-memory LRU cache with TTL support.
@@ -17,9 +22,14 @@ class MemoryCache(BaseCache):
     Features:
         - LRU eviction policy
         - TTL-based expiration
+        - Tag-based invalidation through a reverse index
         - Thread-safe operations
         - Cache statistics (hits, misses)
 
+    Every entry is tagged with its resource type (``"page"``) and resource
+    (``"page:123"``), plus any tags passed to ``set()``, so invalidation
+    only touches the matching entries instead of scanning the cache.
+
     Args:
         ttl: Time-to-live in seconds (default: 300 = 5 minutes)
         max_size: Maximum number of items (default: 1000)
@@ -31,6 +41,8 @@ class MemoryCache(BaseCache):
         >>> cached = cache.get(key)
     """
 
+    __slots__ = ("_cache", "_expiry", "_hits", "_misses", "_tags", "_lock")
+
     def __init__(self, ttl: int = 300, max_size: int = 1000):
         """Initialize in-memory cache.
 
@@ -39,9 +51,22 @@ class MemoryCache(BaseCache):
             max_size: Maximum cache size
         """
         super().__init__(ttl, max_size)
-        self._cache: OrderedDict = OrderedDict()
+        # Plain dicts keep insertion order, so the first key is the least
+        # recently used one; hits are moved to the end by re-inserting them
+        # Tuple entries are much smaller than a dict or object per entry
+        self._cache: Dict[str, _Entry] = {}
+        # (expires_at, key_str) in expiry order. Expiry times are monotonic
+        # nanoseconds: integer compares, and immune to wall clock changes.
+        # Entries share the TTL, so appending on set() keeps the queue sorted
+        # and the expired entries are always at its front. Items for keys that were re-set
+        # or removed since are skipped when they reach the front.
+        self._expiry: Deque[Tuple[int, str]] = deque()
         self._hits = 0
         self._misses = 0
+        # Reverse index: tag -> key strings of the entries carrying it
+        self._tags: Dict[str, Set[str]] = {}
+        # Guards _cache; parallel bulk operations use the cache from threads
+        self._lock = threading.RLock()
 
     def get(self, key: CacheKey) -> Optional[Any]:
         """Retrieve value from cache if not expired.
@@ -54,50 +79,72 @@ class MemoryCache(BaseCache):
         """
         key_str = key.to_string()
 
-        if key_str not in self._cache:
-            self._misses += 1
-            return None
+        cache = self._cache
 
-        # Get cached entry
-        entry = self._cache[key_str]
-        expires_at = entry["expires_at"]
+        with self._lock:
+            # Pop and re-insert: one lookup both fetches the entry and
+            # moves it to the end (most recently used)
+            entry = cache.pop(key_str, None)
+            if entry is None:
+                self._misses += 1
+                return None
 
-        # Check if expired
-        if time.time() > expires_at:
-            # Expired, remove it
-            del self._cache[key_str]
-            self._misses += 1
-            return None
+            # Expired entries stay out and leave the tag index
+            if monotonic_ns() > entry[1]:
+                self._untag(key_str, entry)
+                self._misses += 1
+                return None
 
-        # Move to end (mark as recently used)
-        self._cache.move_to_end(key_str)
-        self._hits += 1
-        return entry["value"]
+            cache[key_str] = entry
+            self._hits += 1
+            return entry[0]
 
-    def set(self, key: CacheKey, value: Any) -> None:
+    def set(self, key: CacheKey, value: Any, tags: Iterable[str] = ()) -> None:
         """Store value in cache with TTL.
 
         Args:
             key: Cache key
             value: Value to cache
+            tags: Extra tags to invalidate the entry by
         """
         key_str = key.to_string()
-
-        # If exists, remove it first (will be re-added at end)
-        if key_str in self._cache:
-            del self._cache[key_str]
-
-        # Check size limit and evict oldest if needed
-        if len(self._cache) >= self.max_size:
-            # Remove oldest (first item in OrderedDict)
-            self._cache.popitem(last=False)
-
-        # Add new entry at end (most recent)
-        self._cache[key_str] = {
-            "value": value,
-            "expires_at": time.time() + self.ttl,
-            "created_at": time.time(),
-        }
+        entry_tags = {key.resource_type, f"{key.resource_type}:{key.identifier}"}
+        entry_tags.update(tags)
+
+        cache = self._cache
+
+        with self._lock:
+            now = monotonic_ns()
+
+            # If exists, remove it first (will be re-added at end)
+            if key_str in cache:
+                self._remove(key_str)
+
+            # Drop expired entries first, so they go before live ones are
+            # evicted
+            self._purge_expired(now)
+
+            # Check size limit and evict oldest if needed
+            if len(cache) >= self.max_size:
+                # Remove oldest (first key in insertion order)
+                self._remove(next(iter(cache)))
+
+            # Add new entry at end (most recent). ttl is read on every set,
+            # so assigning it applies to the entries stored afterwards
+            expires_at = now + int(self.ttl * 1_000_000_000)
+            cache[key_str] = (value, expires_at, entry_tags)
+            if self._expiry and self._expiry[-1][0] > expires_at:
+                # ttl was lowered; insert in order to keep the queue sorted
+                bisect.insort(self._expiry, (expires_at, key_str))
+            else:
+                self._expiry.append((expires_at, key_str))
+            # Re-set keys leave stale queue items behind; rebuild the queue
+            # from the live entries before it grows far past the cache
+            if len(self._expiry) > 2 * self.max_size:
+                self._expiry = deque(sorted((e[1], k) for k, e in cache.items()))
+            index = self._tags
+            for tag in entry_tags:
+                index.setdefault(tag, set()).add(key_str)
 
     def delete(self, key: CacheKey) -> None:
         """Remove value from cache.
@@ -106,14 +153,18 @@ class MemoryCache(BaseCache):
             key: Cache key to remove
         """
         key_str = key.to_string()
-        if key_str in self._cache:
-            del self._cache[key_str]
+        with self._lock:
+            if key_str in self._cache:
+                self._remove(key_str)
 
     def clear(self) -> None:
         """Clear all cached values and reset statistics."""
-        self._cache.clear()
-        self._hits = 0
-        self._misses = 0
+        with self._lock:
+            self._cache.clear()
+            self._expiry.clear()
+            self._tags.clear()
+            self._hits = 0
+            self._misses = 0
 
     def invalidate_resource(
         self, resource_type: str, identifier: Optional[str] = None
@@ -124,29 +175,21 @@ class MemoryCache(BaseCache):
             resource_type: Resource type to invalidate
             identifier: Specific identifier (None = invalidate all of this type)
         """
-        keys_to_delete = []
-
-        for key_str in self._cache.keys():
-            parts = key_str.split(":")
-            if len(parts) < 2:
-                continue
-
-            cached_resource_type = parts[0]
-            cached_identifier = parts[1]
+        if identifier is None:
+            self.invalidate_tags([resource_type])
+        else:
+            self.invalidate_tags([f"{resource_type}:{identifier}"])
 
-            # Match resource type
-            if cached_resource_type != resource_type:
-                continue
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Invalidate every entry carrying any of the given tags.
 
-            # If identifier specified, match it too
-            if identifier is not None and cached_identifier != str(identifier):
-                continue
-
-            keys_to_delete.append(key_str)
-
-        # Delete matched keys
-        for key_str in keys_to_delete:
-            del self._cache[key_str]
+        Args:
+            tags: Tags to invalidate, e.g. ``["page:1", "page:2"]``
+        """
+        with self._lock:
+            for tag in tags:
+                for key_str in self._tags.pop(tag, ()):
+                    self._remove(key_str)
 
     def get_stats(self) -> dict:
         """Get cache statistics.
@@ -173,14 +216,57 @@ class MemoryCache(BaseCache):
         Returns:
             Number of entries removed
         """
-        current_time = time.time()
-        keys_to_delete = []
+        with self._lock:
+            return self._purge_expired(monotonic_ns())
+
+    def _purge_expired(self, now: int) -> int:
+        """Remove entries that expired before ``now``.
+
+        Only pops the expired front of the expiry queue instead of scanning
+        every entry. Must be called with the lock held.
+
+        Args:
+            now: Current ``monotonic_ns()`` time
+
+        Returns:
+            Number of entries removed
+        """
+        expiry = self._expiry
+        cache = self._cache
+        removed = 0
+        while expiry and expiry[0][0] < now:
+            expires_at, key_str = expiry.popleft()
+            entry = cache.get(key_str)
+            # Skip items left behind by re-set or removed keys
+            if entry is not None and entry[1] == expires_at:
+                self._remove(key_str)
+                removed += 1
+        return removed
+
+    def _remove(self, key_str: str) -> None:
+        """Remove an entry and drop it from the tag index.
+
+        Must be called with the lock held. Missing keys are ignored.
 
-        for key_str, entry in self._cache.items():
-            if current_time > entry["expires_at"]:
-                keys_to_delete.append(key_str)
+        Args:
+            key_str: Key string of the entry to remove
+        """
+        entry = self._cache.pop(key_str, None)
+        if entry is not None:
+            self._untag(key_str, entry)
 
-        for key_str in keys_to_delete:
-            del self._cache[key_str]
+    def _untag(self, key_str: str, entry: _Entry) -> None:
+        """Drop an already removed entry from the tag index.
 
-        return len(keys_to_delete)
+        Must be called with the lock held.
+
+        Args:
+            key_str: Key string of the entry
+            entry: The removed entry
+        """
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key_str)
+                if not keys:
+                    del self._tags[tag]
@@ -0,0 +1,107 @@
+"""Two-tier cache implementation for py-wikijs."""
+
+from typing import Any, Iterable, Optional
+
+from .base import BaseCache, CacheKey
+
+
+class TieredCache(BaseCache):
+    """Cache that layers a fast local cache over a shared one.
+
+    Reads check the first tier (L1) and fall back to the second (L2),
+    copying L2 hits into L1. Writes and invalidations go to both tiers.
+    Any BaseCache implementation can be used for either tier, e.g. a
+    MemoryCache as L1 and a Redis-backed BaseCache subclass as L2 to share
+    cached resources between processes.
+
+    Args:
+        l1: Local cache checked first
+        l2: Shared cache checked on L1 misses
+
+    Example:
+        >>> cache = TieredCache(MemoryCache(ttl=60), RedisCache(...))
+        >>> client = WikiJSClient('https://wiki.example.com', auth='key', cache=cache)
+    """
+
+    def __init__(self, l1: BaseCache, l2: BaseCache):
+        """Initialize two-tier cache.
+
+        Args:
+            l1: Local cache checked first
+            l2: Shared cache checked on L1 misses
+        """
+        super().__init__(ttl=l1.ttl, max_size=l1.max_size)
+        self.l1 = l1
+        self.l2 = l2
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Retrieve value from L1, then L2.
+
+        Args:
+            key: Cache key to retrieve
+
+        Returns:
+            Cached value if either tier has it, None otherwise
+        """
+        value = self.l1.get(key)
+        if value is not None:
+            return value
+
+        value = self.l2.get(key)
+        if value is not None:
+            self.l1.set(key, value)
+        return value
+
+    def set(self, key: CacheKey, value: Any) -> None:
+        """Store value in both tiers.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        self.l1.set(key, value)
+        self.l2.set(key, value)
+
+    def delete(self, key: CacheKey) -> None:
+        """Remove value from both tiers.
+
+        Args:
+            key: Cache key to remove
+        """
+        self.l1.delete(key)
+        self.l2.delete(key)
+
+    def clear(self) -> None:
+        """Clear both tiers."""
+        self.l1.clear()
+        self.l2.clear()
+
+    def invalidate_resource(
+        self, resource_type: str, identifier: Optional[str] = None
+    ) -> None:
+        """Invalidate all cache entries for a resource in both tiers.
+
+        Args:
+            resource_type: Resource type to invalidate
+            identifier: Specific identifier (None = invalidate all of this type)
+        """
+        self.l1.invalidate_resource(resource_type, identifier)
+        self.l2.invalidate_resource(resource_type, identifier)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Invalidate tagged entries in both tiers.
+
+        Args:
+            tags: Tags to invalidate
+        """
+        tags = list(tags)
+        self.l1.invalidate_tags(tags)
+        self.l2.invalidate_tags(tags)
+
+    def get_stats(self) -> dict:
+        """Get statistics of both tiers.
+
+        Returns:
+            Dictionary with the stats of each tier
+        """
+        return {"l1": self.l1.get_stats(), "l2": self.l2.get_stats()}
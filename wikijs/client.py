@@ -1,6 +1,7 @@
 """Main WikiJS client for py-wikijs."""
 
 import json
+from functools import cached_property
 from typing import Any, Dict, Optional, Union
 
 import requests
@@ -9,6 +10,7 @@ from urllib3.util.retry import Retry
 
 from .auth import APIKeyAuth, AuthHandler
 from .cache import BaseCache
+from .dataloader import PageLoader
 from .endpoints import AssetsEndpoint, GroupsEndpoint, PagesEndpoint, UsersEndpoint
 from .exceptions import (
     APIError,
@@ -20,6 +22,7 @@ from .exceptions import (
 )
 from .utils import (
     build_api_url,
+    dump_json,
     extract_error_message,
     normalize_url,
     parse_wiki_response,
@@ -41,6 +44,10 @@ class WikiJSClient:
         verify_ssl: Whether to verify SSL certificates (default: True)
         user_agent: Custom User-Agent header
         cache: Optional cache instance for caching API responses
+        pool_size: Connections kept alive per host for reuse (default: 32)
+        coalesce_window: Seconds to collect concurrent ``pages.get()`` calls
+            from several threads into one batched query (default: None,
+            every call sends its own request)
 
     Example:
         Basic usage with API key:
@@ -62,6 +69,8 @@ class WikiJSClient:
         timeout: Request timeout setting
         verify_ssl: SSL verification setting
         cache: Optional cache instance
+        pool_size: Connection pool size per host
+        coalesce_window: Page get coalescing window, or None if disabled
     """
 
     def __init__(
@@ -72,6 +81,8 @@ class WikiJSClient:
         verify_ssl: bool = True,
         user_agent: Optional[str] = None,
         cache: Optional[BaseCache] = None,
+        pool_size: int = 32,
+        coalesce_window: Optional[float] = None,
     ):
         # Instance variable declarations for mypy
         self._auth_handler: AuthHandler
@@ -80,6 +91,9 @@ class WikiJSClient:
         # Validate and normalize base URL
         self.base_url = normalize_url(base_url)
 
+        # Nearly every call goes to the GraphQL endpoint; resolve its URL once
+        self._graphql_url = build_api_url(self.base_url, "/graphql")
+
         # Store authentication
         if isinstance(auth, str):
             # Convert string API key to APIKeyAuth handler
@@ -96,6 +110,8 @@ class WikiJSClient:
         self.timeout = timeout
         self.verify_ssl = verify_ssl
         self.user_agent = user_agent or f"py-wikijs/{__version__}"
+        self.pool_size = pool_size
+        self.coalesce_window = coalesce_window
 
         # Cache configuration
         self.cache = cache
@@ -103,11 +119,27 @@ class WikiJSClient:
         # Initialize HTTP session
         self._session = self._create_session()
 
-        # Endpoint handlers
-        self.pages = PagesEndpoint(self)
-        self.users = UsersEndpoint(self)
-        self.groups = GroupsEndpoint(self)
-        self.assets = AssetsEndpoint(self)
+    @cached_property
+    def pages(self) -> PagesEndpoint:
+        """Pages endpoint, created on first access."""
+        if self.coalesce_window is None:
+            return PagesEndpoint(self)
+        return PagesEndpoint(self, loader=PageLoader(self, wait=self.coalesce_window))
+
+    @cached_property
+    def users(self) -> UsersEndpoint:
+        """Users endpoint, created on first access."""
+        return UsersEndpoint(self)
+
+    @cached_property
+    def groups(self) -> GroupsEndpoint:
+        """Groups endpoint, created on first access."""
+        return GroupsEndpoint(self)
+
+    @cached_property
+    def assets(self) -> AssetsEndpoint:
+        """Assets endpoint, created on first access."""
+        return AssetsEndpoint(self)
 
     def _create_session(self) -> requests.Session:
         """Create configured HTTP session with retry strategy.
@@ -132,7 +164,13 @@ class WikiJSClient:
             ],
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Keep enough connections alive for parallel bulk operations, so
+        # concurrent requests reuse sockets instead of reconnecting
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
@@ -181,7 +219,10 @@ class WikiJSClient:
             TimeoutError: If request times out
         """
         # Build full URL
-        url = build_api_url(self.base_url, endpoint)
+        if endpoint == "/graphql":
+            url = self._graphql_url
+        else:
+            url = build_api_url(self.base_url, endpoint)
 
         # Prepare request arguments
         request_kwargs = {
@@ -191,9 +232,19 @@ class WikiJSClient:
             **kwargs,
         }
 
-        # Add JSON data if provided
+        # Static auth headers were set on the session once; rotating ones
+        # are fetched per request so refreshed credentials are used
+        auth = self._auth_handler
+        if auth is not None and not auth.is_static:
+            request_kwargs["headers"] = {
+                **auth.get_headers(),
+                **(kwargs.get("headers") or {}),
+            }
+
+        # Add JSON data if provided; the session already sends the JSON
+        # Content-Type, so the body is passed pre-encoded
         if json_data is not None:
-            request_kwargs["json"] = json_data
+            request_kwargs["data"] = dump_json(json_data).encode("utf-8")
 
         try:
             # Make request
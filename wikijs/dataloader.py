@@ -0,0 +1,160 @@
+"""Request coalescing for wikijs-python-sdk."""
+
+import threading
+from concurrent.futures import Future
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from .models.page import Page
+
+if TYPE_CHECKING:
+    from .client import WikiJSClient
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """Coalesce individual loads into batched lookups.
+
+    Keys passed to ``load()`` are queued for ``wait`` seconds (or until
+    ``max_batch_size`` keys are pending) and then handed to ``batch_load_fn``
+    in one call. Duplicate keys in a window share a single future.
+    """
+
+    def __init__(
+        self,
+        batch_load_fn: Callable[[List[K]], List[Union[V, Exception]]],
+        max_batch_size: int = 50,
+        wait: float = 0.005,
+    ):
+        """Initialize data loader.
+
+        Args:
+            batch_load_fn: Function mapping a list of keys to a list of values
+                in the same order; an Exception value fails that key only
+            max_batch_size: Maximum number of keys per batch
+            wait: Seconds to collect keys before dispatching a batch
+        """
+        self._batch_load_fn = batch_load_fn
+        self.max_batch_size = max_batch_size
+        self.wait = wait
+        self._queue: Dict[K, "Future[V]"] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def load(self, key: K) -> "Future[V]":
+        """Queue a key for the next batch.
+
+        Args:
+            key: Key to load
+
+        Returns:
+            Future resolving to the value for ``key``
+        """
+        batch = None
+        with self._lock:
+            pending = self._queue.get(key)
+            if pending is not None and not pending.cancelled():
+                return pending
+
+            future: "Future[V]" = Future()
+            self._queue[key] = future
+
+            if len(self._queue) >= self.max_batch_size:
+                batch = self._take_batch()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.wait, self.dispatch)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if batch:
+            self._run_batch(batch)
+        return future
+
+    def load_many(self, keys: List[K]) -> List["Future[V]"]:
+        """Queue several keys for the next batch.
+
+        Args:
+            keys: Keys to load
+
+        Returns:
+            Futures in the same order as ``keys``
+        """
+        return [self.load(key) for key in keys]
+
+    def dispatch(self) -> None:
+        """Send all pending keys now instead of waiting for the timer."""
+        with self._lock:
+            batch = self._take_batch()
+
+        if batch:
+            self._run_batch(batch)
+
+    def _take_batch(self) -> Dict[K, "Future[V]"]:
+        """Detach the pending queue. Must be called with the lock held."""
+        batch, self._queue = self._queue, {}
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _run_batch(self, batch: Dict[K, "Future[V]"]) -> None:
+        """Load one batch and resolve its futures."""
+        # Drop cancelled futures; the rest are marked running and can no
+        # longer be cancelled, so resolving them below cannot fail
+        batch = {
+            key: future
+            for key, future in batch.items()
+            if future.set_running_or_notify_cancel()
+        }
+        if not batch:
+            return
+
+        keys = list(batch)
+        try:
+            values = self._batch_load_fn(keys)
+            if len(values) != len(keys):
+                raise ValueError(
+                    f"batch_load_fn returned {len(values)} values "
+                    f"for {len(keys)} keys"
+                )
+        except Exception as e:
+            for future in batch.values():
+                future.set_exception(e)
+            return
+
+        for key, value in zip(keys, values):
+            if isinstance(value, Exception):
+                batch[key].set_exception(value)
+            else:
+                batch[key].set_result(value)
+
+
+class PageLoader(DataLoader[int, Page]):
+    """DataLoader fetching pages by ID with one aliased query per batch."""
+
+    def __init__(
+        self, client: "WikiJSClient", max_batch_size: int = 50, wait: float = 0.005
+    ):
+        """Initialize page loader.
+
+        Args:
+            client: WikiJS client used to fetch pages
+            max_batch_size: Maximum number of pages per query
+            wait: Seconds to collect page IDs before sending a query
+        """
+        super().__init__(
+            lambda page_ids: client.pages._get_batch(page_ids),
+            max_batch_size=max_batch_size,
+            wait=wait,
+        )
@@ -1,12 +1,176 @@
 """Pages API endpoint for py-wikijs."""
 
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+from pydantic import TypeAdapter
 
 from ..cache import CacheKey
 from ..exceptions import APIError, ValidationError
 from ..models.page import Page, PageCreate, PageUpdate
+from ..utils import ichunk_list
 from .base import BaseEndpoint
 
+if TYPE_CHECKING:
+    from ..client import WikiJSClient
+    from ..dataloader import DataLoader
+
+# Worker threads used by the parallel (one request per page) bulk mode
+_MAX_CONCURRENCY = 8
+
+# Selection set of a full page, shared by the single/create documents
+_PAGE_FIELDS = """{
+                id
+                title
+                path
+                content
+                description
+                isPublished
+                isPrivate
+                tags {
+                    tag
+                }
+                locale
+                authorId
+                authorName
+                authorEmail
+                editor
+                createdAt
+                updatedAt
+            }"""
+
+# Validates a list of normalized page dicts in one pass
+_PAGES_ADAPTER = TypeAdapter(List[Page])
+
+# GraphQL argument types of the pages.single query
+_GET_ARG_TYPES = {"id": "Int!"}
+
+# GraphQL argument types of the pages.create mutation
+_CREATE_ARG_TYPES = {
+    "content": "String!",
+    "description": "String!",
+    "editor": "String!",
+    "isPublished": "Boolean!",
+    "isPrivate": "Boolean!",
+    "locale": "String!",
+    "path": "String!",
+    "tags": "[String]!",
+    "title": "String!",
+}
+
+# Selection set requested for each pages.create result
+_CREATE_RESULT_FIELDS = (
+    """{
+                responseResult {
+                    succeeded
+                    errorCode
+                    slug
+                    message
+                }
+                page """
+    + _PAGE_FIELDS
+    + """
+            }"""
+)
+
+# GraphQL argument types of the updatePage mutation
+_UPDATE_ARG_TYPES = {
+    "id": "Int!",
+    "title": "String",
+    "content": "String",
+    "description": "String",
+    "isPublished": "Boolean",
+    "isPrivate": "Boolean",
+    "tags": "[String]",
+}
+
+# Selection set requested for each updatePage result
+_UPDATE_RESULT_FIELDS = """{
+            id
+            title
+            path
+            content
+            description
+            isPublished
+            isPrivate
+            tags
+            locale
+            authorId
+            authorName
+            authorEmail
+            editor
+            createdAt
+            updatedAt
+        }"""
+
+# GraphQL argument types and selection set of the deletePage mutation
+_DELETE_ARG_TYPES = {"id": "Int!"}
+_DELETE_RESULT_FIELDS = """{
+            success
+            message
+        }"""
+
+# Field templates shared by single and batch documents; "{args}" is
+# replaced by the argument list
+_GET_FIELD = "pages {\n            single({args}) " + _PAGE_FIELDS + "\n        }"
+_CREATE_FIELD = (
+    "pages {\n            create({args}) " + _CREATE_RESULT_FIELDS + "\n        }"
+)
+_UPDATE_FIELD = "updatePage({args}) " + _UPDATE_RESULT_FIELDS
+_DELETE_FIELD = "deletePage({args}) " + _DELETE_RESULT_FIELDS
+
+
+def _build_document(
+    field: str, arg_types: Dict[str, str], operation: str = "mutation"
+) -> str:
+    """Build the document of a single-item operation.
+
+    Every argument is passed as a same-named variable, so the document is
+    built once at import and only the variables change between requests.
+
+    Args:
+        field: Field template with an ``{args}`` placeholder
+        arg_types: GraphQL type of every argument name
+        operation: GraphQL operation type (``"mutation"`` or ``"query"``)
+
+    Returns:
+        GraphQL document
+    """
+    declarations = ", ".join(f"${name}: {type_}" for name, type_ in arg_types.items())
+    arguments = ", ".join(f"{name}: ${name}" for name in arg_types)
+    return (
+        f"{operation}({declarations}) {{\n        "
+        + field.replace("{args}", arguments)
+        + "\n}"
+    )
+
+
+_GET_QUERY = _build_document(_GET_FIELD, _GET_ARG_TYPES, operation="query")
+_CREATE_MUTATION = _build_document(_CREATE_FIELD, _CREATE_ARG_TYPES)
+_UPDATE_MUTATION = _build_document(_UPDATE_FIELD, _UPDATE_ARG_TYPES)
+_DELETE_MUTATION = _build_document(_DELETE_FIELD, _DELETE_ARG_TYPES)
+
+# API field names of a page mapped to Page model field names; tags are
+# converted separately
+_PAGE_FIELD_MAP = {
+    "id": "id",
+    "path": "path",
+    "locale": "locale",
+    "title": "title",
+    "description": "description",
+    "contentType": "content_type",
+    "isPublished": "is_published",
+    "isPrivate": "is_private",
+    "privateNS": "private_ns",
+    "createdAt": "created_at",
+    "updatedAt": "updated_at",
+    "content": "content",
+    "authorId": "author_id",
+    "authorName": "author_name",
+    "authorEmail": "author_email",
+    "editor": "editor",
+}
+
 
 class PagesEndpoint(BaseEndpoint):
     """Endpoint for Wiki.js Pages API operations.
@@ -40,6 +204,19 @@ class PagesEndpoint(BaseEndpoint):
         >>> pages.delete(123)
     """
 
+    def __init__(
+        self, client: "WikiJSClient", loader: Optional["DataLoader[int, Page]"] = None
+    ):
+        """Initialize pages endpoint.
+
+        Args:
+            client: WikiJS client instance
+            loader: Optional DataLoader (e.g. PageLoader) that coalesces
+                concurrent get() calls into batched queries
+        """
+        super().__init__(client)
+        self._loader = loader
+
     def list(
         self,
         limit: Optional[int] = None,
@@ -132,18 +309,13 @@ class PagesEndpoint(BaseEndpoint):
 
         pages_data = response.get("data", {}).get("pages", {}).get("list", [])
 
-        # Convert to Page objects
-        pages = []
-        for page_data in pages_data:
-            try:
-                # Convert API field names to model field names
-                normalized_data = self._normalize_page_data(page_data)
-                page = Page(**normalized_data)
-                pages.append(page)
-            except Exception as e:
-                raise APIError(f"Failed to parse page data: {str(e)}") from e
-
-        return pages
+        # Convert API field names to model field names, then validate at once
+        try:
+            return _PAGES_ADAPTER.validate_python(
+                [self._normalize_page_data(page_data) for page_data in pages_data]
+            )
+        except Exception as e:
+            raise APIError(f"Failed to parse page data: {str(e)}") from e
 
     def get(self, page_id: int) -> Page:
         """Get a specific page by ID.
@@ -168,37 +340,13 @@ class PagesEndpoint(BaseEndpoint):
             if cached is not None:
                 return cached
 
-        # Build GraphQL query using actual Wiki.js schema
-        query = """
-        query($id: Int!) {
-            pages {
-                single(id: $id) {
-                    id
-                    title
-                    path
-                    content
-                    description
-                    isPublished
-                    isPrivate
-                    tags {
-                        tag
-                    }
-                    locale
-                    authorId
-                    authorName
-                    authorEmail
-                    editor
-                    createdAt
-                    updatedAt
-                }
-            }
-        }
-        """
+        if self._loader is not None:
+            return self._loader.load(page_id).result()
 
         # Make request
         response = self._post(
             "/graphql",
-            json_data={"query": query, "variables": {"id": page_id}},
+            json_data={"query": _GET_QUERY, "variables": {"id": page_id}},
         )
 
         # Parse response
@@ -303,87 +451,13 @@ class PagesEndpoint(BaseEndpoint):
             APIError: If page creation fails
             ValidationError: If page data is invalid
         """
-        # Convert to PageCreate if needed
-        if isinstance(page_data, dict):
-            try:
-                page_data = PageCreate(**page_data)
-            except Exception as e:
-                raise ValidationError(f"Invalid page data: {str(e)}") from e
-        elif not isinstance(page_data, PageCreate):
-            raise ValidationError("page_data must be PageCreate object or dict")
-
-        # Build GraphQL mutation using actual Wiki.js schema
-        mutation = """
-        mutation(
-            $content: String!,
-            $description: String!,
-            $editor: String!,
-            $isPublished: Boolean!,
-            $isPrivate: Boolean!,
-            $locale: String!,
-            $path: String!,
-            $tags: [String]!,
-            $title: String!
-        ) {
-            pages {
-                create(
-                    content: $content,
-                    description: $description,
-                    editor: $editor,
-                    isPublished: $isPublished,
-                    isPrivate: $isPrivate,
-                    locale: $locale,
-                    path: $path,
-                    tags: $tags,
-                    title: $title
-                ) {
-                    responseResult {
-                        succeeded
-                        errorCode
-                        slug
-                        message
-                    }
-                    page {
-                        id
-                        title
-                        path
-                        content
-                        description
-                        isPublished
-                        isPrivate
-                        tags {
-                            tag
-                        }
-                        locale
-                        authorId
-                        authorName
-                        authorEmail
-                        editor
-                        createdAt
-                        updatedAt
-                    }
-                }
-            }
-        }
-        """
+        page_data = self._to_page_create(page_data)
 
-        # Build variables from page data
-        variables = {
-            "title": page_data.title,
-            "path": page_data.path,
-            "content": page_data.content,
-            "description": page_data.description
-            or f"Created via SDK: {page_data.title}",
-            "isPublished": page_data.is_published,
-            "isPrivate": page_data.is_private,
-            "tags": page_data.tags,
-            "locale": page_data.locale,
-            "editor": page_data.editor,
-        }
+        variables = self._build_create_variables(page_data)
 
         # Make request
         response = self._post(
-            "/graphql", json_data={"query": mutation, "variables": variables}
+            "/graphql", json_data={"query": _CREATE_MUTATION, "variables": variables}
         )
 
         # Parse response
@@ -391,22 +465,7 @@ class PagesEndpoint(BaseEndpoint):
             raise APIError(f"Failed to create page: {response['errors']}")
 
         create_result = response.get("data", {}).get("pages", {}).get("create", {})
-        response_result = create_result.get("responseResult", {})
-
-        if not response_result.get("succeeded"):
-            error_msg = response_result.get("message", "Unknown error")
-            raise APIError(f"Page creation failed: {error_msg}")
-
-        created_page_data = create_result.get("page")
-        if not created_page_data:
-            raise APIError("Page creation failed - no page data returned")
-
-        # Convert to Page object
-        try:
-            normalized_data = self._normalize_page_data(created_page_data)
-            return Page(**normalized_data)
-        except Exception as e:
-            raise APIError(f"Failed to parse created page data: {str(e)}") from e
+        return self._parse_create_result(create_result)
 
     def update(
         self, page_id: int, page_data: Union[PageUpdate, Dict[str, Any]]
@@ -427,73 +486,13 @@ class PagesEndpoint(BaseEndpoint):
         if not isinstance(page_id, int) or page_id < 1:
             raise ValidationError("page_id must be a positive integer")
 
-        # Convert to PageUpdate if needed
-        if isinstance(page_data, dict):
-            try:
-                page_data = PageUpdate(**page_data)
-            except Exception as e:
-                raise ValidationError(f"Invalid page data: {str(e)}") from e
-        elif not isinstance(page_data, PageUpdate):
-            raise ValidationError("page_data must be PageUpdate object or dict")
-
-        # Build GraphQL mutation
-        mutation = """
-        mutation(
-            $id: Int!,
-            $title: String,
-            $content: String,
-            $description: String,
-            $isPublished: Boolean,
-            $isPrivate: Boolean,
-            $tags: [String]
-        ) {
-            updatePage(
-                id: $id,
-                title: $title,
-                content: $content,
-                description: $description,
-                isPublished: $isPublished,
-                isPrivate: $isPrivate,
-                tags: $tags
-            ) {
-                id
-                title
-                path
-                content
-                description
-                isPublished
-                isPrivate
-                tags
-                locale
-                authorId
-                authorName
-                authorEmail
-                editor
-                createdAt
-                updatedAt
-            }
-        }
-        """
-
-        # Build variables (only include non-None values)
-        variables: Dict[str, Any] = {"id": page_id}
+        page_data = self._to_page_update(page_data)
 
-        if page_data.title is not None:
-            variables["title"] = page_data.title
-        if page_data.content is not None:
-            variables["content"] = page_data.content
-        if page_data.description is not None:
-            variables["description"] = page_data.description
-        if page_data.is_published is not None:
-            variables["isPublished"] = page_data.is_published
-        if page_data.is_private is not None:
-            variables["isPrivate"] = page_data.is_private
-        if page_data.tags is not None:
-            variables["tags"] = page_data.tags
+        variables = self._build_update_variables(page_id, page_data)
 
         # Make request
         response = self._post(
-            "/graphql", json_data={"query": mutation, "variables": variables}
+            "/graphql", json_data={"query": _UPDATE_MUTATION, "variables": variables}
         )
 
         # Parse response
@@ -501,19 +500,13 @@ class PagesEndpoint(BaseEndpoint):
             raise APIError(f"Failed to update page: {response['errors']}")
 
         updated_page_data = response.get("data", {}).get("updatePage")
-        if not updated_page_data:
-            raise APIError("Page update failed - no data returned")
+        page = self._parse_update_result(updated_page_data)
 
         # Invalidate cache for this page
         if self._client.cache:
             self._client.cache.invalidate_resource("page", str(page_id))
 
-        # Convert to Page object
-        try:
-            normalized_data = self._normalize_page_data(updated_page_data)
-            return Page(**normalized_data)
-        except Exception as e:
-            raise APIError(f"Failed to parse updated page data: {str(e)}") from e
+        return page
 
     def delete(self, page_id: int) -> bool:
         """Delete a page.
@@ -531,20 +524,10 @@ class PagesEndpoint(BaseEndpoint):
         if not isinstance(page_id, int) or page_id < 1:
             raise ValidationError("page_id must be a positive integer")
 
-        # Build GraphQL mutation
-        mutation = """
-        mutation($id: Int!) {
-            deletePage(id: $id) {
-                success
-                message
-            }
-        }
-        """
-
         # Make request
         response = self._post(
             "/graphql",
-            json_data={"query": mutation, "variables": {"id": page_id}},
+            json_data={"query": _DELETE_MUTATION, "variables": {"id": page_id}},
         )
 
         # Parse response
@@ -552,11 +535,7 @@ class PagesEndpoint(BaseEndpoint):
             raise APIError(f"Failed to delete page: {response['errors']}")
 
         delete_result = response.get("data", {}).get("deletePage", {})
-        success = delete_result.get("success", False)
-
-        if not success:
-            message = delete_result.get("message", "Unknown error")
-            raise APIError(f"Page deletion failed: {message}")
+        self._check_delete_result(delete_result)
 
         # Invalidate cache for this page
         if self._client.cache:
@@ -639,6 +618,592 @@ class PagesEndpoint(BaseEndpoint):
 
         return matching_pages
 
+    def _to_page_create(
+        self, page_data: Union[PageCreate, Dict[str, Any]]
+    ) -> PageCreate:
+        """Coerce page creation input to a PageCreate object.
+
+        Args:
+            page_data: PageCreate object or dict
+
+        Returns:
+            PageCreate object
+
+        Raises:
+            ValidationError: If page data is invalid
+        """
+        if isinstance(page_data, dict):
+            try:
+                return PageCreate(**page_data)
+            except Exception as e:
+                raise ValidationError(f"Invalid page data: {str(e)}") from e
+        if not isinstance(page_data, PageCreate):
+            raise ValidationError("page_data must be PageCreate object or dict")
+        return page_data
+
+    def _build_create_variables(self, page_data: PageCreate) -> Dict[str, Any]:
+        """Build pages.create mutation variables from a PageCreate object.
+
+        Args:
+            page_data: Page creation data
+
+        Returns:
+            GraphQL variables keyed by argument name
+        """
+        return {
+            "title": page_data.title,
+            "path": page_data.path,
+            "content": page_data.content,
+            "description": page_data.description
+            or f"Created via SDK: {page_data.title}",
+            "isPublished": page_data.is_published,
+            "isPrivate": page_data.is_private,
+            "tags": page_data.tags,
+            "locale": page_data.locale,
+            "editor": page_data.editor,
+        }
+
+    def _created_page_data(self, create_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the page dict from a pages.create result.
+
+        Args:
+            create_result: The ``create`` object from the GraphQL response
+
+        Returns:
+            Raw page data of the created page
+
+        Raises:
+            APIError: If the server reported a failure or returned no page
+        """
+        response_result = create_result.get("responseResult", {})
+
+        if not response_result.get("succeeded"):
+            error_msg = response_result.get("message", "Unknown error")
+            raise APIError(f"Page creation failed: {error_msg}")
+
+        created_page_data: Optional[Dict[str, Any]] = create_result.get("page")
+        if not created_page_data:
+            raise APIError("Page creation failed - no page data returned")
+
+        return created_page_data
+
+    def _parse_create_result(self, create_result: Dict[str, Any]) -> Page:
+        """Convert a pages.create result into a Page object.
+
+        Args:
+            create_result: The ``create`` object from the GraphQL response
+
+        Returns:
+            Created Page object
+
+        Raises:
+            APIError: If the server reported a failure or returned bad data
+        """
+        created_page_data = self._created_page_data(create_result)
+
+        # Convert to Page object
+        try:
+            normalized_data = self._normalize_page_data(created_page_data)
+            return Page(**normalized_data)
+        except Exception as e:
+            raise APIError(f"Failed to parse created page data: {str(e)}") from e
+
+    def _to_page_update(
+        self, page_data: Union[PageUpdate, Dict[str, Any]]
+    ) -> PageUpdate:
+        """Coerce page update input to a PageUpdate object.
+
+        Args:
+            page_data: PageUpdate object or dict
+
+        Returns:
+            PageUpdate object
+
+        Raises:
+            ValidationError: If page data is invalid
+        """
+        if isinstance(page_data, dict):
+            try:
+                return PageUpdate(**page_data)
+            except Exception as e:
+                raise ValidationError(f"Invalid page data: {str(e)}") from e
+        if not isinstance(page_data, PageUpdate):
+            raise ValidationError("page_data must be PageUpdate object or dict")
+        return page_data
+
+    def _build_update_variables(
+        self, page_id: int, page_data: PageUpdate
+    ) -> Dict[str, Any]:
+        """Build updatePage mutation variables, skipping unset fields.
+
+        Args:
+            page_id: The page ID
+            page_data: Page update data
+
+        Returns:
+            GraphQL variables keyed by argument name
+        """
+        variables: Dict[str, Any] = {"id": page_id}
+
+        if page_data.title is not None:
+            variables["title"] = page_data.title
+        if page_data.content is not None:
+            variables["content"] = page_data.content
+        if page_data.description is not None:
+            variables["description"] = page_data.description
+        if page_data.is_published is not None:
+            variables["isPublished"] = page_data.is_published
+        if page_data.is_private is not None:
+            variables["isPrivate"] = page_data.is_private
+        if page_data.tags is not None:
+            variables["tags"] = page_data.tags
+
+        return variables
+
+    def _parse_update_result(self, updated_page_data: Optional[Dict[str, Any]]) -> Page:
+        """Convert an updatePage result into a Page object.
+
+        Args:
+            updated_page_data: The ``updatePage`` object from the GraphQL response
+
+        Returns:
+            Updated Page object
+
+        Raises:
+            APIError: If no data was returned or it could not be parsed
+        """
+        if not updated_page_data:
+            raise APIError("Page update failed - no data returned")
+
+        try:
+            normalized_data = self._normalize_page_data(updated_page_data)
+            return Page(**normalized_data)
+        except Exception as e:
+            raise APIError(f"Failed to parse updated page data: {str(e)}") from e
+
+    def _check_delete_result(self, delete_result: Optional[Dict[str, Any]]) -> None:
+        """Raise if a deletePage result does not report success.
+
+        Args:
+            delete_result: The ``deletePage`` object from the GraphQL response
+
+        Raises:
+            APIError: If the deletion failed
+        """
+        delete_result = delete_result or {}
+        if not delete_result.get("success", False):
+            message = delete_result.get("message", "Unknown error")
+            raise APIError(f"Page deletion failed: {message}")
+
+    def _build_batch_mutation(
+        self,
+        alias: str,
+        field: str,
+        arg_types: Dict[str, str],
+        batch_variables: List[Dict[str, Any]],
+        operation: str = "mutation",
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build one mutation document holding an aliased field per item.
+
+        Item ``i`` becomes ``{alias}{i}: <field>`` with its variables renamed
+        to ``$<name>{i}``, so a whole batch goes out as a single request.
+
+        Args:
+            alias: Alias prefix, e.g. ``"p"`` for ``p0``, ``p1``, ...
+            field: Field template with an ``{args}`` placeholder
+            arg_types: GraphQL type of every argument name
+            batch_variables: Per-item variables keyed by argument name
+            operation: GraphQL operation type (``"mutation"`` or ``"query"``)
+
+        Returns:
+            Tuple of (document, variables)
+        """
+        declarations = []
+        fields = []
+        variables: Dict[str, Any] = {}
+
+        for i, item_variables in enumerate(batch_variables):
+            arguments = []
+            for name, value in item_variables.items():
+                var_name = f"{name}{i}"
+                declarations.append(f"${var_name}: {arg_types[name]}")
+                arguments.append(f"{name}: ${var_name}")
+                variables[var_name] = value
+            fields.append(
+                f"{alias}{i}: " + field.replace("{args}", ", ".join(arguments))
+            )
+
+        mutation = (
+            f"{operation}({', '.join(declarations)}) {{\n"
+            + "\n".join(f"        {field}" for field in fields)
+            + "\n}"
+        )
+        return mutation, variables
+
+    def _post_batch(
+        self, mutation: str, variables: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Send a batch mutation and split its result by alias.
+
+        GraphQL reports a failing aliased field as ``null`` data plus an error
+        whose ``path`` starts with the alias, while the other fields still
+        succeed. Those errors are returned keyed by alias so callers can
+        report them per item.
+
+        Args:
+            mutation: Batch mutation document
+            variables: Batch variables
+
+        Returns:
+            Tuple of (response data keyed by alias, error message by alias)
+
+        Raises:
+            APIError: If the request failed without returning any data
+        """
+        try:
+            response = self._post(
+                "/graphql", json_data={"query": mutation, "variables": variables}
+            )
+            data = response.get("data") or {}
+            errors = response.get("errors") or []
+            if errors and not data:
+                raise APIError(f"GraphQL errors: {errors}")
+        except APIError as e:
+            data = e.details.get("data") or {}
+            errors = e.details.get("errors") or []
+            if not data:
+                raise
+
+        alias_errors = {}
+        for error in errors:
+            path = error.get("path") if isinstance(error, dict) else None
+            if path:
+                alias_errors[str(path[0])] = error.get("message", "Unknown error")
+
+        return data, alias_errors
+
+    def _get_batch(self, page_ids: List[int]) -> List[Union[Page, Exception]]:
+        """Fetch pages by ID with a single aliased ``pages.single`` query.
+
+        Args:
+            page_ids: IDs of the pages to fetch
+
+        Returns:
+            One Page per ID, or the exception explaining why it failed
+        """
+        query, variables = self._build_batch_mutation(
+            "p",
+            _GET_FIELD,
+            _GET_ARG_TYPES,
+            [{"id": page_id} for page_id in page_ids],
+            operation="query",
+        )
+
+        try:
+            data, alias_errors = self._post_batch(query, variables)
+        except Exception as e:
+            return [e for _ in page_ids]
+
+        failures: Dict[int, Exception] = {}
+        rows: Dict[int, Dict[str, Any]] = {}
+        for position, page_id in enumerate(page_ids):
+            alias = f"p{position}"
+            page_data = (data.get(alias) or {}).get("single")
+            if alias in alias_errors:
+                failures[position] = APIError(f"GraphQL errors: {alias_errors[alias]}")
+            elif not page_data:
+                failures[position] = APIError(f"Page with ID {page_id} not found")
+            else:
+                rows[position] = self._normalize_page_data(page_data)
+
+        validated = dict(zip(rows, self._validate_pages(list(rows.values()))))
+
+        results: List[Union[Page, Exception]] = []
+        for position, page_id in enumerate(page_ids):
+            page = validated.get(position)
+            if position in failures:
+                results.append(failures[position])
+            elif isinstance(page, Page):
+                if self._client.cache:
+                    cache_key = CacheKey("page", str(page_id), "get")
+                    self._client.cache.set(cache_key, page)
+                results.append(page)
+            else:
+                results.append(APIError(f"Failed to parse page data: {page}"))
+
+        return results
+
+    def _validate_pages(
+        self, rows: List[Dict[str, Any]]
+    ) -> List[Union[Page, Exception]]:
+        """Validate normalized page dicts, isolating the ones that fail.
+
+        All rows go through the shared TypeAdapter in a single call; only if
+        that fails are they validated one by one to find the bad rows.
+
+        Args:
+            rows: Page dicts already passed through ``_normalize_page_data``
+
+        Returns:
+            One Page per row, or the exception raised while validating it
+        """
+        try:
+            return list(_PAGES_ADAPTER.validate_python(rows))
+        except Exception:
+            results: List[Union[Page, Exception]] = []
+            for row in rows:
+                try:
+                    results.append(Page(**row))
+                except Exception as e:
+                    results.append(e)
+            return results
+
+    def _cached_pages(self, page_ids: List[int]) -> Dict[int, Page]:
+        """Look up pages in the client cache.
+
+        Args:
+            page_ids: IDs of the pages to look up
+
+        Returns:
+            Cached pages keyed by ID (empty if caching is disabled)
+        """
+        found: Dict[int, Page] = {}
+        if self._client.cache:
+            for page_id in page_ids:
+                cached = self._client.cache.get(CacheKey("page", str(page_id), "get"))
+                if cached is not None:
+                    found[page_id] = cached
+        return found
+
+    def _create_batch(
+        self, batch: List[Tuple[int, PageCreate]]
+    ) -> Tuple[List[Page], List[Dict[str, Any]]]:
+        """Create one batch of pages with a single aliased mutation request.
+
+        Args:
+            batch: (original index, PageCreate) pairs to create
+
+        Returns:
+            Tuple of (created pages, per-item error dicts)
+        """
+        mutation, variables = self._build_batch_mutation(
+            "p",
+            _CREATE_FIELD,
+            _CREATE_ARG_TYPES,
+            [self._build_create_variables(page_data) for _, page_data in batch],
+        )
+
+        try:
+            data, alias_errors = self._post_batch(mutation, variables)
+        except Exception as e:
+            # The request as a whole failed, so every page in it did too
+            return [], [
+                {"index": i, "data": page_data, "error": str(e)}
+                for i, page_data in batch
+            ]
+
+        errors = []
+        rows = []
+        row_items = []
+        for alias_index, (i, page_data) in enumerate(batch):
+            alias = f"p{alias_index}"
+            try:
+                if alias in alias_errors:
+                    raise APIError(f"Page creation failed: {alias_errors[alias]}")
+                create_result = (data.get(alias) or {}).get("create") or {}
+                created_page_data = self._created_page_data(create_result)
+                rows.append(self._normalize_page_data(created_page_data))
+                row_items.append((i, page_data))
+            except Exception as e:
+                errors.append({"index": i, "data": page_data, "error": str(e)})
+
+        created_pages = []
+        for (i, page_data), page in zip(row_items, self._validate_pages(rows)):
+            if isinstance(page, Exception):
+                error = f"Failed to parse created page data: {page}"
+                errors.append({"index": i, "data": page_data, "error": error})
+            else:
+                created_pages.append(page)
+
+        return created_pages, errors
+
+    def _update_batch(
+        self, batch: List[Tuple[int, int, PageUpdate]]
+    ) -> Tuple[List[Page], List[Dict[str, Any]]]:
+        """Update one batch of pages with a single aliased mutation request.
+
+        Args:
+            batch: (original index, page ID, PageUpdate) triples to apply
+
+        Returns:
+            Tuple of (updated pages, per-item error dicts)
+        """
+        mutation, variables = self._build_batch_mutation(
+            "u",
+            _UPDATE_FIELD,
+            _UPDATE_ARG_TYPES,
+            [
+                self._build_update_variables(page_id, page_data)
+                for _, page_id, page_data in batch
+            ],
+        )
+
+        try:
+            data, alias_errors = self._post_batch(mutation, variables)
+        except Exception as e:
+            return [], [
+                {"index": i, "data": page_data, "error": str(e)}
+                for i, _, page_data in batch
+            ]
+
+        updated_pages = []
+        updated_ids = []
+        errors = []
+        for alias_index, (i, page_id, page_data) in enumerate(batch):
+            alias = f"u{alias_index}"
+            try:
+                if alias in alias_errors:
+                    raise APIError(f"Failed to update page: {alias_errors[alias]}")
+                updated_pages.append(self._parse_update_result(data.get(alias)))
+                updated_ids.append(page_id)
+            except Exception as e:
+                errors.append({"index": i, "data": page_data, "error": str(e)})
+
+        # Invalidate the whole batch at once
+        if self._client.cache:
+            self._client.cache.invalidate_tags(
+                f"page:{page_id}" for page_id in updated_ids
+            )
+
+        return updated_pages, errors
+
+    def _delete_batch(self, page_ids: List[int]) -> List[Dict[str, Any]]:
+        """Delete one batch of pages with a single aliased mutation request.
+
+        Args:
+            page_ids: IDs of the pages to delete
+
+        Returns:
+            Per-page error dicts (empty if every deletion succeeded)
+        """
+        mutation, variables = self._build_batch_mutation(
+            "d",
+            _DELETE_FIELD,
+            _DELETE_ARG_TYPES,
+            [{"id": page_id} for page_id in page_ids],
+        )
+
+        try:
+            data, alias_errors = self._post_batch(mutation, variables)
+        except Exception as e:
+            return [{"page_id": page_id, "error": str(e)} for page_id in page_ids]
+
+        errors = []
+        deleted = []
+        for alias_index, page_id in enumerate(page_ids):
+            alias = f"d{alias_index}"
+            try:
+                if alias in alias_errors:
+                    raise APIError(f"Failed to delete page: {alias_errors[alias]}")
+                self._check_delete_result(data.get(alias))
+                deleted.append(page_id)
+            except Exception as e:
+                errors.append({"page_id": page_id, "error": str(e)})
+
+        # Invalidate the whole batch at once
+        if self._client.cache:
+            self._client.cache.invalidate_tags(f"page:{page_id}" for page_id in deleted)
+
+        return errors
+
+    def _fan_out(
+        self, func: Callable[..., Any], calls: List[Tuple[Any, ...]]
+    ) -> List[Any]:
+        """Run ``func(*args)`` for every call on a thread pool.
+
+        Args:
+            func: Function to call
+            calls: Positional argument tuples, one per call
+
+        Returns:
+            Results in call order; a failed call yields its exception
+        """
+
+        def run(args: Tuple[Any, ...]) -> Any:
+            try:
+                return func(*args)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_CONCURRENCY, len(calls))
+        ) as executor:
+            return list(executor.map(run, calls))
+
+    def _create_parallel(
+        self, batch: List[Tuple[int, PageCreate]]
+    ) -> Tuple[List[Page], List[Dict[str, Any]]]:
+        """Create one batch of pages with concurrent single-page requests.
+
+        Args:
+            batch: (original index, PageCreate) pairs to create
+
+        Returns:
+            Tuple of (created pages, per-item error dicts)
+        """
+        outcomes = self._fan_out(self.create, [(page_data,) for _, page_data in batch])
+
+        created_pages = []
+        errors = []
+        for (i, page_data), outcome in zip(batch, outcomes):
+            if isinstance(outcome, Exception):
+                errors.append({"index": i, "data": page_data, "error": str(outcome)})
+            else:
+                created_pages.append(outcome)
+
+        return created_pages, errors
+
+    def _update_parallel(
+        self, batch: List[Tuple[int, int, PageUpdate]]
+    ) -> Tuple[List[Page], List[Dict[str, Any]]]:
+        """Update one batch of pages with concurrent single-page requests.
+
+        Args:
+            batch: (original index, page ID, PageUpdate) triples to apply
+
+        Returns:
+            Tuple of (updated pages, per-item error dicts)
+        """
+        outcomes = self._fan_out(
+            self.update, [(page_id, page_data) for _, page_id, page_data in batch]
+        )
+
+        updated_pages = []
+        errors = []
+        for (i, _, page_data), outcome in zip(batch, outcomes):
+            if isinstance(outcome, Exception):
+                errors.append({"index": i, "data": page_data, "error": str(outcome)})
+            else:
+                updated_pages.append(outcome)
+
+        return updated_pages, errors
+
+    def _delete_parallel(self, page_ids: List[int]) -> List[Dict[str, Any]]:
+        """Delete one batch of pages with concurrent single-page requests.
+
+        Args:
+            page_ids: IDs of the pages to delete
+
+        Returns:
+            Per-page error dicts (empty if every deletion succeeded)
+        """
+        outcomes = self._fan_out(self.delete, [(page_id,) for page_id in page_ids])
+        return [
+            {"page_id": page_id, "error": str(outcome)}
+            for page_id, outcome in zip(page_ids, outcomes)
+            if isinstance(outcome, Exception)
+        ]
+
     def _normalize_page_data(self, page_data: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize page data from API response to model format.
 
@@ -648,46 +1213,22 @@ class PagesEndpoint(BaseEndpoint):
         Returns:
             Normalized data for Page model
         """
-        normalized = {}
-
         # Map API field names to model field names
-        field_mapping = {
-            "id": "id",
-            "path": "path",
-            "locale": "locale",
-            "title": "title",
-            "description": "description",
-            "contentType": "content_type",
-            "isPublished": "is_published",
-            "isPrivate": "is_private",
-            "privateNS": "private_ns",
-            "createdAt": "created_at",
-            "updatedAt": "updated_at",
-            "content": "content",
-            "tags": "tags",
-            "authorId": "author_id",
-            "authorName": "author_name",
-            "authorEmail": "author_email",
-            "editor": "editor"
+        normalized = {
+            model_field: page_data[api_field]
+            for api_field, model_field in _PAGE_FIELD_MAP.items()
+            if api_field in page_data
         }
 
-        for api_field, model_field in field_mapping.items():
-            if api_field in page_data:
-                normalized[model_field] = page_data[api_field]
-
         # Handle tags - convert from Wiki.js format
-        if "tags" in page_data:
-            if isinstance(page_data["tags"], list):
-                # Handle both formats: ["tag1", "tag2"] or [{"tag": "tag1"}]
-                tags = []
-                for tag in page_data["tags"]:
-                    if isinstance(tag, dict) and "tag" in tag:
-                        tags.append(tag["tag"])
-                    elif isinstance(tag, str):
-                        tags.append(tag)
-                normalized["tags"] = tags
-            else:
-                normalized["tags"] = []
+        # Handle both formats: ["tag1", "tag2"] or [{"tag": "tag1"}]
+        tags = page_data.get("tags")
+        if isinstance(tags, list):
+            normalized["tags"] = [
+                tag["tag"] if isinstance(tag, dict) else tag
+                for tag in tags
+                if isinstance(tag, str) or (isinstance(tag, dict) and "tag" in tag)
+            ]
         else:
             normalized["tags"] = []
 
@@ -752,16 +1293,68 @@ class PagesEndpoint(BaseEndpoint):
 
             offset += batch_size
 
+    def get_many(self, page_ids: List[int], batch_size: int = 50) -> List[Page]:
+        """Get multiple pages by ID.
+
+        Cached pages are returned directly; the rest are fetched with aliased
+        ``pages.single`` queries, ``batch_size`` pages per request, instead of
+        one request per page.
+
+        Args:
+            page_ids: List of page IDs
+            batch_size: Number of pages to fetch per request (default: 50)
+
+        Returns:
+            List of Page objects in the same order as ``page_ids``
+
+        Raises:
+            APIError: If any page is not found or its request fails
+            ValidationError: If page IDs or batch_size are invalid
+
+        Example:
+            >>> pages = client.pages.get_many([1, 2, 3])
+        """
+        if batch_size < 1:
+            raise ValidationError("batch_size must be greater than 0")
+
+        for page_id in page_ids:
+            if not isinstance(page_id, int) or page_id < 1:
+                raise ValidationError("page_id must be a positive integer")
+
+        found = self._cached_pages(page_ids)
+        missing = list(dict.fromkeys(i for i in page_ids if i not in found))
+        errors = []
+        for batch in ichunk_list(missing, batch_size):
+            for page_id, result in zip(batch, self._get_batch(batch)):
+                if isinstance(result, Exception):
+                    errors.append({"page_id": page_id, "error": str(result)})
+                else:
+                    found[page_id] = result
+
+        if errors:
+            error_msg = f"Failed to get {len(errors)}/{len(missing)} pages. "
+            error_msg += f"Errors: {errors}"
+            raise APIError(error_msg)
+
+        return [found[page_id] for page_id in page_ids]
+
     def create_many(
-        self, pages_data: List[Union[PageCreate, Dict[str, Any]]]
+        self,
+        pages_data: List[Union[PageCreate, Dict[str, Any]]],
+        batch_size: int = 50,
+        parallel: bool = False,
     ) -> List[Page]:
         """Create multiple pages in a single batch operation.
 
-        This method creates multiple pages efficiently by batching the operations.
-        It's faster than calling create() multiple times.
+        Pages are sent as aliased ``pages.create`` mutations, ``batch_size``
+        pages per GraphQL request, instead of one request per page. Servers
+        that reject multi-mutation documents can use ``parallel=True``, which
+        sends one request per page from a small thread pool instead.
 
         Args:
             pages_data: List of PageCreate objects or dicts
+            batch_size: Number of pages to create per request (default: 50)
+            parallel: Send concurrent single-page requests (default: False)
 
         Returns:
             List of created Page objects
@@ -782,17 +1375,30 @@ class PagesEndpoint(BaseEndpoint):
         if not pages_data:
             return []
 
-        created_pages = []
-        errors = []
+        if batch_size < 1:
+            raise ValidationError("batch_size must be greater than 0")
 
+        created_pages: List[Page] = []
+        errors: List[Dict[str, Any]] = []
+
+        # Validate inputs up front; invalid items are reported, not sent
+        valid = []
         for i, page_data in enumerate(pages_data):
             try:
-                page = self.create(page_data)
-                created_pages.append(page)
+                valid.append((i, self._to_page_create(page_data)))
             except Exception as e:
                 errors.append({"index": i, "data": page_data, "error": str(e)})
 
+        create_batch = self._create_parallel if parallel else self._create_batch
+        for batch in ichunk_list(valid, batch_size):
+            batch_pages, batch_errors = create_batch(batch)
+            created_pages.extend(batch_pages)
+            errors.extend(batch_errors)
+
         if errors:
+            # Parse failures are collected after request failures; report
+            # every error in input order
+            errors.sort(key=lambda error: error["index"])
             # Include partial success information
             error_msg = f"Failed to create {len(errors)}/{len(pages_data)} pages. "
             error_msg += f"Successfully created: {len(created_pages)}. Errors: {errors}"
@@ -801,14 +1407,22 @@ class PagesEndpoint(BaseEndpoint):
         return created_pages
 
     def update_many(
-        self, updates: List[Dict[str, Any]]
+        self,
+        updates: List[Dict[str, Any]],
+        batch_size: int = 50,
+        parallel: bool = False,
     ) -> List[Page]:
         """Update multiple pages in a single batch operation.
 
         Each update dict must contain an 'id' field and the fields to update.
+        Updates are sent as aliased ``updatePage`` mutations, ``batch_size``
+        pages per GraphQL request, or as concurrent single-page requests
+        with ``parallel=True``.
 
         Args:
             updates: List of dicts with 'id' and update fields
+            batch_size: Number of pages to update per request (default: 50)
+            parallel: Send concurrent single-page requests (default: False)
 
         Returns:
             List of updated Page objects
@@ -829,35 +1443,58 @@ class PagesEndpoint(BaseEndpoint):
         if not updates:
             return []
 
-        updated_pages = []
-        errors = []
+        if batch_size < 1:
+            raise ValidationError("batch_size must be greater than 0")
 
+        updated_pages: List[Page] = []
+        errors: List[Dict[str, Any]] = []
+
+        # Validate every update before sending anything
+        valid = []
         for i, update_data in enumerate(updates):
             try:
                 if "id" not in update_data:
                     raise ValidationError("Each update must have an 'id' field")
 
                 page_id = update_data["id"]
+                if not isinstance(page_id, int) or page_id < 1:
+                    raise ValidationError("page_id must be a positive integer")
+
                 # Remove id from update data
                 update_fields = {k: v for k, v in update_data.items() if k != "id"}
-
-                page = self.update(page_id, update_fields)
-                updated_pages.append(page)
+                valid.append((i, page_id, self._to_page_update(update_fields)))
             except Exception as e:
                 errors.append({"index": i, "data": update_data, "error": str(e)})
 
+        update_batch = self._update_parallel if parallel else self._update_batch
+        for batch in ichunk_list(valid, batch_size):
+            batch_pages, batch_errors = update_batch(batch)
+            updated_pages.extend(batch_pages)
+            errors.extend(batch_errors)
+
         if errors:
+            # Validation failures are collected before request failures;
+            # report every error in input order
+            errors.sort(key=lambda error: error["index"])
             error_msg = f"Failed to update {len(errors)}/{len(updates)} pages. "
             error_msg += f"Successfully updated: {len(updated_pages)}. Errors: {errors}"
             raise APIError(error_msg)
 
         return updated_pages
 
-    def delete_many(self, page_ids: List[int]) -> Dict[str, Any]:
+    def delete_many(
+        self, page_ids: List[int], batch_size: int = 50, parallel: bool = False
+    ) -> Dict[str, Any]:
         """Delete multiple pages in a single batch operation.
 
+        Deletions are sent as aliased ``deletePage`` mutations, ``batch_size``
+        pages per GraphQL request, or as concurrent single-page requests
+        with ``parallel=True``.
+
         Args:
             page_ids: List of page IDs to delete
+            batch_size: Number of pages to delete per request (default: 50)
+            parallel: Send concurrent single-page requests (default: False)
 
         Returns:
             Dict with success count and any errors
@@ -875,16 +1512,24 @@ class PagesEndpoint(BaseEndpoint):
         if not page_ids:
             return {"successful": 0, "failed": 0, "errors": []}
 
-        successful = 0
-        errors = []
+        if batch_size < 1:
+            raise ValidationError("batch_size must be greater than 0")
 
+        errors = []
+        valid_ids = []
         for page_id in page_ids:
-            try:
-                self.delete(page_id)
-                successful += 1
-            except Exception as e:
-                errors.append({"page_id": page_id, "error": str(e)})
+            if isinstance(page_id, int) and page_id >= 1:
+                valid_ids.append(page_id)
+            else:
+                errors.append(
+                    {"page_id": page_id, "error": "page_id must be a positive integer"}
+                )
+
+        delete_batch = self._delete_parallel if parallel else self._delete_batch
+        for batch in ichunk_list(valid_ids, batch_size):
+            errors.extend(delete_batch(batch))
 
+        successful = len(page_ids) - len(errors)
         result = {
             "successful": successful,
             "failed": len(errors),
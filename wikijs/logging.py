@@ -4,10 +4,30 @@ import json
 import sys
 from typing import Any, Dict, Optional
 from datetime import datetime
+from json.encoder import encode_basestring_ascii as _quote
+
+from .utils.helpers import orjson
 
 
 class JSONFormatter(logging.Formatter):
-    """JSON formatter for structured logging."""
+    """JSON formatter for structured logging.
+
+    Output matches ``json.dumps`` of the record fields. With
+    ``use_orjson=True`` and orjson installed, records are encoded with
+    orjson instead, which is faster but writes compact JSON and leaves
+    non-ASCII text unescaped.
+    """
+
+    def __init__(self, *args: Any, use_orjson: bool = False, **kwargs: Any):
+        """Initialize formatter.
+
+        Args:
+            *args: Positional arguments for logging.Formatter
+            use_orjson: Encode with orjson when it is installed
+            **kwargs: Keyword arguments for logging.Formatter
+        """
+        super().__init__(*args, **kwargs)
+        self._orjson = orjson if use_orjson else None
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON.
@@ -18,8 +38,25 @@ class JSONFormatter(logging.Formatter):
         Returns:
             JSON formatted log string
         """
+        now = datetime.utcnow()
+        encoder = self._orjson
+
+        # Common case without orjson: only the fixed fields, written
+        # directly in the form json.dumps would produce, without building
+        # a dict first
+        if encoder is None and not record.exc_info and not hasattr(record, "extra"):
+            function = "null" if record.funcName is None else _quote(record.funcName)
+            return (
+                f'{{"timestamp": "{now.isoformat()}", "level": {_quote(record.levelname)}, '
+                f'"logger": {_quote(record.name)}, '
+                f'"message": {_quote(record.getMessage())}, '
+                f'"module": {_quote(record.module)}, "function": {function}, '
+                f'"line": {record.lineno:d}}}'
+            )
+
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat(),
+            # orjson formats datetimes itself, faster than isoformat()
+            "timestamp": now if encoder is not None else now.isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -36,13 +73,20 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "extra"):
             log_data.update(record.extra)
 
+        if encoder is not None:
+            # orjson always writes compact JSON, without spaces after separators
+            output: str = encoder.dumps(
+                log_data, option=encoder.OPT_NON_STR_KEYS
+            ).decode()
+            return output
         return json.dumps(log_data)
 
 
 def setup_logging(
     level: int = logging.INFO,
     format_type: str = "json",
-    output_file: Optional[str] = None
+    output_file: Optional[str] = None,
+    use_orjson: bool = False
 ) -> logging.Logger:
     """Setup logging configuration.
 
@@ -50,6 +94,7 @@ def setup_logging(
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         format_type: "json" or "text"
         output_file: Optional file path for log output
+        use_orjson: Encode JSON logs with orjson when it is installed
 
     Returns:
         Configured logger
@@ -68,7 +113,7 @@ def setup_logging(
 
     # Set formatter
     if format_type == "json":
-        formatter = JSONFormatter()
+        formatter = JSONFormatter(use_orjson=use_orjson)
     else:
         formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
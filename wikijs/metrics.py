@@ -1,10 +1,13 @@
 """Metrics and telemetry for wikijs-python-sdk."""
 import time
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
-from collections import defaultdict
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional
+from collections import defaultdict, deque
 import threading
 
+# Most recent requests kept for latency statistics
+_MAX_LATENCY_SAMPLES = 4096
+
 
 @dataclass
 class RequestMetrics:
@@ -20,13 +23,32 @@ class RequestMetrics:
 class MetricsCollector:
     """Collect and aggregate metrics."""
 
+    __slots__ = (
+        "_lock",
+        "_requests",
+        "_total_requests",
+        "_total_errors",
+        "_total_server_errors",
+        "_counters",
+        "_gauges",
+        "_histograms",
+    )
+
     def __init__(self):
         """Initialize metrics collector."""
         self._lock = threading.Lock()
-        self._requests: List[RequestMetrics] = []
+        # Bounded, so long-running clients do not grow without limit
+        self._requests: Deque[RequestMetrics] = deque(maxlen=_MAX_LATENCY_SAMPLES)
+        # Built-in request counters are plain attributes, updated on every
+        # request; custom counters from increment() live in _counters
+        self._total_requests = 0
+        self._total_errors = 0
+        self._total_server_errors = 0
         self._counters: Dict[str, int] = defaultdict(int)
         self._gauges: Dict[str, float] = {}
-        self._histograms: Dict[str, List[float]] = defaultdict(list)
+        self._histograms: Dict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=_MAX_LATENCY_SAMPLES)
+        )
 
     def record_request(
         self,
@@ -57,11 +79,11 @@ class MetricsCollector:
             self._requests.append(metric)
 
             # Update counters
-            self._counters["total_requests"] += 1
+            self._total_requests += 1
             if status_code >= 400:
-                self._counters["total_errors"] += 1
+                self._total_errors += 1
             if status_code >= 500:
-                self._counters["total_server_errors"] += 1
+                self._total_server_errors += 1
 
             # Update histograms
             self._histograms[f"{method}_{endpoint}"].append(duration_ms)
@@ -93,25 +115,25 @@ class MetricsCollector:
             Dictionary of aggregated statistics
         """
         with self._lock:
-            total = self._counters.get("total_requests", 0)
-            errors = self._counters.get("total_errors", 0)
+            counters = self._get_counters()
+            total = counters.get("total_requests", 0)
+            errors = counters.get("total_errors", 0)
 
             stats = {
                 "total_requests": total,
                 "total_errors": errors,
                 "error_rate": (errors / total * 100) if total > 0 else 0,
-                "counters": dict(self._counters),
+                "counters": counters,
                 "gauges": dict(self._gauges),
             }
 
-            # Calculate percentiles for latency
+            # Calculate percentiles for latency over the recent samples
             if self._requests:
-                durations = [r.duration_ms for r in self._requests]
-                durations.sort()
+                durations = sorted(r.duration_ms for r in self._requests)
 
                 stats["latency"] = {
-                    "min": min(durations),
-                    "max": max(durations),
+                    "min": durations[0],
+                    "max": durations[-1],
                     "avg": sum(durations) / len(durations),
                     "p50": self._percentile(durations, 50),
                     "p95": self._percentile(durations, 95),
@@ -120,6 +142,22 @@ class MetricsCollector:
 
             return stats
 
+    def _get_counters(self) -> Dict[str, int]:
+        """Merge built-in and custom counters. Must be called with the lock held.
+
+        Returns:
+            Counter values by name; built-in counters appear once non-zero
+        """
+        counters = dict(self._counters)
+        for name, value in (
+            ("total_requests", self._total_requests),
+            ("total_errors", self._total_errors),
+            ("total_server_errors", self._total_server_errors),
+        ):
+            if value:
+                counters[name] = counters.get(name, 0) + value
+        return counters
+
     @staticmethod
     def _percentile(data: List[float], percentile: int) -> float:
         """Calculate percentile.
@@ -140,6 +178,9 @@ class MetricsCollector:
         """Reset all metrics."""
         with self._lock:
             self._requests.clear()
+            self._total_requests = 0
+            self._total_errors = 0
+            self._total_server_errors = 0
             self._counters.clear()
             self._gauges.clear()
             self._histograms.clear()
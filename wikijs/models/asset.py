@@ -176,12 +176,13 @@ class FolderCreate(BaseModel):
     @classmethod
     def validate_slug(cls, v: str) -> str:
         """Validate slug."""
-        if not v or not v.strip():
+        stripped = v.strip()
+        if not stripped:
             raise ValueError("Slug cannot be empty")
         # Remove leading/trailing slashes
-        v = v.strip().strip("/")
-        if not v:
+        slug = stripped.strip("/")
+        if not slug:
             raise ValueError("Slug cannot be just slashes")
-        return v
+        return slug
 
     model_config = ConfigDict(populate_by_name=True)
@@ -1,11 +1,21 @@
 """Base model functionality for py-wikijs."""
 
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Optional, Union, get_args, get_origin
 
 from pydantic import BaseModel as PydanticBaseModel
 from pydantic import ConfigDict, field_serializer
 
+# Field types that model_dump() returns unchanged.
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+
+
+def _is_plain(annotation: Any) -> bool:
+    """Check whether a field annotation is a scalar or an Optional scalar."""
+    if get_origin(annotation) is Union:
+        return all(_is_plain(arg) for arg in get_args(annotation))
+    return annotation in _PLAIN_TYPES
+
 
 class BaseModel(PydanticBaseModel):
     """Base model with common functionality for all data models.
@@ -28,6 +38,24 @@ class BaseModel(PydanticBaseModel):
         extra="ignore",
     )
 
+    # Set per subclass: True when to_dict() can copy __dict__ directly.
+    _plain_dump: ClassVar[bool] = False
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Decide once per class whether to_dict() may skip model_dump()."""
+        super().__pydantic_init_subclass__(**kwargs)
+        decorators = cls.__pydantic_decorators__
+        cls._plain_dump = (
+            not decorators.field_serializers
+            and not decorators.model_serializers
+            and not cls.model_computed_fields
+            and all(
+                field.alias is None and _is_plain(field.annotation)
+                for field in cls.model_fields.values()
+            )
+        )
+
     def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
         """Convert model to dictionary.
 
@@ -37,6 +65,10 @@ class BaseModel(PydanticBaseModel):
         Returns:
             Dictionary representation of the model
         """
+        if self._plain_dump:
+            if exclude_none:
+                return {k: v for k, v in self.__dict__.items() if v is not None}
+            return dict(self.__dict__)
         return self.model_dump(exclude_none=exclude_none, by_alias=True)
 
     def to_json(self, exclude_none: bool = True) -> str:
@@ -81,10 +113,13 @@ class TimestampedModel(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    @field_serializer('created_at', 'updated_at')
-    def serialize_datetime(self, value: Optional[datetime]) -> Optional[str]:
+    # None is serialized natively, so the callback only runs for datetimes.
+    # isoformat() is kept over pydantic's own JSON datetime encoding, which
+    # would write UTC offsets as "Z" instead of "+00:00".
+    @field_serializer("created_at", "updated_at", when_used="unless-none")
+    def serialize_datetime(self, value: datetime) -> str:
         """Serialize datetime to ISO format."""
-        return value.isoformat() if value else None
+        return value.isoformat()
 
     @property
     def is_new(self) -> bool:
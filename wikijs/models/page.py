@@ -7,6 +7,12 @@ from pydantic import Field, field_validator
 
 from .base import BaseModel, TimestampedModel
 
+# Allowed page path characters (letters, numbers, hyphens, underscores, slashes)
+_PATH_RE = re.compile(r"^[a-zA-Z0-9\-_/]+$")
+
+# Leading "#" markers of a markdown heading line
+_HEADING_MARKER_RE = re.compile(r"^#+\s*")
+
 
 class Page(TimestampedModel):
     """Represents a Wiki.js page.
@@ -48,7 +54,7 @@ class Page(TimestampedModel):
         v = v.strip("/")
 
         # Check for valid characters (letters, numbers, hyphens, underscores, slashes)
-        if not re.match(r"^[a-zA-Z0-9\-_/]+$", v):
+        if not _PATH_RE.match(v):
             raise ValueError("Path contains invalid characters")
 
         return v
@@ -100,7 +106,7 @@ class Page(TimestampedModel):
             line = line.strip()
             if line.startswith("#"):
                 # Remove # markers and whitespace
-                heading = re.sub(r"^#+\s*", "", line).strip()
+                heading = _HEADING_MARKER_RE.sub("", line).strip()
                 if heading:
                     headings.append(heading)
 
@@ -115,7 +121,10 @@ class Page(TimestampedModel):
         Returns:
             True if page has the tag
         """
-        return tag.lower() in [t.lower() for t in self.tags]
+        # Tags can be reassigned or mutated in place, so nothing is cached;
+        # the scan stops at the first match without building a list
+        tag = tag.lower()
+        return any(t.lower() == tag for t in self.tags)
 
 
 class PageCreate(BaseModel):
@@ -145,7 +154,7 @@ class PageCreate(BaseModel):
         v = v.strip("/")
 
         # Check for valid characters
-        if not re.match(r"^[a-zA-Z0-9\-_/]+$", v):
+        if not _PATH_RE.match(v):
             raise ValueError("Path contains invalid characters")
 
         return v
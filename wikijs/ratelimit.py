@@ -1,7 +1,7 @@
 """Rate limiting for wikijs-python-sdk."""
 import time
 import threading
-from typing import Optional, Dict
+from typing import Callable, Optional, Dict
 
 
 class RateLimiter:
@@ -10,18 +10,24 @@ class RateLimiter:
     def __init__(
         self,
         requests_per_second: float = 10.0,
-        burst: Optional[int] = None
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
     ):
         """Initialize rate limiter.
 
         Args:
             requests_per_second: Maximum requests per second
             burst: Maximum burst size (defaults to requests_per_second)
+            clock: Monotonic time source in seconds
+            sleep: Function used to wait for tokens
         """
         self.rate = requests_per_second
         self.burst = burst or int(requests_per_second)
+        self._clock = clock
+        self._sleep = sleep
         self._tokens = float(self.burst)
-        self._last_update = time.time()
+        self._last_update = clock()
         self._lock = threading.Lock()
 
     def acquire(self, timeout: Optional[float] = None) -> bool:
@@ -33,11 +39,11 @@ class RateLimiter:
         Returns:
             True if acquired, False if timeout
         """
-        deadline = time.time() + timeout if timeout else None
+        deadline = self._clock() + timeout if timeout else None
 
         while True:
             with self._lock:
-                now = time.time()
+                now = self._clock()
 
                 # Refill tokens based on elapsed time
                 elapsed = now - self._last_update
@@ -56,17 +62,17 @@ class RateLimiter:
                 wait_time = (1.0 - self._tokens) / self.rate
 
             # Check timeout
-            if deadline and time.time() + wait_time > deadline:
+            if deadline and self._clock() + wait_time > deadline:
                 return False
 
             # Sleep and retry
-            time.sleep(min(wait_time, 0.1))
+            self._sleep(min(wait_time, 0.1))
 
     def reset(self) -> None:
         """Reset rate limiter."""
         with self._lock:
             self._tokens = float(self.burst)
-            self._last_update = time.time()
+            self._last_update = self._clock()
 
 
 class PerEndpointRateLimiter:
@@ -3,7 +3,11 @@
 from .helpers import (
     build_api_url,
     chunk_list,
+    clear_url_caches,
+    dump_json,
     extract_error_message,
+    ichunk_list,
+    load_json,
     normalize_url,
     parse_wiki_response,
     safe_get,
@@ -15,9 +19,13 @@ __all__ = [
     "normalize_url",
     "sanitize_path",
     "validate_url",
+    "clear_url_caches",
     "build_api_url",
     "parse_wiki_response",
     "extract_error_message",
     "chunk_list",
+    "ichunk_list",
+    "dump_json",
+    "load_json",
     "safe_get",
 ]
@@ -1,12 +1,39 @@
 """Helper utilities for py-wikijs."""
 
+import json
 import re
-from typing import Any, Dict
+from functools import lru_cache
+from itertools import islice
+from types import ModuleType
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
 from urllib.parse import urljoin, urlparse
 
 from ..exceptions import APIError, ValidationError
 
 
+def _import_orjson() -> Optional[ModuleType]:
+    """Import the optional orjson module, or return None if unavailable."""
+    try:
+        import orjson
+    except ImportError:  # pragma: no cover - optional speedup
+        return None
+    return orjson
+
+
+# Optional faster JSON backend (``pip install py-wikijs[fast]``), shared by
+# load_json and wikijs.logging
+orjson = _import_orjson()
+
+# Sentinel telling missing keys apart from stored None values
+_MISSING = object()
+
+# sanitize_path patterns, compiled once
+_WHITESPACE_RE = re.compile(r"\s+")
+_INVALID_PATH_CHARS_RE = re.compile(r"[^a-zA-Z0-9\-_/]")
+# Keeps the first character of each run of hyphens/slashes
+_SEPARATOR_RUN_RE = re.compile(r"([-/])[-/]*")
+
+
 def normalize_url(base_url: str) -> str:
     """Normalize a base URL for API usage.
 
@@ -22,6 +49,12 @@ def normalize_url(base_url: str) -> str:
     if not base_url:
         raise ValidationError("Base URL cannot be empty")
 
+    return _normalize_url(base_url)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_url(base_url: str) -> str:
+    """Normalize a non-empty base URL; failures raise and are not cached."""
     # Add https:// if no scheme provided
     if not base_url.startswith(("http://", "https://")):
         base_url = f"https://{base_url}"
@@ -43,20 +76,37 @@ def validate_url(url: str) -> bool:
     Returns:
         True if URL is valid
     """
-    try:
-        result = urlparse(url)
-        # Check basic components exist
-        if not all([result.scheme, result.netloc]):
-            return False
+    if not url or not isinstance(url, str):
+        return False
 
-        # Check for invalid characters (spaces, etc.)
-        if " " in url:
-            return False
+    return _validate_url(url)
 
-        return True
+
+@lru_cache(maxsize=2048)
+def _validate_url(url: str) -> bool:
+    """Validate a non-empty URL string."""
+    # Check for invalid characters (spaces, etc.) before parsing
+    if " " in url:
+        return False
+
+    try:
+        result = urlparse(url)
     except Exception:
         return False
 
+    # Check basic components exist
+    return bool(result.scheme and result.netloc)
+
+
+def clear_url_caches() -> None:
+    """Clear the memoized results of normalize_url, validate_url and build_api_url.
+
+    Needed after patching anything those functions depend on, e.g. in tests.
+    """
+    _normalize_url.cache_clear()
+    _validate_url.cache_clear()
+    build_api_url.cache_clear()
+
 
 def sanitize_path(path: str) -> str:
     """Sanitize a wiki page path.
@@ -77,13 +127,13 @@ def sanitize_path(path: str) -> str:
     path = path.strip().strip("/")
 
     # Replace spaces with hyphens
-    path = re.sub(r"\s+", "-", path)
+    path = _WHITESPACE_RE.sub("-", path)
 
     # Remove invalid characters, keep only alphanumeric, hyphens, underscores, slashes
-    path = re.sub(r"[^a-zA-Z0-9\-_/]", "", path)
+    path = _INVALID_PATH_CHARS_RE.sub("", path)
 
     # Remove multiple consecutive hyphens or slashes
-    path = re.sub(r"[-/]+", lambda m: m.group(0)[0], path)
+    path = _SEPARATOR_RUN_RE.sub(r"\1", path)
 
     if not path:
         raise ValidationError("Path contains no valid characters")
@@ -91,9 +141,13 @@ def sanitize_path(path: str) -> str:
     return path
 
 
+@lru_cache(maxsize=64)
 def build_api_url(base_url: str, endpoint: str) -> str:
     """Build full API URL from base URL and endpoint.
 
+    Results are memoized: a client uses one base URL and a handful of
+    endpoints, so each URL is joined only once.
+
     Args:
         base_url: Base URL (already normalized)
         endpoint: API endpoint path
@@ -127,8 +181,8 @@ def parse_wiki_response(response_data: Any) -> Any:
         return response_data
 
     # Check for error indicators
-    if "error" in response_data:
-        error_info = response_data["error"]
+    error_info = response_data.get("error", _MISSING)
+    if error_info is not _MISSING:
         if isinstance(error_info, dict):
             message = error_info.get("message", "Unknown API error")
             code = error_info.get("code")
@@ -139,16 +193,19 @@ def parse_wiki_response(response_data: Any) -> Any:
         raise APIError(f"API Error: {message}", details={"code": code})
 
     # Handle GraphQL-style errors
-    if "errors" in response_data:
-        errors = response_data["errors"]
-        if errors:
-            first_error = errors[0] if isinstance(errors, list) else errors
-            message = (
-                first_error.get("message", "GraphQL error")
-                if isinstance(first_error, dict)
-                else str(first_error)
-            )
-            raise APIError(f"GraphQL Error: {message}", details={"errors": errors})
+    errors = response_data.get("errors")
+    if errors:
+        first_error = errors[0] if isinstance(errors, list) else errors
+        message = (
+            first_error.get("message", "GraphQL error")
+            if isinstance(first_error, dict)
+            else str(first_error)
+        )
+        # Keep any partial data so callers can salvage fields that resolved
+        raise APIError(
+            f"GraphQL Error: {message}",
+            details={"errors": errors, "data": response_data.get("data")},
+        )
 
     return response_data
 
@@ -162,7 +219,12 @@ def extract_error_message(response: Any) -> str:
     Returns:
         Error message string
     """
-    if hasattr(response, "json"):
+    text = getattr(response, "text", None)
+    # Skip the parse (and the exception it raises) for bodies that cannot
+    # be a JSON object, such as empty or HTML error pages
+    maybe_json = not isinstance(text, str) or text.lstrip()[:1] in ("{", "[")
+
+    if maybe_json and hasattr(response, "json"):
         try:
             data = response.json()
             if isinstance(data, dict):
@@ -174,12 +236,47 @@ def extract_error_message(response: Any) -> str:
             pass
 
     if hasattr(response, "text"):
-        text = str(response.text)
+        text = str(text)
         return text[:200] + "..." if len(text) > 200 else text
 
     return str(response)
 
 
+def dump_json(data: Any) -> str:
+    """Serialize a request body to compact JSON.
+
+    Drops the whitespace the stdlib emits after separators and keeps
+    non-ASCII text as-is, which keeps large batch documents small.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Compact JSON string
+    """
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+
+
+def load_json(data: Union[bytes, str]) -> Any:
+    """Parse a JSON response body.
+
+    Uses ``orjson`` when it is installed (``pip install py-wikijs[fast]``),
+    falling back to the stdlib parser.
+
+    Args:
+        data: Raw JSON text or bytes
+
+    Returns:
+        Parsed data
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def chunk_list(items: list, chunk_size: int) -> list:
     """Split list into chunks of specified size.
 
@@ -196,6 +293,42 @@ def chunk_list(items: list, chunk_size: int) -> list:
     return [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
 
 
+def ichunk_list(items: Iterable[Any], chunk_size: int) -> Iterator[list]:
+    """Lazily split an iterable into lists of specified size.
+
+    Unlike chunk_list, only one chunk is held in memory at a time and any
+    iterable (e.g. a generator) is accepted.
+
+    Args:
+        items: Iterable to chunk
+        chunk_size: Size of each chunk
+
+    Returns:
+        Iterator over chunks
+
+    Raises:
+        ValueError: If chunk_size is not positive
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+
+    return _ichunk(iter(items), chunk_size)
+
+
+def _ichunk(it: Iterator[Any], chunk_size: int) -> Iterator[list]:
+    """Yield chunks from an iterator; validation happens in ichunk_list."""
+    chunk = list(islice(it, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(it, chunk_size))
+
+
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dotted safe_get key; callers reuse a small set of paths."""
+    return tuple(key.split("."))
+
+
 def safe_get(data: Dict[str, Any], key: str, default: Any = None) -> Any:
     """Safely get value from dictionary with dot notation support.
 
@@ -210,13 +343,12 @@ def safe_get(data: Dict[str, Any], key: str, default: Any = None) -> Any:
     if "." not in key:
         return data.get(key, default)
 
-    keys = key.split(".")
-    current = data
-
-    for k in keys:
-        if isinstance(current, dict) and k in current:
-            current = current[k]
-        else:
+    current: Any = data
+    for k in _split_key(key):
+        if not isinstance(current, dict):
+            return default
+        current = current.get(k, _MISSING)
+        if current is _MISSING:
             return default
 
     return current